@@ -4,19 +4,34 @@ Database connection and management for Tender Scraper System.
 Provides SQLite database operations with context manager support.
 """
 
+import hashlib
 import logging
+import operator
 import sqlite3
+import threading
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Generator, List, Optional, Tuple
+from typing import Any, Dict, Generator, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
-# Database schema
-SCHEMA = """
--- Tenders table: stores all scraped tender data
-CREATE TABLE IF NOT EXISTS tenders (
+
+def _convert_timestamp(value: bytes) -> datetime:
+    """Convert a stored ISO timestamp (any fraction precision) to datetime."""
+    return datetime.fromisoformat(value.decode())
+
+
+# Replaces sqlite3's deprecated default "timestamp" converter
+sqlite3.register_converter("timestamp", _convert_timestamp)
+
+# Bump whenever SCHEMA or MIGRATIONS change so initialize() re-applies them
+SCHEMA_VERSION = 3
+
+# Tenders table: stores all scraped tender data ({table} is "tenders" except
+# while _rebuild_tenders_table copies a legacy table)
+_TENDERS_TABLE = """
+CREATE TABLE IF NOT EXISTS {table} (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     portal TEXT NOT NULL,
     suchbegriff TEXT,
@@ -33,9 +48,12 @@ CREATE TABLE IF NOT EXISTS tenders (
     email_sent_at TEXT,
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-    UNIQUE(portal, vergabe_id, link, titel)
+    dedup_hash BLOB
 );
+"""
 
+# Database schema
+SCHEMA = _TENDERS_TABLE.format(table="tenders") + """
 -- Scrape history table: tracks each scraping run
 CREATE TABLE IF NOT EXISTS scrape_history (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -61,13 +79,94 @@ CREATE TABLE IF NOT EXISTS email_history (
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Per-portal daily tender counts, maintained by triggers on tenders
+CREATE TABLE IF NOT EXISTS portal_day_stats (
+    portal TEXT NOT NULL,
+    day TEXT NOT NULL,
+    tender_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (portal, day)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS portal_day_stats_ai AFTER INSERT ON tenders BEGIN
+    INSERT INTO portal_day_stats(portal, day, tender_count)
+    VALUES (new.portal, DATE(new.created_at), 1)
+    ON CONFLICT(portal, day) DO UPDATE SET tender_count = tender_count + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS portal_day_stats_ad AFTER DELETE ON tenders BEGIN
+    UPDATE portal_day_stats SET tender_count = tender_count - 1
+    WHERE portal = old.portal AND day = DATE(old.created_at);
+    DELETE FROM portal_day_stats
+    WHERE portal = old.portal AND day = DATE(old.created_at) AND tender_count <= 0;
+END;
+
 -- Indexes for performance
-CREATE INDEX IF NOT EXISTS idx_tenders_portal ON tenders(portal);
-CREATE INDEX IF NOT EXISTS idx_tenders_created_at ON tenders(created_at);
+-- Ordered to match the WHERE ... ORDER BY ... DESC of the queries so no
+-- temp B-tree sort is needed
+CREATE INDEX IF NOT EXISTS idx_tenders_portal_created ON tenders(portal, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_tenders_created_desc ON tenders(created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_tenders_suchzeitpunkt ON tenders(suchzeitpunkt);
-CREATE INDEX IF NOT EXISTS idx_scrape_history_portal ON scrape_history(portal);
+-- NOCASE collation lets anchored LIKE 'term%' run as an index range scan
+CREATE INDEX IF NOT EXISTS idx_tenders_titel_nocase ON tenders(titel COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_tenders_email_sent ON tenders(email_sent);
+-- Deduplication key: INSERT OR IGNORE relies on this index
+CREATE UNIQUE INDEX IF NOT EXISTS idx_tenders_dedup ON tenders(dedup_hash);
+CREATE INDEX IF NOT EXISTS idx_scrape_portal_start ON scrape_history(portal, scrape_start DESC);
 CREATE INDEX IF NOT EXISTS idx_scrape_history_start ON scrape_history(scrape_start);
-CREATE INDEX IF NOT EXISTS idx_email_history_sent ON email_history(sent_at);
+CREATE INDEX IF NOT EXISTS idx_email_sent_desc ON email_history(sent_at DESC);
+
+-- Superseded by the composite/descending indexes above
+DROP INDEX IF EXISTS idx_tenders_portal;
+DROP INDEX IF EXISTS idx_tenders_created_at;
+DROP INDEX IF EXISTS idx_scrape_history_portal;
+DROP INDEX IF EXISTS idx_email_history_sent;
+CREATE INDEX IF NOT EXISTS idx_email_history_status_sent ON email_history(status, sent_at);
+"""
+
+# FTS5's trigram tokenizer needs SQLite 3.34+; older builds search with LIKE
+FTS_AVAILABLE = sqlite3.sqlite_version_info >= (3, 34, 0)
+
+# Full-text index, created alongside SCHEMA when FTS_AVAILABLE
+FTS_SCHEMA = """
+-- Full-text index over tenders (external content, kept in sync by triggers)
+-- The trigram tokenizer preserves the substring semantics of LIKE '%term%'
+CREATE VIRTUAL TABLE IF NOT EXISTS tenders_fts USING fts5(
+    titel,
+    ausschreibungsstelle,
+    suchbegriff,
+    content='tenders',
+    content_rowid='id',
+    tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS tenders_fts_ai AFTER INSERT ON tenders BEGIN
+    INSERT INTO tenders_fts(rowid, titel, ausschreibungsstelle, suchbegriff)
+    VALUES (new.id, new.titel, new.ausschreibungsstelle, new.suchbegriff);
+END;
+
+CREATE TRIGGER IF NOT EXISTS tenders_fts_ad AFTER DELETE ON tenders BEGIN
+    INSERT INTO tenders_fts(tenders_fts, rowid, titel, ausschreibungsstelle, suchbegriff)
+    VALUES ('delete', old.id, old.titel, old.ausschreibungsstelle, old.suchbegriff);
+END;
+
+CREATE TRIGGER IF NOT EXISTS tenders_fts_au
+AFTER UPDATE OF titel, ausschreibungsstelle, suchbegriff ON tenders BEGIN
+    INSERT INTO tenders_fts(tenders_fts, rowid, titel, ausschreibungsstelle, suchbegriff)
+    VALUES ('delete', old.id, old.titel, old.ausschreibungsstelle, old.suchbegriff);
+    INSERT INTO tenders_fts(rowid, titel, ausschreibungsstelle, suchbegriff)
+    VALUES (new.id, new.titel, new.ausschreibungsstelle, new.suchbegriff);
+END;
+"""
+
+# Connection tuning applied on every new connection
+PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-64000;
+PRAGMA mmap_size=268435456;
+PRAGMA busy_timeout=5000;
+PRAGMA foreign_keys=ON;
 """
 
 # Migration queries for existing databases
@@ -84,9 +183,271 @@ MIGRATIONS = [
     """
     CREATE INDEX IF NOT EXISTS idx_tenders_email_sent ON tenders(email_sent);
     """,
+    # Migration 3: Compact 16-byte dedup key replacing the wide 4-column UNIQUE
+    # Only the first row per key is hashed (none if one already is), so the
+    # unique index SCHEMA then creates cannot fail; duplicates the old UNIQUE
+    # let through (NULL fields) keep a NULL hash. The inline UNIQUE itself
+    # cannot be dropped; initialize() rebuilds the table
+    """
+    ALTER TABLE tenders ADD COLUMN dedup_hash BLOB;
+    """,
+    """
+    UPDATE OR IGNORE tenders
+    SET dedup_hash = dedup_hash(portal, vergabe_id, link, titel)
+    WHERE dedup_hash IS NULL AND id IN (
+        SELECT MIN(id) FROM tenders
+        GROUP BY dedup_hash(portal, vergabe_id, link, titel)
+        HAVING COUNT(dedup_hash) = 0
+    );
+    """,
 ]
 
 
+def compute_dedup_hash(
+    portal: Optional[str],
+    vergabe_id: Optional[str],
+    link: Optional[str],
+    titel: Optional[str],
+) -> bytes:
+    """
+    Compute the compact deduplication key for a tender.
+
+    Args:
+        portal: Portal name
+        vergabe_id: Tender ID on the portal
+        link: Tender URL
+        titel: Tender title
+
+    Returns:
+        16-byte BLAKE2b digest over the four identifying fields
+    """
+    key = "\x1f".join(
+        "" if v is None else str(v) for v in (portal, vergabe_id, link, titel)
+    )
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+
+
+# Tender columns in INSERT parameter order
+TENDER_COLUMNS = (
+    "portal",
+    "suchbegriff",
+    "suchzeitpunkt",
+    "vergabe_id",
+    "link",
+    "titel",
+    "ausschreibungsstelle",
+    "ausfuehrungsort",
+    "ausschreibungsart",
+    "naechste_frist",
+    "veroeffentlicht",
+)
+
+_TENDER_DEFAULTS = dict.fromkeys(TENDER_COLUMNS)
+_get_tender_values = operator.itemgetter(*TENDER_COLUMNS)
+
+
+def _tender_params(tender: Dict[str, Any]) -> Tuple:
+    """
+    Build the INSERT parameter tuple for a tender dictionary.
+
+    Missing keys default to None. The dedup hash is appended last.
+
+    Args:
+        tender: Tender data dictionary
+
+    Returns:
+        Parameter tuple matching TENDER_COLUMNS plus dedup_hash
+    """
+    values = _get_tender_values({**_TENDER_DEFAULTS, **tender})
+    # portal, vergabe_id, link, titel
+    return values + (compute_dedup_hash(values[0], values[3], values[4], values[5]),)
+
+
+def _scrape_params(scrape: Dict[str, Any], records_new: int) -> Tuple:
+    """
+    Build the scrape_history INSERT parameter tuple for a finished scrape.
+
+    Timestamps are stored in the same format as _SQL_NOW produces.
+
+    Args:
+        scrape: Dictionary with portal, scrape_start, scrape_end, status,
+                records_found and error_message
+        records_new: Number of new tenders the scrape added
+
+    Returns:
+        Parameter tuple matching _SQL_LOG_SCRAPE
+    """
+    return (
+        scrape["portal"],
+        scrape["scrape_start"].isoformat(sep=" ", timespec="milliseconds"),
+        scrape["scrape_end"].isoformat(sep=" ", timespec="milliseconds"),
+        scrape["status"],
+        scrape.get("records_found", 0),
+        records_new,
+        scrape.get("error_message"),
+    )
+
+
+# =============================================================================
+# SQL statements (module-level so sqlite3's statement cache hits consistently)
+# =============================================================================
+
+_SQL_TABLE_EXISTS = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?"
+
+# Autoindex SQLite creates for the inline UNIQUE of tables before migration 3
+_SQL_LEGACY_UNIQUE_EXISTS = """
+SELECT 1 FROM sqlite_master
+WHERE type = 'index' AND name = 'sqlite_autoindex_tenders_1'
+"""
+
+_TENDERS_TABLE_COLUMNS = ", ".join(
+    ("id",) + TENDER_COLUMNS
+    + ("email_sent", "email_sent_at", "created_at", "updated_at", "dedup_hash")
+)
+
+# Rows keep their ids, so the full-text index stays valid; dropping the old
+# table drops its indexes and triggers, which SCHEMA then recreates
+_SQL_REBUILD_TENDERS = (
+    _TENDERS_TABLE.format(table="tenders_rebuild")
+    + f"""
+INSERT INTO tenders_rebuild ({_TENDERS_TABLE_COLUMNS})
+SELECT {_TENDERS_TABLE_COLUMNS} FROM tenders;
+DROP TABLE tenders;
+ALTER TABLE tenders_rebuild RENAME TO tenders;
+"""
+)
+
+_SQL_FTS_REBUILD = "INSERT INTO tenders_fts(tenders_fts) VALUES ('rebuild')"
+
+_SQL_PORTAL_DAY_STATS_REBUILD = """
+INSERT INTO portal_day_stats(portal, day, tender_count)
+SELECT portal, DATE(created_at), COUNT(*)
+FROM tenders
+GROUP BY portal, DATE(created_at)
+"""
+
+_SQL_GET_USER_VERSION = "PRAGMA user_version"
+
+_SQL_ANALYZE = "ANALYZE"
+
+_SQL_INSERT_TENDER = """
+INSERT OR IGNORE INTO tenders (
+    portal, suchbegriff, suchzeitpunkt, vergabe_id, link,
+    titel, ausschreibungsstelle, ausfuehrungsort,
+    ausschreibungsart, naechste_frist, veroeffentlicht,
+    email_sent, dedup_hash
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0, ?)
+"""
+
+_STAGE_COLUMNS = ", ".join(TENDER_COLUMNS + ("dedup_hash",))
+
+_SQL_CREATE_STAGE = f"CREATE TEMP TABLE IF NOT EXISTS tenders_stage ({_STAGE_COLUMNS})"
+
+_SQL_CLEAR_STAGE = "DELETE FROM tenders_stage"
+
+_SQL_INSERT_STAGE = (
+    f"INSERT INTO tenders_stage ({_STAGE_COLUMNS}) "
+    f"VALUES ({', '.join('?' for _ in range(len(TENDER_COLUMNS) + 1))})"
+)
+
+_SQL_MERGE_STAGE = f"""
+INSERT INTO tenders ({_STAGE_COLUMNS}, email_sent)
+SELECT {_STAGE_COLUMNS}, 0 FROM tenders_stage s
+WHERE s.rowid IN (
+    SELECT MIN(rowid) FROM tenders_stage GROUP BY dedup_hash
+)
+AND NOT EXISTS (
+    SELECT 1 FROM tenders t WHERE t.dedup_hash = s.dedup_hash
+)
+"""
+
+_SQL_DROP_STAGE = "DROP TABLE tenders_stage"
+
+_SQL_GET_TENDERS_SINCE = """
+SELECT * FROM tenders
+WHERE created_at > ?
+ORDER BY created_at DESC
+"""
+
+_SQL_GET_TENDERS_SINCE_BY_PORTAL = """
+SELECT * FROM tenders
+WHERE created_at > ? AND portal = ?
+ORDER BY created_at DESC
+"""
+
+_SQL_COUNT_TENDERS = "SELECT COUNT(*) as cnt FROM tenders"
+
+_SQL_COUNT_TENDERS_BY_PORTAL = "SELECT COUNT(*) as cnt FROM tenders WHERE portal = ?"
+
+_SQL_GET_UNSENT_TENDERS = """
+SELECT * FROM tenders
+WHERE email_sent = 0
+ORDER BY created_at DESC
+"""
+
+# Formatted with one placeholder per tender ID
+_SQL_MARK_TENDERS_SENT = """
+UPDATE tenders
+SET email_sent = 1, email_sent_at = ?
+WHERE id IN ({placeholders})
+"""
+
+# Local wall-clock timestamp computed by SQLite (same clock as datetime.now())
+_SQL_NOW = "strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime')"
+
+_SQL_LOG_SCRAPE_START = f"""
+INSERT INTO scrape_history (portal, scrape_start, status)
+VALUES (?, {_SQL_NOW}, 'in_progress')
+"""
+
+_SQL_LOG_SCRAPE_END = f"""
+UPDATE scrape_history
+SET scrape_end = {_SQL_NOW}, status = ?, records_found = ?,
+    records_new = ?, error_message = ?
+WHERE id = ?
+"""
+
+_SQL_LOG_SCRAPE = """
+INSERT INTO scrape_history (
+    portal, scrape_start, scrape_end, status, records_found,
+    records_new, error_message
+) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_GET_SCRAPE_HISTORY = """
+SELECT * FROM scrape_history
+ORDER BY scrape_start DESC
+LIMIT ?
+"""
+
+_SQL_GET_SCRAPE_HISTORY_BY_PORTAL = """
+SELECT * FROM scrape_history
+WHERE portal = ?
+ORDER BY scrape_start DESC
+LIMIT ?
+"""
+
+_SQL_LOG_EMAIL = f"""
+INSERT INTO email_history (
+    sent_at, recipients, subject, new_tenders_count,
+    status, error_message
+) VALUES ({_SQL_NOW}, ?, ?, ?, ?, ?)
+"""
+
+# Column alias carries the [timestamp] type so PARSE_COLNAMES converts it
+_SQL_GET_LAST_EMAIL_TIME = """
+SELECT MAX(sent_at) as "last_sent [timestamp]"
+FROM email_history
+WHERE status = 'success'
+"""
+
+_SQL_GET_EMAIL_HISTORY = """
+SELECT * FROM email_history
+ORDER BY sent_at DESC
+LIMIT ?
+"""
+
+
 class Database:
     """SQLite database manager with connection pooling and context manager support."""
 
@@ -94,47 +455,101 @@ class Database:
         """
         Initialize database manager.
 
+        Connections are long-lived and kept per thread, so each thread
+        retains its own warm page cache across calls.
+
         Args:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
-        self._connection: Optional[sqlite3.Connection] = None
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+        # Cached MAX(sent_at) of successful emails; only log_email_sent changes it
+        self._last_email_time: Optional[datetime] = None
+        self._last_email_time_loaded = False
 
         # Ensure directory exists
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
+    @property
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """Connection owned by the current thread, if any."""
+        return getattr(self._local, "connection", None)
+
     def connect(self) -> sqlite3.Connection:
         """
-        Get or create database connection.
+        Get or create the database connection for the current thread.
 
         Returns:
             SQLite connection object
         """
-        if self._connection is None:
-            self._connection = sqlite3.connect(
+        conn = self._connection
+        if conn is None:
+            # check_same_thread=False only so shutdown() can close every
+            # thread's connection; each connection is used by one thread
+            conn = sqlite3.connect(
                 self.db_path,
                 detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+                check_same_thread=False,
+                cached_statements=256,
             )
-            self._connection.row_factory = sqlite3.Row
+            conn.row_factory = sqlite3.Row
+            conn.create_function(
+                "dedup_hash", 4, compute_dedup_hash, deterministic=True
+            )
+
+            # Enable WAL mode and read/write tuning (synchronous=NORMAL is safe under WAL)
+            conn.executescript(PRAGMAS)
 
-            # Enable WAL mode for better concurrency
-            self._connection.execute("PRAGMA journal_mode=WAL")
-            self._connection.execute("PRAGMA foreign_keys=ON")
+            self._local.connection = conn
+            with self._lock:
+                self._connections.append(conn)
 
-            logger.debug(f"Connected to database: {self.db_path}")
+            logger.debug("Connected to database: %s", self.db_path)
 
-        return self._connection
+        return conn
+
+    def optimize(self) -> None:
+        """Run PRAGMA optimize to refresh query planner statistics."""
+        conn = self._connection
+        if conn:
+            try:
+                conn.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                logger.warning(f"PRAGMA optimize failed: {e}")
 
     def close(self) -> None:
-        """Close database connection."""
-        if self._connection:
+        """Close the current thread's database connection."""
+        conn = self._connection
+        if conn:
             try:
-                self._connection.close()
+                self.optimize()
+                conn.close()
                 logger.debug("Database connection closed")
             except Exception as e:
                 logger.warning(f"Error closing database: {e}")
             finally:
-                self._connection = None
+                self._local.connection = None
+                with self._lock:
+                    if conn in self._connections:
+                        self._connections.remove(conn)
+
+    def shutdown(self) -> None:
+        """Close the connections of all threads (call once at process exit)."""
+        self.close()
+
+        with self._lock:
+            connections, self._connections = self._connections, []
+
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception as e:
+                logger.warning(f"Error closing database: {e}")
+
+        logger.debug("All database connections closed")
 
     def __enter__(self) -> "Database":
         """Context manager entry."""
@@ -142,8 +557,14 @@ class Database:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Context manager exit."""
-        self.close()
+        """Context manager exit: settle pending work but keep the connection open."""
+        conn = self._connection
+        if conn is None:
+            return
+        if exc_type is None:
+            conn.commit()
+        else:
+            conn.rollback()
 
     @contextmanager
     def transaction(self) -> Generator[sqlite3.Cursor, None, None]:
@@ -166,20 +587,58 @@ class Database:
             raise
 
     def initialize(self) -> None:
-        """Initialize database schema and run migrations."""
+        """
+        Initialize database schema and run migrations.
+
+        Skipped when the database's user_version already matches
+        SCHEMA_VERSION.
+        """
         conn = self.connect()
         cursor = conn.cursor()
 
+        version = cursor.execute(_SQL_GET_USER_VERSION).fetchone()[0]
+        fts_exists = cursor.execute(_SQL_TABLE_EXISTS, ("tenders_fts",)).fetchone()
+        # A database set up under an older SQLite gains its index on upgrade
+        if version == SCHEMA_VERSION and (fts_exists or not FTS_AVAILABLE):
+            logger.debug("Database schema up to date (v%d): %s", version, self.db_path)
+            return
+
+        tenders_exist = cursor.execute(_SQL_TABLE_EXISTS, ("tenders",)).fetchone()
+        stats_exist = cursor.execute(_SQL_TABLE_EXISTS, ("portal_day_stats",)).fetchone()
+
+        if tenders_exist:
+            # Bring tables of older versions up to SCHEMA's columns, which
+            # its indexes need
+            self._run_migrations()
+
         try:
             cursor.executescript(SCHEMA)
+            if FTS_AVAILABLE:
+                cursor.executescript(FTS_SCHEMA)
+                if not fts_exists:
+                    # Index tenders stored before the full-text table existed
+                    cursor.execute(_SQL_FTS_REBUILD)
+            else:
+                logger.info(
+                    "SQLite %s lacks the FTS5 trigram tokenizer (3.34+), "
+                    "searching tenders with LIKE", sqlite3.sqlite_version
+                )
+            if not stats_exist:
+                # Aggregate tenders stored before the counter table existed
+                cursor.execute(_SQL_PORTAL_DAY_STATS_REBUILD)
             conn.commit()
             logger.info(f"Database initialized: {self.db_path}")
         except Exception as e:
             logger.error(f"Failed to initialize database: {e}")
             raise
 
-        # Run migrations for existing databases
-        self._run_migrations()
+        if cursor.execute(_SQL_LEGACY_UNIQUE_EXISTS).fetchone():
+            self._rebuild_tenders_table()
+
+        # Give the query planner statistics for the indexes
+        conn.execute(_SQL_ANALYZE)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.commit()
 
     def _run_migrations(self) -> None:
         """Run database migrations for existing databases."""
@@ -196,6 +655,25 @@ class Database:
                     continue
                 logger.warning(f"Migration skipped or failed: {e}")
 
+    def _rebuild_tenders_table(self) -> None:
+        """
+        Rebuild a tenders table created with the inline 4-column UNIQUE.
+
+        SQLite cannot drop a table constraint, so the rows are copied into a
+        table without it and the dedup_hash index takes over deduplication.
+        """
+        conn = self.connect()
+        script = _SQL_REBUILD_TENDERS + SCHEMA + (FTS_SCHEMA if FTS_AVAILABLE else "")
+
+        try:
+            conn.executescript(f"BEGIN;\n{script}\nCOMMIT;")
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Failed to rebuild tenders table: {e}")
+            raise
+
+        logger.info(f"Rebuilt tenders table without the legacy UNIQUE: {self.db_path}")
+
     def execute(
         self,
         query: str,
@@ -225,6 +703,7 @@ class Database:
         self,
         query: str,
         params_list: List[Tuple],
+        commit: bool = True,
     ) -> int:
         """
         Execute a SQL query with multiple parameter sets.
@@ -232,6 +711,7 @@ class Database:
         Args:
             query: SQL query string
             params_list: List of parameter tuples
+            commit: Commit after executing (pass False inside a transaction)
 
         Returns:
             Number of rows affected
@@ -240,7 +720,8 @@ class Database:
         cursor = conn.cursor()
 
         cursor.executemany(query, params_list)
-        conn.commit()
+        if commit:
+            conn.commit()
 
         return cursor.rowcount
 
@@ -259,8 +740,7 @@ class Database:
         Returns:
             Single row or None
         """
-        cursor = self.execute(query, params)
-        return cursor.fetchone()
+        return self.connect().execute(query, params or ()).fetchone()
 
     def fetch_all(
         self,
@@ -277,8 +757,73 @@ class Database:
         Returns:
             List of rows
         """
-        cursor = self.execute(query, params)
-        return cursor.fetchall()
+        return self.connect().execute(query, params or ()).fetchall()
+
+    def _dict_cursor(
+        self,
+        query: str,
+        params: Optional[Tuple] = None,
+    ) -> Tuple[sqlite3.Cursor, List[str]]:
+        """
+        Execute a query on a cursor that yields plain tuples.
+
+        Args:
+            query: SQL query string
+            params: Query parameters
+
+        Returns:
+            Tuple of (cursor, column names)
+        """
+        cursor = self.connect().cursor()
+        cursor.row_factory = None  # Skip sqlite3.Row wrapping
+        cursor.execute(query, params or ())
+        keys = [d[0] for d in cursor.description]
+        return cursor, keys
+
+    def fetch_all_dicts(
+        self,
+        query: str,
+        params: Optional[Tuple] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute query and fetch all results as dictionaries.
+
+        Args:
+            query: SQL query string
+            params: Query parameters
+
+        Returns:
+            List of row dictionaries
+        """
+        cursor, keys = self._dict_cursor(query, params)
+        return [dict(zip(keys, row)) for row in cursor.fetchall()]
+
+    def iter_dicts(
+        self,
+        query: str,
+        params: Optional[Tuple] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Execute query and yield results as dictionaries in batches.
+
+        Avoids materializing large result sets in memory at once.
+
+        Args:
+            query: SQL query string
+            params: Query parameters
+            batch_size: Number of rows fetched per round trip
+
+        Yields:
+            Row dictionaries
+        """
+        cursor, keys = self._dict_cursor(query, params)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(zip(keys, row))
 
     # =========================================================================
     # Tender Operations
@@ -294,30 +839,9 @@ class Database:
         Returns:
             True if inserted, False if duplicate
         """
-        query = """
-        INSERT OR IGNORE INTO tenders (
-            portal, suchbegriff, suchzeitpunkt, vergabe_id, link,
-            titel, ausschreibungsstelle, ausfuehrungsort,
-            ausschreibungsart, naechste_frist, veroeffentlicht,
-            email_sent
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
-        """
-
-        params = (
-            tender.get("portal"),
-            tender.get("suchbegriff"),
-            tender.get("suchzeitpunkt"),
-            tender.get("vergabe_id"),
-            tender.get("link"),
-            tender.get("titel"),
-            tender.get("ausschreibungsstelle"),
-            tender.get("ausfuehrungsort"),
-            tender.get("ausschreibungsart"),
-            tender.get("naechste_frist"),
-            tender.get("veroeffentlicht"),
-        )
+        params = _tender_params(tender)
 
-        cursor = self.execute(query, params)
+        cursor = self.execute(_SQL_INSERT_TENDER, params)
         self.connect().commit()
 
         return cursor.rowcount > 0
@@ -335,45 +859,112 @@ class Database:
         if not tenders:
             return 0
 
-        query = """
-        INSERT OR IGNORE INTO tenders (
-            portal, suchbegriff, suchzeitpunkt, vergabe_id, link,
-            titel, ausschreibungsstelle, ausfuehrungsort,
-            ausschreibungsart, naechste_frist, veroeffentlicht,
-            email_sent
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
-        """
-
-        params_list = [
-            (
-                t.get("portal"),
-                t.get("suchbegriff"),
-                t.get("suchzeitpunkt"),
-                t.get("vergabe_id"),
-                t.get("link"),
-                t.get("titel"),
-                t.get("ausschreibungsstelle"),
-                t.get("ausfuehrungsort"),
-                t.get("ausschreibungsart"),
-                t.get("naechste_frist"),
-                t.get("veroeffentlicht"),
+        params_list = [_tender_params(t) for t in tenders]
+
+        # Single transaction: one commit (and WAL flush) for the whole batch
+        with self.transaction() as cursor:
+            cursor.executemany(_SQL_INSERT_TENDER, params_list)
+            # rowcount sums rows inserted by this batch; unlike total_changes
+            # it excludes ignored duplicates and rows written by FTS triggers
+            new_count = cursor.rowcount
+        logger.debug("Inserted %d new tenders (of %d total)", new_count, len(tenders))
+
+        return new_count
+
+    def log_scrapes(self, scrapes: List[Dict[str, Any]]) -> List[int]:
+        """
+        Save several finished scrapes and their tenders in one transaction.
+
+        Each scrape's tenders are inserted first so that its scrape_history
+        row is written once, complete with the new-tender count.
+
+        Args:
+            scrapes: Dictionaries with portal, scrape_start, scrape_end,
+                     status, records_found, error_message and tenders
+                     (list of tender data dictionaries)
+
+        Returns:
+            Number of new tenders inserted per scrape, in input order
+        """
+        new_counts: List[int] = []
+        if not scrapes:
+            return new_counts
+
+        with self.transaction() as cursor:
+            for scrape in scrapes:
+                tenders = scrape.get("tenders") or []
+                new_count = 0
+                if tenders:
+                    cursor.executemany(
+                        _SQL_INSERT_TENDER, [_tender_params(t) for t in tenders]
+                    )
+                    new_count = cursor.rowcount
+                cursor.execute(
+                    _SQL_LOG_SCRAPE,
+                    _scrape_params(scrape, new_count),
+                )
+                new_counts.append(new_count)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Inserted %d new tenders from %d scrapes",
+                sum(new_counts),
+                len(scrapes),
             )
-            for t in tenders
-        ]
 
-        # Get count before insert
-        count_before = self.fetch_one("SELECT COUNT(*) as cnt FROM tenders")
-        count_before = count_before["cnt"] if count_before else 0
+        return new_counts
 
-        # Insert
-        self.execute_many(query, params_list)
+    def insert_tenders_batched(
+        self,
+        tenders: List[Dict[str, Any]],
+        batch_size: int = 1000,
+    ) -> int:
+        """
+        Insert tenders in chunks, committing once per chunk.
 
-        # Get count after insert
-        count_after = self.fetch_one("SELECT COUNT(*) as cnt FROM tenders")
-        count_after = count_after["cnt"] if count_after else 0
+        Keeps individual write transactions short so readers are not
+        blocked for long periods on very large inserts.
 
-        new_count = count_after - count_before
-        logger.debug(f"Inserted {new_count} new tenders (of {len(tenders)} total)")
+        Args:
+            tenders: List of tender data dictionaries
+            batch_size: Number of tenders per transaction
+
+        Returns:
+            Number of new tenders inserted
+        """
+        new_count = 0
+        for start in range(0, len(tenders), batch_size):
+            new_count += self.insert_tenders(tenders[start:start + batch_size])
+        return new_count
+
+    def bulk_insert_tenders(self, tenders: List[Dict[str, Any]]) -> int:
+        """
+        Insert a large batch of tenders via an unindexed staging table.
+
+        Rows are loaded into a temporary table without any uniqueness
+        checks, then deduplicated against existing tenders (and against
+        each other) in one set-based INSERT ... SELECT. Intended for full
+        rescrapes where most rows are new.
+
+        Args:
+            tenders: List of tender data dictionaries
+
+        Returns:
+            Number of new tenders inserted
+        """
+        if not tenders:
+            return 0
+
+        params_list = [_tender_params(t) for t in tenders]
+
+        with self.transaction() as cursor:
+            cursor.execute(_SQL_CREATE_STAGE)
+            cursor.execute(_SQL_CLEAR_STAGE)
+            cursor.executemany(_SQL_INSERT_STAGE, params_list)
+            cursor.execute(_SQL_MERGE_STAGE)
+            new_count = cursor.rowcount
+            cursor.execute(_SQL_DROP_STAGE)
+
+        logger.debug("Bulk inserted %d new tenders (of %d total)", new_count, len(tenders))
 
         return new_count
 
@@ -393,21 +984,36 @@ class Database:
             List of tender dictionaries
         """
         if portal:
-            query = """
-            SELECT * FROM tenders
-            WHERE created_at > ? AND portal = ?
-            ORDER BY created_at DESC
-            """
-            rows = self.fetch_all(query, (since, portal))
+            rows = self.fetch_all_dicts(
+                _SQL_GET_TENDERS_SINCE_BY_PORTAL,
+                (since, portal),
+            )
         else:
-            query = """
-            SELECT * FROM tenders
-            WHERE created_at > ?
-            ORDER BY created_at DESC
-            """
-            rows = self.fetch_all(query, (since,))
+            rows = self.fetch_all_dicts(_SQL_GET_TENDERS_SINCE, (since,))
+
+        return rows
+
+    def iter_tenders_since(
+        self,
+        since: datetime,
+        portal: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream tenders created since a given timestamp.
+
+        Like get_tenders_since, but yields rows lazily instead of
+        building the whole list in memory.
+
+        Args:
+            since: Cutoff datetime
+            portal: Optional portal filter
 
-        return [dict(row) for row in rows]
+        Yields:
+            Tender dictionaries
+        """
+        if portal:
+            return self.iter_dicts(_SQL_GET_TENDERS_SINCE_BY_PORTAL, (since, portal))
+        return self.iter_dicts(_SQL_GET_TENDERS_SINCE, (since,))
 
     def get_new_tenders_since_last_email(self) -> List[Dict[str, Any]]:
         """
@@ -416,18 +1022,15 @@ class Database:
         Returns:
             List of tender dictionaries
         """
-        query = """
-        SELECT t.* FROM tenders t
-        WHERE t.created_at > (
-            SELECT COALESCE(MAX(sent_at), '1970-01-01')
-            FROM email_history
-            WHERE status = 'success'
+        last_sent = self.get_last_successful_email_time()
+        cutoff = (
+            last_sent.isoformat(sep=" ", timespec="microseconds")
+            if last_sent
+            else "1970-01-01"
         )
-        ORDER BY t.created_at DESC
-        """
 
-        rows = self.fetch_all(query)
-        return [dict(row) for row in rows]
+        rows = self.fetch_all_dicts(_SQL_GET_TENDERS_SINCE, (cutoff,))
+        return rows
 
     def get_tender_count(self, portal: Optional[str] = None) -> int:
         """
@@ -440,12 +1043,9 @@ class Database:
             Number of tenders
         """
         if portal:
-            row = self.fetch_one(
-                "SELECT COUNT(*) as cnt FROM tenders WHERE portal = ?",
-                (portal,),
-            )
+            row = self.fetch_one(_SQL_COUNT_TENDERS_BY_PORTAL, (portal,))
         else:
-            row = self.fetch_one("SELECT COUNT(*) as cnt FROM tenders")
+            row = self.fetch_one(_SQL_COUNT_TENDERS)
 
         return row["cnt"] if row else 0
 
@@ -456,14 +1056,8 @@ class Database:
         Returns:
             List of tender dictionaries
         """
-        query = """
-        SELECT * FROM tenders
-        WHERE email_sent = 0
-        ORDER BY created_at DESC
-        """
-
-        rows = self.fetch_all(query)
-        return [dict(row) for row in rows]
+        rows = self.fetch_all_dicts(_SQL_GET_UNSENT_TENDERS)
+        return rows
 
     def mark_tenders_as_sent(self, tender_ids: List[int]) -> int:
         """
@@ -482,11 +1076,7 @@ class Database:
         placeholders = ",".join("?" for _ in tender_ids)
         sent_at = datetime.now().isoformat()
 
-        query = f"""
-        UPDATE tenders
-        SET email_sent = 1, email_sent_at = ?
-        WHERE id IN ({placeholders})
-        """
+        query = _SQL_MARK_TENDERS_SENT.format(placeholders=placeholders)
 
         params = [sent_at] + list(tender_ids)
 
@@ -494,7 +1084,7 @@ class Database:
         self.connect().commit()
 
         updated = cursor.rowcount
-        logger.debug(f"Marked {updated} tenders as sent")
+        logger.debug("Marked %d tenders as sent", updated)
 
         return updated
 
@@ -502,22 +1092,63 @@ class Database:
     # Scrape History Operations
     # =========================================================================
 
-    def log_scrape_start(self, portal: str) -> int:
+    def log_scrape(
+        self,
+        portal: str,
+        scrape_start: datetime,
+        scrape_end: datetime,
+        status: str,
+        records_found: int = 0,
+        records_new: int = 0,
+        error_message: Optional[str] = None,
+    ) -> int:
         """
-        Log the start of a scraping operation.
+        Log a finished scraping operation with a single insert.
 
         Args:
             portal: Portal name
+            scrape_start: Local time the scrape started
+            scrape_end: Local time the scrape finished
+            status: 'success', 'failure', or 'partial'
+            records_found: Total records found
+            records_new: New records (not duplicates)
+            error_message: Error message if failed
 
         Returns:
             ID of the scrape history record
         """
-        query = """
-        INSERT INTO scrape_history (portal, scrape_start, status)
-        VALUES (?, ?, 'in_progress')
+        cursor = self.execute(
+            _SQL_LOG_SCRAPE,
+            _scrape_params(
+                {
+                    "portal": portal,
+                    "scrape_start": scrape_start,
+                    "scrape_end": scrape_end,
+                    "status": status,
+                    "records_found": records_found,
+                    "error_message": error_message,
+                },
+                records_new,
+            ),
+        )
+        self.connect().commit()
+
+        return cursor.lastrowid
+
+    def log_scrape_start(self, portal: str) -> int:
         """
+        Log the start of a scraping operation.
+
+        Leaves an 'in_progress' row to be completed by log_scrape_end;
+        use log_scrape to record a finished scrape in one statement.
+
+        Args:
+            portal: Portal name
 
-        cursor = self.execute(query, (portal, datetime.now()))
+        Returns:
+            ID of the scrape history record
+        """
+        cursor = self.execute(_SQL_LOG_SCRAPE_START, (portal,))
         self.connect().commit()
 
         return cursor.lastrowid
@@ -540,16 +1171,9 @@ class Database:
             records_new: New records (not duplicates)
             error_message: Error message if failed
         """
-        query = """
-        UPDATE scrape_history
-        SET scrape_end = ?, status = ?, records_found = ?,
-            records_new = ?, error_message = ?
-        WHERE id = ?
-        """
-
         self.execute(
-            query,
-            (datetime.now(), status, records_found, records_new, error_message, scrape_id),
+            _SQL_LOG_SCRAPE_END,
+            (status, records_found, records_new, error_message, scrape_id),
         )
         self.connect().commit()
 
@@ -569,22 +1193,14 @@ class Database:
             List of scrape history dictionaries
         """
         if portal:
-            query = """
-            SELECT * FROM scrape_history
-            WHERE portal = ?
-            ORDER BY scrape_start DESC
-            LIMIT ?
-            """
-            rows = self.fetch_all(query, (portal, limit))
+            rows = self.fetch_all_dicts(
+                _SQL_GET_SCRAPE_HISTORY_BY_PORTAL,
+                (portal, limit),
+            )
         else:
-            query = """
-            SELECT * FROM scrape_history
-            ORDER BY scrape_start DESC
-            LIMIT ?
-            """
-            rows = self.fetch_all(query, (limit,))
+            rows = self.fetch_all_dicts(_SQL_GET_SCRAPE_HISTORY, (limit,))
 
-        return [dict(row) for row in rows]
+        return rows
 
     # =========================================================================
     # Email History Operations
@@ -611,25 +1227,22 @@ class Database:
         Returns:
             ID of the email history record
         """
-        query = """
-        INSERT INTO email_history (
-            sent_at, recipients, subject, new_tenders_count,
-            status, error_message
-        ) VALUES (?, ?, ?, ?, ?, ?)
-        """
-
-        cursor = self.execute(
-            query,
-            (
-                datetime.now(),
-                recipients,
-                subject,
-                new_tenders_count,
-                status,
-                error_message,
-            ),
-        )
-        self.connect().commit()
+        try:
+            cursor = self.execute(
+                _SQL_LOG_EMAIL,
+                (
+                    recipients,
+                    subject,
+                    new_tenders_count,
+                    status,
+                    error_message,
+                ),
+            )
+            self.connect().commit()
+        finally:
+            # Reload the last email time on next access
+            if status == "success":
+                self._last_email_time_loaded = False
 
         return cursor.lastrowid
 
@@ -637,21 +1250,17 @@ class Database:
         """
         Get the timestamp of the last successfully sent email.
 
+        The value is cached in-process and reloaded after log_email_sent.
+
         Returns:
             Datetime of last email or None
         """
-        row = self.fetch_one("""
-            SELECT MAX(sent_at) as last_sent
-            FROM email_history
-            WHERE status = 'success'
-        """)
-
-        if row and row["last_sent"]:
-            if isinstance(row["last_sent"], str):
-                return datetime.fromisoformat(row["last_sent"])
-            return row["last_sent"]
+        if not self._last_email_time_loaded:
+            row = self.fetch_one(_SQL_GET_LAST_EMAIL_TIME)
+            self._last_email_time = row["last_sent"] if row else None
+            self._last_email_time_loaded = True
 
-        return None
+        return self._last_email_time
 
     def get_email_history(self, limit: int = 50) -> List[Dict[str, Any]]:
         """
@@ -663,10 +1272,6 @@ class Database:
         Returns:
             List of email history dictionaries
         """
-        rows = self.fetch_all("""
-            SELECT * FROM email_history
-            ORDER BY sent_at DESC
-            LIMIT ?
-        """, (limit,))
+        rows = self.fetch_all_dicts(_SQL_GET_EMAIL_HISTORY, (limit,))
 
-        return [dict(row) for row in rows]
+        return rows
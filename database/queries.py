@@ -5,9 +5,157 @@ Provides query builders and common query patterns.
 """
 
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
-from database.db import Database
+from database.db import FTS_AVAILABLE, Database
+
+# The trigram full-text index cannot match terms shorter than this
+FTS_MIN_TERM_LENGTH = 3
+
+
+# =============================================================================
+# SQL statements (module-level so sqlite3's statement cache hits consistently)
+# =============================================================================
+
+_SQL_GET_TENDERS_BY_PORTAL = """
+SELECT * FROM tenders
+WHERE portal = ?
+ORDER BY created_at DESC
+LIMIT ?
+"""
+
+_SQL_GET_TENDERS_BY_KEYWORD_LIKE = """
+SELECT * FROM tenders
+WHERE suchbegriff = ? OR titel LIKE ?
+ORDER BY created_at DESC
+LIMIT ?
+"""
+
+_SQL_GET_TENDERS_BY_KEYWORD = """
+SELECT * FROM tenders
+WHERE suchbegriff = ? OR id IN (
+    SELECT rowid FROM tenders_fts WHERE tenders_fts MATCH ?
+)
+ORDER BY created_at DESC
+LIMIT ?
+"""
+
+_SQL_GET_TENDERS_BY_TITLE_PREFIX = """
+SELECT * FROM tenders
+WHERE titel LIKE ? ESCAPE '\\'
+ORDER BY created_at DESC
+LIMIT ?
+"""
+
+_SQL_GET_TENDERS_SINCE = """
+SELECT * FROM tenders
+WHERE created_at > ?
+ORDER BY created_at DESC
+"""
+
+_SQL_GET_PORTAL_STATISTICS = """
+SELECT
+    portal,
+    SUM(tender_count) as total_tenders,
+    COUNT(*) as days_active,
+    MAX(day) as last_tender,
+    MIN(day) as first_tender
+FROM portal_day_stats
+GROUP BY portal
+ORDER BY total_tenders DESC
+"""
+
+_SQL_GET_SCRAPER_SUCCESS_RATE = """
+SELECT
+    portal,
+    COUNT(*) as total_runs,
+    SUM(CASE WHEN status = 'success' THEN 1 ELSE 0 END) as successful,
+    SUM(CASE WHEN status = 'failure' THEN 1 ELSE 0 END) as failed,
+    AVG(records_new) as avg_new_records,
+    ROUND(
+        100.0 * SUM(CASE WHEN status = 'success' THEN 1 ELSE 0 END) / COUNT(*),
+        2
+    ) as success_rate
+FROM scrape_history
+WHERE scrape_start > ?
+GROUP BY portal
+ORDER BY success_rate DESC
+"""
+
+_SQL_GET_DAILY_TENDER_COUNTS = """
+SELECT
+    DATE(created_at) as date,
+    COUNT(*) as tender_count,
+    COUNT(DISTINCT portal) as portals_active
+FROM tenders
+WHERE created_at > ?
+GROUP BY DATE(created_at)
+ORDER BY date DESC
+"""
+
+_SQL_SEARCH_TENDERS_BY_PORTAL = """
+SELECT t.* FROM tenders_fts f
+JOIN tenders t ON t.id = f.rowid
+WHERE tenders_fts MATCH ? AND t.portal = ?
+ORDER BY t.created_at DESC
+LIMIT ?
+"""
+
+_SQL_SEARCH_TENDERS = """
+SELECT t.* FROM tenders_fts f
+JOIN tenders t ON t.id = f.rowid
+WHERE tenders_fts MATCH ?
+ORDER BY t.created_at DESC
+LIMIT ?
+"""
+
+_SQL_SEARCH_TENDERS_LIKE_BY_PORTAL = """
+SELECT * FROM tenders
+WHERE portal = ? AND (titel LIKE ? OR ausschreibungsstelle LIKE ?)
+ORDER BY created_at DESC
+LIMIT ?
+"""
+
+_SQL_SEARCH_TENDERS_LIKE = """
+SELECT * FROM tenders
+WHERE titel LIKE ? OR ausschreibungsstelle LIKE ?
+ORDER BY created_at DESC
+LIMIT ?
+"""
+
+_SQL_GET_UPCOMING_DEADLINES = """
+SELECT * FROM tenders
+WHERE naechste_frist IS NOT NULL
+AND naechste_frist != ''
+ORDER BY created_at DESC
+LIMIT 100
+"""
+
+_SQL_DELETE_TENDERS_BEFORE = """
+DELETE FROM tenders
+WHERE created_at < ?
+"""
+
+_SQL_WAL_CHECKPOINT = "PRAGMA wal_checkpoint(TRUNCATE)"
+
+_SQL_OPTIMIZE = "PRAGMA optimize"
+
+_SQL_VACUUM = "VACUUM"
+
+_SQL_INTEGRITY_CHECK = "PRAGMA integrity_check"
+
+
+def _fts_phrase(term: str) -> str:
+    """
+    Quote a search term as an FTS5 phrase.
+
+    Args:
+        term: Raw search term
+
+    Returns:
+        Term wrapped in double quotes with embedded quotes escaped
+    """
+    return '"' + term.replace('"', '""') + '"'
 
 
 class TenderQueries:
@@ -37,15 +185,25 @@ class TenderQueries:
         Returns:
             List of tender dictionaries
         """
-        query = """
-        SELECT * FROM tenders
-        WHERE portal = ?
-        ORDER BY created_at DESC
-        LIMIT ?
+        rows = self.db.fetch_all_dicts(_SQL_GET_TENDERS_BY_PORTAL, (portal, limit))
+        return rows
+
+    def iter_tenders_by_portal(
+        self,
+        portal: str,
+        limit: int = 100,
+    ) -> Iterator[Dict[str, Any]]:
         """
+        Stream tenders from a specific portal.
+
+        Args:
+            portal: Portal name
+            limit: Maximum results
 
-        rows = self.db.fetch_all(query, (portal, limit))
-        return [dict(row) for row in rows]
+        Yields:
+            Tender dictionaries
+        """
+        return self.db.iter_dicts(_SQL_GET_TENDERS_BY_PORTAL, (portal, limit))
 
     def get_tenders_by_keyword(
         self,
@@ -62,16 +220,45 @@ class TenderQueries:
         Returns:
             List of tender dictionaries
         """
-        query = """
-        SELECT * FROM tenders
-        WHERE suchbegriff = ? OR titel LIKE ?
-        ORDER BY created_at DESC
-        LIMIT ?
+        if not FTS_AVAILABLE or len(keyword) < FTS_MIN_TERM_LENGTH:
+            pattern = f"%{keyword}%"
+            rows = self.db.fetch_all_dicts(
+                _SQL_GET_TENDERS_BY_KEYWORD_LIKE,
+                (keyword, pattern, limit),
+            )
+        else:
+            match = f"titel : {_fts_phrase(keyword)}"
+            rows = self.db.fetch_all_dicts(
+                _SQL_GET_TENDERS_BY_KEYWORD,
+                (keyword, match, limit),
+            )
+
+        return rows
+
+    def get_tenders_by_title_prefix(
+        self,
+        prefix: str,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
         """
+        Get tenders whose title starts with a prefix (case-insensitive).
 
-        pattern = f"%{keyword}%"
-        rows = self.db.fetch_all(query, (keyword, pattern, limit))
-        return [dict(row) for row in rows]
+        Uses idx_tenders_titel_nocase, so the lookup is an index range
+        scan rather than a full table scan.
+
+        Args:
+            prefix: Title prefix
+            limit: Maximum results
+
+        Returns:
+            List of tender dictionaries
+        """
+        escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        rows = self.db.fetch_all_dicts(
+            _SQL_GET_TENDERS_BY_TITLE_PREFIX,
+            (f"{escaped}%", limit),
+        )
+        return rows
 
     def get_tenders_last_n_hours(
         self,
@@ -88,36 +275,21 @@ class TenderQueries:
         """
         cutoff = datetime.now() - timedelta(hours=hours)
 
-        query = """
-        SELECT * FROM tenders
-        WHERE created_at > ?
-        ORDER BY created_at DESC
-        """
-
-        rows = self.db.fetch_all(query, (cutoff,))
-        return [dict(row) for row in rows]
+        rows = self.db.fetch_all_dicts(_SQL_GET_TENDERS_SINCE, (cutoff,))
+        return rows
 
     def get_portal_statistics(self) -> List[Dict[str, Any]]:
         """
         Get statistics per portal.
 
+        Reads the pre-aggregated portal_day_stats table, so last_tender and
+        first_tender are reported at day granularity.
+
         Returns:
             List of portal statistics
         """
-        query = """
-        SELECT
-            portal,
-            COUNT(*) as total_tenders,
-            COUNT(DISTINCT DATE(created_at)) as days_active,
-            MAX(created_at) as last_tender,
-            MIN(created_at) as first_tender
-        FROM tenders
-        GROUP BY portal
-        ORDER BY total_tenders DESC
-        """
-
-        rows = self.db.fetch_all(query)
-        return [dict(row) for row in rows]
+        rows = self.db.fetch_all_dicts(_SQL_GET_PORTAL_STATISTICS)
+        return rows
 
     def get_scraper_success_rate(
         self,
@@ -134,25 +306,8 @@ class TenderQueries:
         """
         cutoff = datetime.now() - timedelta(days=days)
 
-        query = """
-        SELECT
-            portal,
-            COUNT(*) as total_runs,
-            SUM(CASE WHEN status = 'success' THEN 1 ELSE 0 END) as successful,
-            SUM(CASE WHEN status = 'failure' THEN 1 ELSE 0 END) as failed,
-            AVG(records_new) as avg_new_records,
-            ROUND(
-                100.0 * SUM(CASE WHEN status = 'success' THEN 1 ELSE 0 END) / COUNT(*),
-                2
-            ) as success_rate
-        FROM scrape_history
-        WHERE scrape_start > ?
-        GROUP BY portal
-        ORDER BY success_rate DESC
-        """
-
-        rows = self.db.fetch_all(query, (cutoff,))
-        return [dict(row) for row in rows]
+        rows = self.db.fetch_all_dicts(_SQL_GET_SCRAPER_SUCCESS_RATE, (cutoff,))
+        return rows
 
     def get_daily_tender_counts(
         self,
@@ -169,19 +324,8 @@ class TenderQueries:
         """
         cutoff = datetime.now() - timedelta(days=days)
 
-        query = """
-        SELECT
-            DATE(created_at) as date,
-            COUNT(*) as tender_count,
-            COUNT(DISTINCT portal) as portals_active
-        FROM tenders
-        WHERE created_at > ?
-        GROUP BY DATE(created_at)
-        ORDER BY date DESC
-        """
-
-        rows = self.db.fetch_all(query, (cutoff,))
-        return [dict(row) for row in rows]
+        rows = self.db.fetch_all_dicts(_SQL_GET_DAILY_TENDER_COUNTS, (cutoff,))
+        return rows
 
     def search_tenders(
         self,
@@ -192,6 +336,41 @@ class TenderQueries:
         """
         Search tenders by title or organization.
 
+        Args:
+            search_term: Search term
+            portal: Optional portal filter
+            limit: Maximum results
+
+        Returns:
+            List of matching tenders
+        """
+        if not FTS_AVAILABLE or len(search_term) < FTS_MIN_TERM_LENGTH:
+            return self._search_tenders_like(search_term, portal, limit)
+
+        match = f"{{titel ausschreibungsstelle}} : {_fts_phrase(search_term)}"
+
+        if portal:
+            rows = self.db.fetch_all_dicts(
+                _SQL_SEARCH_TENDERS_BY_PORTAL,
+                (match, portal, limit),
+            )
+        else:
+            rows = self.db.fetch_all_dicts(_SQL_SEARCH_TENDERS, (match, limit))
+
+        return rows
+
+    def _search_tenders_like(
+        self,
+        search_term: str,
+        portal: Optional[str],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search tenders with LIKE where the full-text index cannot be used.
+
+        Used for terms shorter than a trigram and on SQLite builds without
+        the trigram tokenizer (see FTS_AVAILABLE).
+
         Args:
             search_term: Search term
             portal: Optional portal filter
@@ -203,23 +382,17 @@ class TenderQueries:
         pattern = f"%{search_term}%"
 
         if portal:
-            query = """
-            SELECT * FROM tenders
-            WHERE portal = ? AND (titel LIKE ? OR ausschreibungsstelle LIKE ?)
-            ORDER BY created_at DESC
-            LIMIT ?
-            """
-            rows = self.db.fetch_all(query, (portal, pattern, pattern, limit))
+            rows = self.db.fetch_all_dicts(
+                _SQL_SEARCH_TENDERS_LIKE_BY_PORTAL,
+                (portal, pattern, pattern, limit),
+            )
         else:
-            query = """
-            SELECT * FROM tenders
-            WHERE titel LIKE ? OR ausschreibungsstelle LIKE ?
-            ORDER BY created_at DESC
-            LIMIT ?
-            """
-            rows = self.db.fetch_all(query, (pattern, pattern, limit))
+            rows = self.db.fetch_all_dicts(
+                _SQL_SEARCH_TENDERS_LIKE,
+                (pattern, pattern, limit),
+            )
 
-        return [dict(row) for row in rows]
+        return rows
 
     def get_upcoming_deadlines(
         self,
@@ -237,16 +410,8 @@ class TenderQueries:
             List of tenders with upcoming deadlines
         """
         # This is a best-effort query since deadline format varies by portal
-        query = """
-        SELECT * FROM tenders
-        WHERE naechste_frist IS NOT NULL
-        AND naechste_frist != ''
-        ORDER BY created_at DESC
-        LIMIT 100
-        """
-
-        rows = self.db.fetch_all(query)
-        return [dict(row) for row in rows]
+        rows = self.db.fetch_all_dicts(_SQL_GET_UPCOMING_DEADLINES)
+        return rows
 
     def cleanup_old_tenders(
         self,
@@ -263,19 +428,28 @@ class TenderQueries:
         """
         cutoff = datetime.now() - timedelta(days=days)
 
-        query = """
-        DELETE FROM tenders
-        WHERE created_at < ?
-        """
-
-        cursor = self.db.execute(query, (cutoff,))
+        cursor = self.db.execute(_SQL_DELETE_TENDERS_BEFORE, (cutoff,))
         self.db.connect().commit()
 
         return cursor.rowcount
 
-    def vacuum_database(self) -> None:
-        """Run VACUUM to optimize database size."""
-        self.db.execute("VACUUM")
+    def maintenance(self) -> None:
+        """
+        Run lightweight routine maintenance.
+
+        Truncates the WAL file and refreshes query planner statistics.
+        Cheap enough to run after every scrape batch, unlike VACUUM.
+        """
+        self.db.execute(_SQL_WAL_CHECKPOINT)
+        self.db.execute(_SQL_OPTIMIZE)
+
+    def full_vacuum(self) -> None:
+        """
+        Run VACUUM to compact the database file.
+
+        Rewrites the whole file and blocks writers; for rare manual use.
+        """
+        self.db.execute(_SQL_VACUUM)
 
     def check_integrity(self) -> bool:
         """
@@ -284,5 +458,5 @@ class TenderQueries:
         Returns:
             True if database is healthy
         """
-        row = self.db.fetch_one("PRAGMA integrity_check")
+        row = self.db.fetch_one(_SQL_INTEGRITY_CHECK)
         return row and row[0] == "ok"
@@ -10,6 +10,11 @@ from typing import Dict, List, Optional, Any
 
 logger = logging.getLogger(__name__)
 
+# Outlook OlMailRecipientType values
+OL_TO = 1
+OL_CC = 2
+OL_BCC = 3
+
 
 class OutlookError(Exception):
     """Raised when Outlook operations fail."""
@@ -37,6 +42,8 @@ class OutlookSender:
         self.recipients_bcc = config.get("recipients", {}).get("bcc", [])
         self.subject_template = config.get("subject_template", "Ausschreibungen {date}")
         self.outlook = None
+        self._account = None
+        self._account_resolved = False
 
     def _get_outlook(self):
         """
@@ -51,17 +58,51 @@ class OutlookSender:
         if self.outlook is None:
             try:
                 import win32com.client
-                self.outlook = win32com.client.Dispatch("Outlook.Application")
-                logger.debug("Connected to Outlook")
             except ImportError:
                 raise OutlookError(
                     "pywin32 not installed. Install with: pip install pywin32"
                 )
+
+            try:
+                # Early binding (generated typelib) avoids per-call name lookups
+                self.outlook = win32com.client.gencache.EnsureDispatch(
+                    "Outlook.Application"
+                )
             except Exception as e:
-                raise OutlookError(f"Failed to connect to Outlook: {e}")
+                logger.debug(f"Early-bound Outlook dispatch failed, using late binding: {e}")
+                try:
+                    self.outlook = win32com.client.Dispatch("Outlook.Application")
+                except Exception as e:
+                    raise OutlookError(f"Failed to connect to Outlook: {e}")
+
+            logger.debug("Connected to Outlook")
 
         return self.outlook
 
+    def _get_account(self):
+        """
+        Get the Outlook account matching the configured sender address.
+
+        The lookup runs once per sender instance and is cached.
+
+        Returns:
+            Outlook account object or None to use the default account
+        """
+        if not self._account_resolved:
+            self._account_resolved = True
+            if self.sender:
+                try:
+                    for account in self._get_outlook().Session.Accounts:
+                        if account.SmtpAddress.lower() == self.sender.lower():
+                            self._account = account
+                            break
+                    else:
+                        logger.debug(f"No Outlook account for sender {self.sender}")
+                except Exception as e:
+                    logger.debug(f"Could not resolve sender account: {e}")
+
+        return self._account
+
     def send_email(
         self,
         subject: str,
@@ -95,13 +136,32 @@ class OutlookSender:
             cc_addrs = cc or self.recipients_cc
             bcc_addrs = bcc or self.recipients_bcc
 
-            mail.To = "; ".join(to_addrs) if to_addrs else ""
-            mail.CC = "; ".join(cc_addrs) if cc_addrs else ""
-            mail.BCC = "; ".join(bcc_addrs) if bcc_addrs else ""
+            recipients = mail.Recipients
+            for addrs, recipient_type in (
+                (to_addrs, OL_TO),
+                (cc_addrs, OL_CC),
+                (bcc_addrs, OL_BCC),
+            ):
+                for addr in addrs or ():
+                    recipient = recipients.Add(addr)
+                    recipient.Type = recipient_type
+
+            # Resolve all addresses in one pass; unresolved ones would be dropped
+            if not recipients.ResolveAll():
+                unresolved = [
+                    recipients.Item(i).Name
+                    for i in range(1, recipients.Count + 1)
+                    if not recipients.Item(i).Resolved
+                ]
+                raise OutlookError(f"Could not resolve recipients: {unresolved}")
 
             mail.Subject = subject
             mail.Body = body
 
+            account = self._get_account()
+            if account is not None:
+                mail.SendUsingAccount = account
+
             # Send
             mail.Send()
 
@@ -131,10 +191,12 @@ class OutlookSender:
         """
         from email_sender.templates import EmailTemplates
 
-        # Generate subject
-        today = datetime.now()
+        # Generate subject (sharing the date with the report header)
+        now = datetime.now()
+        ts_str = now.strftime(EmailTemplates.TIMESTAMP_FORMAT)
+        date_str = ts_str.partition(" ")[0]
         subject = self.subject_template.format(
-            date=today.strftime("%d.%m.%Y"),
+            date=date_str,
             count=len(tenders),
         )
 
@@ -142,12 +204,25 @@ class OutlookSender:
         body = EmailTemplates.format_tender_report(
             tenders=tenders,
             portal_status=portal_status,
-            timestamp=today,
+            timestamp=now,
+            timestamp_str=ts_str,
         )
 
         return self.send_email(subject=subject, body=body)
 
 
+# Shared sender for send_email_simple (keeps one Outlook COM session)
+_default_sender: Optional[OutlookSender] = None
+
+
+def _get_default_sender() -> OutlookSender:
+    """Get or create the module-level sender used by send_email_simple."""
+    global _default_sender
+    if _default_sender is None:
+        _default_sender = OutlookSender({})
+    return _default_sender
+
+
 def send_email_simple(
     to: List[str],
     subject: str,
@@ -167,21 +242,12 @@ def send_email_simple(
         True if sent successfully
     """
     try:
-        import win32com.client
-
-        outlook = win32com.client.Dispatch("Outlook.Application")
-        mail = outlook.CreateItem(0)
-
-        mail.To = "; ".join(to)
-        if cc:
-            mail.CC = "; ".join(cc)
-        mail.Subject = subject
-        mail.Body = body
-
-        mail.Send()
-        logger.info(f"Email sent: {subject}")
-        return True
-
-    except Exception as e:
-        logger.error(f"Failed to send email: {e}")
+        return _get_default_sender().send_email(
+            subject=subject,
+            body=body,
+            to=to,
+            cc=cc,
+        )
+    except OutlookError:
+        # Already logged by OutlookSender.send_email
         return False
@@ -5,43 +5,33 @@ Provides formatted email body generation for tender reports.
 """
 
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional
 
 
-class EmailTemplates:
-    """Email template generator for tender reports."""
-
-    # Header text
-    HEADER = """Dies ist eine automatisch generierte E-Mail.
+# Header text
+_HEADER = """Dies ist eine automatisch generierte E-Mail.
 Bitte nicht direkt antworten.
 Bei Rückfragen bitte an den Administrator wenden.
 
 Stand: {timestamp}
 """
 
-    # Portal list header
-    PORTAL_HEADER = """
+# Portal list header
+_PORTAL_HEADER = """
 ---------------------------------------------------------------
 Durchsuchte Portale ({total} durchsucht, {success} erfolgreich, {failed} fehlgeschlagen)
 ---------------------------------------------------------------
 """
 
-    # Results header
-    RESULTS_HEADER = """
+# Results header
+_RESULTS_HEADER = """
 ---------------------------------------------------------------
 NEUE AUSSCHREIBUNGEN ({count} gefunden)
 ---------------------------------------------------------------
 """
 
-    # No results message
-    NO_RESULTS = """
----------------------------------------------------------------
-Keine neuen Ausschreibungen gefunden
----------------------------------------------------------------
-"""
-
-    # Single tender format
-    TENDER_FORMAT = """
+# Single tender block (_format_tender builds the same text with an f-string)
+_TENDER_FORMAT = """
 Titel:\t {titel}
 Ausschreibungsstelle:\t {ausschreibungsstelle}
 Link:\t {link}
@@ -50,86 +40,157 @@ Veröffentlicht:\t {veroeffentlicht}
 Portal:\t {portal}
 """
 
-    # Footer
-    FOOTER = """
+# No results message
+_NO_RESULTS = """
+---------------------------------------------------------------
+Keine neuen Ausschreibungen gefunden
+---------------------------------------------------------------
+"""
+
+# Footer
+_FOOTER = """
 ---------------------------------------------------------------
 Tender Scraper System v2.0
 ---------------------------------------------------------------
 """
 
+# Error report section header
+_ERROR_HEADER = """
+---------------------------------------------------------------
+FEHLER BEI DER AUSFÜHRUNG
+---------------------------------------------------------------
+"""
+
+
+class EmailTemplates:
+    """Email template generator for tender reports."""
+
+    # Templates live at module level (read as fast globals in the format
+    # methods); kept here as aliases for existing callers
+    HEADER = _HEADER
+    PORTAL_HEADER = _PORTAL_HEADER
+    RESULTS_HEADER = _RESULTS_HEADER
+    TENDER_FORMAT = _TENDER_FORMAT
+    NO_RESULTS = _NO_RESULTS
+    FOOTER = _FOOTER
+
+    # Date format used in subjects; the header timestamp extends it, so the
+    # subject date is the part of a formatted timestamp before the space
+    DATE_FORMAT = "%d.%m.%Y"
+    TIMESTAMP_FORMAT = f"{DATE_FORMAT} %H:%M:%S"
+
+    @classmethod
+    def _format_header(
+        cls,
+        timestamp: datetime,
+        timestamp_str: Optional[str] = None,
+    ) -> str:
+        """
+        Format the report header.
+
+        Args:
+            timestamp: Timestamp of the report
+            timestamp_str: Timestamp already formatted with TIMESTAMP_FORMAT
+
+        Returns:
+            Formatted header
+        """
+        if timestamp_str is None:
+            timestamp_str = timestamp.strftime(cls.TIMESTAMP_FORMAT)
+        return _HEADER.format(timestamp=timestamp_str)
+
+    @staticmethod
+    def _format_tender(tender: Dict[str, Any]) -> str:
+        """
+        Format a single tender block.
+
+        Args:
+            tender: Tender dictionary
+
+        Returns:
+            Formatted tender block
+        """
+        get = tender.get
+        return (
+            f"\nTitel:\t {get('titel', '-')}"
+            f"\nAusschreibungsstelle:\t {get('ausschreibungsstelle', '-')}"
+            f"\nLink:\t {get('link', '-')}"
+            f"\nNächste Frist:\t {get('naechste_frist', '-')}"
+            f"\nVeröffentlicht:\t {get('veroeffentlicht', '-')}"
+            f"\nPortal:\t {get('portal', '-')}\n"
+        )
+
     @classmethod
     def format_tender_report(
         cls,
-        tenders: List[Dict[str, Any]],
+        tenders: Iterable[Dict[str, Any]],
         portal_status: Dict[str, Dict[str, Any]],
         timestamp: datetime,
+        timestamp_str: Optional[str] = None,
     ) -> str:
         """
         Format a complete tender report email body.
 
         Args:
-            tenders: List of tender dictionaries
+            tenders: Iterable of tender dictionaries (consumed in a single pass,
+                     so a streaming generator can be passed directly)
             portal_status: Dict mapping portal names to status info
                           Each entry should have: success (bool), records (int), error (str)
             timestamp: Timestamp of the report
+            timestamp_str: Timestamp already formatted with TIMESTAMP_FORMAT
+                           (e.g. shared with the subject); formatted here if None
 
         Returns:
             Formatted email body string
         """
-        parts = []
-
-        # Header
-        parts.append(cls.HEADER.format(
-            timestamp=timestamp.strftime("%d.%m.%Y %H:%M:%S")
-        ))
-
-        # Count tenders by portal from the actual tenders list
+        # Format tenders and count them by portal in one pass
+        format_tender = cls._format_tender
+        tender_parts = []
+        append_part = tender_parts.append
         tenders_by_portal: Dict[str, int] = {}
+        count_for = tenders_by_portal.get
         for tender in tenders:
             portal = tender.get("portal", "unknown")
-            tenders_by_portal[portal] = tenders_by_portal.get(portal, 0) + 1
+            tenders_by_portal[portal] = count_for(portal, 0) + 1
+            append_part(format_tender(tender))
 
         # Portal status summary
-        total = len(portal_status)
-        success = sum(1 for p in portal_status.values() if p.get("success", False))
+        portal_items = sorted(portal_status.items())
+        succeeded = [bool(status.get("success", False)) for _, status in portal_items]
+        total = len(portal_items)
+        success = sum(succeeded)
         failed = total - success
 
-        parts.append(cls.PORTAL_HEADER.format(
+        portal_header = _PORTAL_HEADER.format(
             total=total,
             success=success,
             failed=failed,
-        ))
-
-        # List each portal - use actual tender count from tenders list
-        for portal, status in sorted(portal_status.items()):
-            if status.get("success", False):
-                # Use count from actual tenders list, not from scraper status
-                records = tenders_by_portal.get(portal, 0)
-                parts.append(f"✓ {portal} - {records} Ergebnisse")
-            else:
-                error = status.get("error", "Unbekannter Fehler")
-                parts.append(f"✗ {portal} - Fehler: {error}")
-
-        # Results
-        if tenders:
-            parts.append(cls.RESULTS_HEADER.format(count=len(tenders)))
-
-            for tender in tenders:
-                parts.append(cls.TENDER_FORMAT.format(
-                    titel=tender.get("titel", "-"),
-                    ausschreibungsstelle=tender.get("ausschreibungsstelle", "-"),
-                    link=tender.get("link", "-"),
-                    naechste_frist=tender.get("naechste_frist", "-"),
-                    veroeffentlicht=tender.get("veroeffentlicht", "-"),
-                    portal=tender.get("portal", "-"),
-                ))
+        )
+
+        # List each portal - use actual tender count from tenders list,
+        # not from scraper status
+        portal_lines = "".join([
+            f"✓ {portal} - {count_for(portal, 0)} Ergebnisse\n"
+            if ok
+            else f"✗ {portal} - Fehler: {status.get('error', 'Unbekannter Fehler')}\n"
+            for (portal, status), ok in zip(portal_items, succeeded)
+        ])
+
+        # Results - the only section long enough to be worth a join
+        # (a single join is several times faster than io.StringIO writes)
+        if tender_parts:
+            results = (
+                _RESULTS_HEADER.format(count=len(tender_parts))
+                + "\n"
+                + "\n".join(tender_parts)
+            )
         else:
-            parts.append(cls.NO_RESULTS)
+            results = _NO_RESULTS
 
-        # Footer
-        parts.append(cls.FOOTER)
-
-        return "\n".join(parts)
+        return (
+            f"{cls._format_header(timestamp, timestamp_str)}\n{portal_header}\n"
+            f"{portal_lines}{results}\n{_FOOTER}"
+        )
 
     @classmethod
     def format_error_report(
@@ -149,22 +210,16 @@ Tender Scraper System v2.0
         """
         parts = []
 
-        parts.append(cls.HEADER.format(
-            timestamp=timestamp.strftime("%d.%m.%Y %H:%M:%S")
-        ))
+        parts.append(cls._format_header(timestamp))
 
-        parts.append("""
----------------------------------------------------------------
-FEHLER BEI DER AUSFÜHRUNG
----------------------------------------------------------------
-""")
+        parts.append(_ERROR_HEADER)
 
         for error in errors:
             portal = error.get("portal", "Unknown")
             msg = error.get("error", "Unknown error")
             parts.append(f"\n{portal}:\n  {msg}\n")
 
-        parts.append(cls.FOOTER)
+        parts.append(_FOOTER)
 
         return "\n".join(parts)
 
@@ -189,9 +244,7 @@ FEHLER BEI DER AUSFÜHRUNG
         parts = []
 
         # Header
-        parts.append(cls.HEADER.format(
-            timestamp=timestamp.strftime("%d.%m.%Y %H:%M:%S")
-        ))
+        parts.append(cls._format_header(timestamp))
 
         # Portal list
         parts.append("\n********************************************************")
@@ -202,18 +255,11 @@ FEHLER BEI DER AUSFÜHRUNG
 
         # Results
         if tenders:
-            for tender in tenders:
-                parts.append(cls.TENDER_FORMAT.format(
-                    titel=tender.get("titel", "-"),
-                    ausschreibungsstelle=tender.get("ausschreibungsstelle", "-"),
-                    link=tender.get("link", "-"),
-                    naechste_frist=tender.get("naechste_frist", "-"),
-                    veroeffentlicht=tender.get("veroeffentlicht", "-"),
-                    portal=tender.get("portal", "-"),
-                ))
+            format_tender = cls._format_tender
+            parts.extend([format_tender(tender) for tender in tenders])
         else:
             parts.append("\nKeine neuen Ausschreibungen gefunden.\n")
 
-        parts.append(cls.FOOTER)
+        parts.append(_FOOTER)
 
         return "\n".join(parts)
@@ -13,6 +13,7 @@ Options:
     --list-purposes     List available purposes and exit
     --config PATH       Path to config file (default: config/config.yaml)
     --scrapers LIST     Comma-separated scraper names (default: all enabled)
+    --max-workers N     Scrapers to run in parallel (default: scraping.max_workers)
     --skip-email        Skip sending email notification
     --dry-run           Don't save to database or send email
     --verbose           Enable debug logging
@@ -22,28 +23,33 @@ Purposes are auto-discovered from config/Suchbegriffe_*.txt files.
 Each purpose has its own keywords, email recipients, database, and log file.
 """
 
+from __future__ import annotations
+
 import argparse
+import copy
+import logging
+import os
 import random
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-import yaml
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Iterable, Iterator, List, Optional
+from urllib.parse import urlparse
 
-from database.db import Database
-from email_sender.sender import OutlookSender, OutlookError
-from email_sender.templates import EmailTemplates
-from scrapers.base import TenderResult, ScraperError
-from scrapers.registry import (
-    discover_scrapers,
-    get_scraper,
-    get_enabled_scrapers,
-    create_scraper,
-)
-from utils.keywords import KeywordMatcher
-from utils.logging_config import setup_logging, get_logger
+# Only the standard library is imported at module level; yaml and the
+# project packages (database, email_sender, utils and scrapers, which pulls
+# in Selenium) are imported where they are used, so that --help,
+# --list-purposes and argument errors exit quickly
+if TYPE_CHECKING:
+    from database.db import Database
+    from scrapers.base import TenderResult
+    from utils.keywords import KeywordMatcher
 
 
 # =============================================================================
@@ -51,6 +57,25 @@ from utils.logging_config import setup_logging, get_logger
 # =============================================================================
 
 
+# File name prefix of the per-purpose keyword lists in config/
+_KEYWORDS_PREFIX = "Suchbegriffe_"
+
+
+@lru_cache(maxsize=1)
+def _scan_config_dir() -> FrozenSet[str]:
+    """
+    List the file names in config/ once per process.
+
+    Returns:
+        Names of the entries in config/ (empty if the directory is missing)
+    """
+    try:
+        with os.scandir("config") as entries:
+            return frozenset(entry.name for entry in entries)
+    except FileNotFoundError:
+        return frozenset()
+
+
 def discover_purposes() -> List[str]:
     """
     Discover available purposes from config/Suchbegriffe_*.txt files.
@@ -58,15 +83,12 @@ def discover_purposes() -> List[str]:
     Returns:
         Sorted list of purpose names (e.g., ['BA', 'NORM'])
     """
-    config_dir = Path("config")
-    purposes = []
-
-    for f in config_dir.glob("Suchbegriffe_*.txt"):
-        # Extract purpose name: Suchbegriffe_BA.txt -> BA
-        purpose = f.stem.replace("Suchbegriffe_", "")
-        purposes.append(purpose)
-
-    return sorted(purposes)
+    # Extract purpose name: Suchbegriffe_BA.txt -> BA
+    return sorted(
+        name[len(_KEYWORDS_PREFIX):-4]
+        for name in _scan_config_dir()
+        if name.startswith(_KEYWORDS_PREFIX) and name.endswith(".txt")
+    )
 
 
 def get_purpose_paths(purpose: str) -> Dict[str, str]:
@@ -98,18 +120,53 @@ def validate_purpose(purpose: str) -> Optional[str]:
         Error message if invalid, None if valid
     """
     paths = get_purpose_paths(purpose)
+    config_files = _scan_config_dir()
 
     # Check keywords file
-    if not Path(paths["keywords_file"]).exists():
+    if Path(paths["keywords_file"]).name not in config_files:
         return f"Keywords file not found: {paths['keywords_file']}"
 
     # Check email file
-    if not Path(paths["email_file"]).exists():
+    if Path(paths["email_file"]).name not in config_files:
         return f"Email config not found: {paths['email_file']}"
 
     return None
 
 
+@lru_cache(maxsize=32)
+def _parse_yaml(path: str) -> Any:
+    """
+    Parse a YAML file once per process.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed YAML document (shared; use _load_yaml for a private copy)
+    """
+    import yaml
+
+    # Use the libyaml C parser when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    # Parse from one in-memory buffer rather than a stream the parser would
+    # pull from in small reads (PyYAML decodes UTF-8 bytes itself)
+    return yaml.load(Path(path).read_bytes(), Loader=loader)
+
+
+def _load_yaml(path: Path) -> Any:
+    """
+    Load a YAML file, reusing the parsed document on repeated calls.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Deep copy of the parsed YAML document, safe for the caller to modify
+    """
+    return copy.deepcopy(_parse_yaml(str(path)))
+
+
 def load_purpose_email_config(purpose: str, base_config: Dict[str, Any]) -> Dict[str, Any]:
     """
     Load email configuration for a specific purpose.
@@ -129,8 +186,7 @@ def load_purpose_email_config(purpose: str, base_config: Dict[str, Any]) -> Dict
     if not email_file.exists():
         raise FileNotFoundError(f"Email config not found for purpose '{purpose}': {email_file}")
 
-    with open(email_file, "r", encoding="utf-8") as f:
-        purpose_config = yaml.safe_load(f)
+    purpose_config = _load_yaml(email_file)
 
     # Start with base config and override with purpose-specific settings
     merged = base_config.copy()
@@ -162,8 +218,7 @@ def load_config(config_path: str) -> Dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    return _load_yaml(path)
 
 
 def load_email_config(config: Dict[str, Any]) -> Dict[str, Any]:
@@ -182,54 +237,65 @@ def load_email_config(config: Dict[str, Any]) -> Dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"Email config file not found: {email_config_path}")
 
-    with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    return _load_yaml(path)
+
+
+def iter_keyword_matches(
+    results: Iterable["TenderResult"],
+    matcher: KeywordMatcher,
+    match_fields: List[str],
+) -> Iterator["TenderResult"]:
+    """
+    Lazily yield the tender results that match a keyword.
+
+    Args:
+        results: Iterable of TenderResult objects
+        matcher: KeywordMatcher instance
+        match_fields: List of field names to match against
+
+    Yields:
+        Matching TenderResult objects with suchbegriff set
+    """
+    getters = None
+    get_first_match = matcher.get_first_match
+
+    for result in results:
+        if getters is None:
+            # Build the field getters once; unknown field names are ignored
+            getters = [attrgetter(field) for field in match_fields if hasattr(result, field)]
+
+        # Get the matching keyword for the suchbegriff field; fields are read
+        # lazily, so later ones are skipped once an earlier one matches
+        matching_kw = get_first_match(getter(result) for getter in getters)
+        if matching_kw is None:
+            continue
+
+        # Create new result with suchbegriff set
+        yield replace(result, suchbegriff=matching_kw)
 
 
 def filter_by_keywords(
-    results: List[TenderResult],
+    results: Iterable["TenderResult"],
     matcher: KeywordMatcher,
     match_fields: List[str],
-) -> List[TenderResult]:
+) -> List["TenderResult"]:
     """
     Filter tender results by keywords.
 
     Args:
-        results: List of TenderResult objects
+        results: Iterable of TenderResult objects
         matcher: KeywordMatcher instance
         match_fields: List of field names to match against
 
     Returns:
         Filtered list of TenderResult objects
     """
-    filtered = []
-
-    for result in results:
-        # Build list of field values to check
-        fields_to_check = []
-        for field in match_fields:
-            value = getattr(result, field, None)
-            if value:
-                fields_to_check.append(value)
-
-        # Check if any field matches
-        if matcher.matches_any_field(fields_to_check):
-            # Get the matching keyword for the suchbegriff field
-            matching_kw = matcher.get_first_match(fields_to_check)
-            if matching_kw:
-                # Create new result with suchbegriff set
-                result_dict = result.to_dict()
-                result_dict["suchbegriff"] = matching_kw
-                result = TenderResult(**result_dict)
-            filtered.append(result)
-
-    return filtered
+    return list(iter_keyword_matches(results, matcher, match_fields))
 
 
 def run_scraper(
     portal_name: str,
     config: Dict[str, Any],
-    db: Database,
     matcher: KeywordMatcher,
     match_fields: List[str],
     dry_run: bool,
@@ -238,29 +304,36 @@ def run_scraper(
     """
     Run a single scraper with error isolation.
 
+    Nothing is written here; matched tenders are returned under "tenders"
+    (with the local start/end times under "scrape_start"/"scrape_end") so
+    that save_scraped_tenders can store the whole run, scrape history
+    included, in one transaction.
+
     Args:
         portal_name: Name of the portal to scrape
         config: Configuration dictionary
-        db: Database instance
         matcher: KeywordMatcher instance
         match_fields: Fields to match keywords against
         dry_run: If True, don't save to database
         logger: Logger instance
 
     Returns:
-        Status dictionary with success, records_found, records_new, error
+        Status dictionary with success, records_found, records_new, error,
+        scrape_start, scrape_end and tenders
     """
+    from scrapers.base import ScraperError
+    from scrapers.registry import create_scraper
+
     status = {
         "success": False,
         "records_found": 0,
         "records_new": 0,
         "error": None,
+        "scrape_start": datetime.now(),
+        "scrape_end": None,
+        "tenders": [],
     }
 
-    scrape_id = None
-    if not dry_run:
-        scrape_id = db.log_scrape_start(portal_name)
-
     try:
         # Create scraper instance
         scraper = create_scraper(portal_name, config)
@@ -271,18 +344,17 @@ def run_scraper(
         results = scraper.run()
         status["records_found"] = len(results)
 
-        # Filter by keywords
-        filtered = filter_by_keywords(results, matcher, match_fields)
-        logger.info(f"{portal_name}: {len(results)} total, {len(filtered)} matched keywords")
-
-        # Save to database
-        if not dry_run and filtered:
-            tenders_dicts = [r.to_dict() for r in filtered]
-            new_count = db.insert_tenders(tenders_dicts)
-            status["records_new"] = new_count
-            logger.info(f"{portal_name}: {new_count} new tenders saved")
-        elif dry_run and filtered:
-            status["records_new"] = len(filtered)
+        # Filter by keywords, converting matches for the run-wide insert in
+        # the same pass (no intermediate list of filtered results)
+        matches = iter_keyword_matches(results, matcher, match_fields)
+        if dry_run:
+            matched = status["records_new"] = sum(1 for _ in matches)
+        else:
+            status["tenders"] = [r.to_dict() for r in matches]
+            matched = len(status["tenders"])
+        logger.info(
+            "%s: %d total, %d matched keywords", portal_name, len(results), matched
+        )
 
         status["success"] = True
 
@@ -295,18 +367,195 @@ def run_scraper(
         logger.error(f"{portal_name} unexpected error: {e}", exc_info=True)
 
     finally:
-        if scrape_id and not dry_run:
-            db.log_scrape_end(
-                scrape_id=scrape_id,
-                status="success" if status["success"] else "failure",
-                records_found=status["records_found"],
-                records_new=status["records_new"],
-                error_message=status["error"],
-            )
+        status["scrape_end"] = datetime.now()
 
     return status
 
 
+def save_scraped_tenders(
+    portal_status: Dict[str, Dict[str, Any]],
+    db: Database,
+    logger,
+) -> None:
+    """
+    Save the scrape history and matched tenders of all scrapers in one
+    transaction.
+
+    Fills in records_new of each portal's status and drops the buffered
+    tenders from the status dictionaries.
+
+    Args:
+        portal_status: Status dictionary per portal from run_scrapers
+        db: Database instance
+        logger: Logger instance
+    """
+    scrapes = []
+    for portal_name, status in portal_status.items():
+        tenders = status.pop("tenders", None)
+        if status["scrape_start"] is None:
+            continue
+        scrapes.append({
+            "portal": portal_name,
+            "scrape_start": status["scrape_start"],
+            "scrape_end": status["scrape_end"],
+            "status": "success" if status["success"] else "failure",
+            "records_found": status["records_found"],
+            "error_message": status["error"],
+            "tenders": tenders,
+        })
+
+    if not scrapes:
+        return
+
+    try:
+        new_counts = db.log_scrapes(scrapes)
+    except Exception as e:
+        logger.error(f"Failed to save tenders: {e}", exc_info=True)
+        return
+
+    for scrape, new_count in zip(scrapes, new_counts):
+        portal_status[scrape["portal"]]["records_new"] = new_count
+        if scrape["tenders"]:
+            logger.info("%s: %d new tenders saved", scrape["portal"], new_count)
+
+
+def get_portal_root(portal_name: str) -> str:
+    """
+    Get the root domain a scraper talks to.
+
+    Args:
+        portal_name: Name of the portal
+
+    Returns:
+        Root domain of the scraper's PORTAL_URL (e.g. 'landbw.de'),
+        or the portal name if it has none
+    """
+    from scrapers.registry import get_scraper
+
+    scraper_cls = get_scraper(portal_name)
+    host = urlparse(getattr(scraper_cls, "PORTAL_URL", "")).hostname
+    if not host:
+        return portal_name
+    return ".".join(host.split(".")[-2:])
+
+
+def run_scrapers(
+    scrapers_to_run: List[str],
+    config: Dict[str, Any],
+    matcher: KeywordMatcher,
+    match_fields: List[str],
+    dry_run: bool,
+    logger,
+    max_workers: Optional[int] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run scrapers concurrently on a bounded thread pool.
+
+    Scrapers for different portals overlap their network waits. Scrapers
+    sharing a root domain are serialized and paced: each waits until a
+    random delay has passed since the previous one on that host finished,
+    to avoid detection. The delay range is scraping.delay_min/delay_max,
+    overridable per portal under scraping.portal_delays.
+
+    Args:
+        scrapers_to_run: Names of the portals to scrape
+        config: Configuration dictionary
+        matcher: KeywordMatcher instance
+        match_fields: Fields to match keywords against
+        dry_run: If True, don't save to database
+        logger: Logger instance
+        max_workers: Number of parallel scrapers (default: scraping.max_workers)
+
+    Returns:
+        Status dictionary per portal, in the order of scrapers_to_run
+    """
+    scraping_config = config.get("scraping", {})
+    default_delay = (
+        scraping_config.get("delay_min", 6),
+        scraping_config.get("delay_max", 10),
+    )
+    portal_delays = scraping_config.get("portal_delays") or {}
+    delays = {
+        name: (
+            portal_delays.get(name, {}).get("delay_min", default_delay[0]),
+            portal_delays.get(name, {}).get("delay_max", default_delay[1]),
+        )
+        for name in scrapers_to_run
+    }
+    if max_workers is None:
+        max_workers = scraping_config.get("max_workers", 4)
+    max_workers = max(1, min(max_workers, len(scrapers_to_run)))
+
+    # One lock and last-finished time (monotonic) per root domain
+    roots = {name: get_portal_root(name) for name in scrapers_to_run}
+    host_locks = {root: threading.Lock() for root in roots.values()}
+    host_last_done: Dict[str, float] = {}
+
+    def scrape_portal(portal_name: str) -> Dict[str, Any]:
+        root = roots[portal_name]
+        with host_locks[root]:
+            # Only pace scrapers that hit a host another one just left
+            last_done = host_last_done.get(root)
+            if last_done is not None:
+                wait = last_done + random.uniform(*delays[portal_name]) - time.monotonic()
+                if wait > 0:
+                    logger.info("Waiting %.0fs before %s on %s...", wait, portal_name, root)
+                    time.sleep(wait)
+
+            logger.info("Starting %s...", portal_name)
+            status = run_scraper(
+                portal_name=portal_name,
+                config=config,
+                matcher=matcher,
+                match_fields=match_fields,
+                dry_run=dry_run,
+                logger=logger,
+            )
+            host_last_done[root] = time.monotonic()
+
+        return status
+
+    logger.info(f"Running {len(scrapers_to_run)} scrapers with {max_workers} workers")
+
+    results: Dict[str, Dict[str, Any]] = {}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scraper") as executor:
+        futures = {
+            executor.submit(scrape_portal, portal_name): portal_name
+            for portal_name in scrapers_to_run
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            portal_name = futures[future]
+            try:
+                status = future.result()
+            except Exception as e:
+                # run_scraper isolates scraper errors; this only catches
+                # failures around it, so one portal cannot abort the whole
+                # run (such a crash leaves no scrape history row)
+                logger.error(f"{portal_name} worker failed: {e}", exc_info=True)
+                status = {
+                    "success": False,
+                    "records_found": 0,
+                    "records_new": 0,
+                    "error": str(e),
+                    "scrape_start": None,
+                    "scrape_end": None,
+                    "tenders": [],
+                }
+            results[portal_name] = status
+
+            # Show progress after each scraper
+            logger.info(
+                "[%d/%d] %s: %d found, %d matched",
+                done,
+                len(scrapers_to_run),
+                portal_name,
+                status["records_found"],
+                len(status["tenders"]) or status["records_new"],
+            )
+
+    return {name: results[name] for name in scrapers_to_run}
+
+
 def send_report_email(
     tenders: List[Dict[str, Any]],
     portal_status: Dict[str, Dict[str, Any]],
@@ -329,11 +578,16 @@ def send_report_email(
     Returns:
         True if sent successfully
     """
-    # Generate subject
-    today = datetime.now()
+    from email_sender.sender import OutlookError, OutlookSender
+    from email_sender.templates import EmailTemplates
+
+    # Generate subject (sharing the date with the report header)
+    now = datetime.now()
+    ts_str = now.strftime(EmailTemplates.TIMESTAMP_FORMAT)
+    date_str = ts_str.partition(" ")[0]
     subject_template = email_config.get("subject_template", "Ausschreibungen {date}")
     subject = subject_template.format(
-        date=today.strftime("%d.%m.%Y"),
+        date=date_str,
         count=len(tenders),
     )
 
@@ -341,13 +595,18 @@ def send_report_email(
     body = EmailTemplates.format_tender_report(
         tenders=tenders,
         portal_status=portal_status,
-        timestamp=today,
+        timestamp=now,
+        timestamp_str=ts_str,
     )
 
+    # Recipients as logged in email_history (same for success and failure)
+    recipients = "; ".join(email_config.get("recipients", {}).get("to", []))
+
     if dry_run:
         logger.info("DRY RUN: Would send email")
-        logger.info(f"Subject: {subject}")
-        logger.info(f"Body preview:\n{body[:500]}...")
+        logger.info("Subject: %s", subject)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Body preview:\n%s...", body[:500])
         return True
 
     try:
@@ -355,7 +614,6 @@ def send_report_email(
         sender.send_email(subject=subject, body=body)
 
         # Log email sent
-        recipients = "; ".join(email_config.get("recipients", {}).get("to", []))
         db.log_email_sent(
             recipients=recipients,
             subject=subject,
@@ -370,7 +628,6 @@ def send_report_email(
         logger.error(f"Failed to send email: {e}")
 
         # Log failed email
-        recipients = "; ".join(email_config.get("recipients", {}).get("to", []))
         db.log_email_sent(
             recipients=recipients,
             subject=subject,
@@ -407,6 +664,11 @@ def main():
         "--scrapers",
         help="Comma-separated scraper names (default: all enabled)",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        help="Number of scrapers to run in parallel (default: scraping.max_workers)",
+    )
     parser.add_argument(
         "--skip-email",
         action="store_true",
@@ -467,6 +729,12 @@ def main():
             print(f"Available purposes: {', '.join(purposes)}", file=sys.stderr)
         sys.exit(1)
 
+    # Arguments are valid; load the rest of the system
+    from database.db import Database
+    from database.queries import TenderQueries
+    from utils.keywords import KeywordMatcher
+    from utils.logging_config import flush_logging, get_logger, setup_logging
+
     # Get purpose-specific paths
     purpose_paths = get_purpose_paths(purpose)
 
@@ -498,6 +766,21 @@ def main():
     if args.dry_run:
         logger.info("DRY RUN MODE - No database writes or emails")
 
+    # Load email settings before scraping, so config errors surface before
+    # a long scrape rather than after it
+    email_enabled = config.get("email", {}).get("enabled", True)
+    send_empty = True  # Default to send even if no tenders
+
+    try:
+        # Load base email config, then merge with purpose-specific recipients
+        base_email_config = load_email_config(config)
+        email_config = load_purpose_email_config(purpose, base_email_config)
+        send_empty = email_config.get("send_empty_report", True)
+        logger.info(f"Email recipients: {email_config.get('recipients', {}).get('to', [])}")
+    except FileNotFoundError as e:
+        logger.warning(f"Email config not found: {e}")
+        email_enabled = False
+
     # Initialize database (purpose-specific database)
     db = Database(purpose_paths["database_path"])
     db.initialize()
@@ -514,8 +797,8 @@ def main():
         exclusions=exclusions,
     )
 
-    # Discover scrapers
-    discover_scrapers()
+    # Scraper modules are imported on demand by name (see get_scraper)
+    from scrapers.registry import get_enabled_scrapers
 
     # Determine which scrapers to run
     if args.scrapers:
@@ -525,47 +808,25 @@ def main():
 
     logger.info(f"Scrapers to run: {scrapers_to_run}")
 
-    # Get scraping settings
-    scraping_config = config.get("scraping", {})
-    delay_min = scraping_config.get("delay_min", 6)
-    delay_max = scraping_config.get("delay_max", 10)
-
     # Run scrapers
-    portal_status = {}
-    total_found = 0
-    total_new = 0
-
-    for i, portal_name in enumerate(scrapers_to_run):
-        logger.info(f"[{i + 1}/{len(scrapers_to_run)}] Starting {portal_name}...")
-
-        status = run_scraper(
-            portal_name=portal_name,
-            config=config,
-            db=db,
-            matcher=matcher,
-            match_fields=match_fields,
-            dry_run=args.dry_run,
-            logger=logger,
-        )
+    portal_status = run_scrapers(
+        scrapers_to_run=scrapers_to_run,
+        config=config,
+        matcher=matcher,
+        match_fields=match_fields,
+        dry_run=args.dry_run,
+        logger=logger,
+        max_workers=args.max_workers,
+    )
+    if not args.dry_run:
+        save_scraped_tenders(portal_status, db, logger)
 
-        portal_status[portal_name] = status
+    # Summary (one pass; records_new is final once the tenders are saved)
+    total_found = total_new = successful = 0
+    for status in portal_status.values():
         total_found += status["records_found"]
         total_new += status["records_new"]
-
-        # Show progress after each scraper
-        logger.info(
-            f"[{i + 1}/{len(scrapers_to_run)}] {portal_name}: "
-            f"{status['records_found']} found, {status['records_new']} matched"
-        )
-
-        # Add delay between scrapers (except for last one)
-        if i < len(scrapers_to_run) - 1:
-            delay = random.uniform(delay_min, delay_max)
-            logger.info(f"Waiting {delay:.0f}s before next scraper...")
-            time.sleep(delay)
-
-    # Summary
-    successful = sum(1 for s in portal_status.values() if s["success"])
+        successful += status["success"]
     failed = len(portal_status) - successful
 
     logger.info("-" * 60)
@@ -574,24 +835,14 @@ def main():
     logger.info(f"Scrapers: {successful} succeeded, {failed} failed")
     logger.info(f"Records: {total_found} found, {total_new} new")
 
+    # Write the buffered scraping log to disk before the email step
+    flush_logging()
+
     # Get tenders that haven't been sent by email yet
     unsent_tenders = db.get_unsent_tenders()
     logger.info(f"Unsent tenders: {len(unsent_tenders)}")
 
     # Send email if enabled and not skipped
-    email_enabled = config.get("email", {}).get("enabled", True)
-    send_empty = True  # Default to send even if no tenders
-
-    try:
-        # Load base email config, then merge with purpose-specific recipients
-        base_email_config = load_email_config(config)
-        email_config = load_purpose_email_config(purpose, base_email_config)
-        send_empty = email_config.get("send_empty_report", True)
-        logger.info(f"Email recipients: {email_config.get('recipients', {}).get('to', [])}")
-    except FileNotFoundError as e:
-        logger.warning(f"Email config not found: {e}")
-        email_enabled = False
-
     should_send = (
         email_enabled
         and not args.skip_email
@@ -622,8 +873,12 @@ def main():
     else:
         logger.info("Email disabled in config")
 
+    # Keep the WAL bounded and planner statistics fresh after the batch
+    if not args.dry_run:
+        TenderQueries(db).maintenance()
+
     # Close database
-    db.close()
+    db.shutdown()
 
     logger.info("=" * 60)
     logger.info(f"Tender Scraper System finished - Purpose: {purpose}")
@@ -7,11 +7,14 @@ Austria's leading platform for public procurement.
 
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlencode
 
-from bs4 import BeautifulSoup
+from lxml.etree import XPath
+from lxml.html import HtmlElement
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -19,7 +22,118 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
 from scrapers.base import BaseScraper, TenderResult, ScraperError
 from scrapers.registry import register_scraper
-from scrapers.utils import clean_text, normalize_url
+from scrapers.utils import clean_text, compile_css, normalize_url, parse_dom, select_one
+
+
+# Result page selectors, compiled to XPath once (page-level ones as
+# (selector, xpath) pairs for debug logging)
+_ITEM_SELECTORS = [
+    (selector, compile_css(selector))
+    for selector in (
+        ".search-result-item",
+        ".tender-item",
+        ".result-item",
+        ".ausschreibung-item",
+        "[class*='SearchResult']",
+        "[class*='TenderItem']",
+        "article.tender",
+        ".card.tender",
+    )
+]
+_TABLE_SELECTORS = [
+    (selector, compile_css(selector))
+    for selector in (
+        "table.search-results tbody tr",
+        "table.tender-list tbody tr",
+        "table tbody tr",
+    )
+]
+_CONTENT_SELECTORS = [
+    compile_css(selector)
+    for selector in (
+        "div[class*='tender']",
+        "div[class*='result']",
+        "div[class*='ausschreibung']",
+        "article",
+    )
+]
+_LINKS_WITH_HREF = compile_css("a[href]")
+_NEXT_LINK = compile_css("a[rel='next']")
+
+# Selectors within a result item or table row
+_TITLE_SELECTORS = [
+    compile_css(selector, relative=True)
+    for selector in (
+        "h2 a", "h3 a", "h4 a",
+        ".title a", ".titel a",
+        "a.title", "a.titel",
+        ".search-result-title a",
+        "a[class*='title']",
+    )
+]
+_HEADING_SELECTORS = [
+    compile_css(selector, relative=True)
+    for selector in ("h2", "h3", "h4", ".title", ".titel")
+]
+_ORG_SELECTORS = [
+    compile_css(selector, relative=True)
+    for selector in (
+        ".organization", ".organisation", ".issuer",
+        ".ausschreibungsstelle", ".auftraggeber",
+        "[class*='organization']", "[class*='issuer']",
+    )
+]
+_LINK_WITH_HREF = compile_css("a[href]", relative=True)
+_LINK = compile_css("a", relative=True)
+_CELLS = compile_css("td", relative=True)
+
+# Regex patterns used per result, compiled once
+_DATE_RE = re.compile(r"\d{1,2}\.\d{1,2}\.\d{4}")
+_PAGE_PARAM_RE = re.compile(r"[?&](page|seite|p)=(\d+)", re.IGNORECASE)
+# Date label and the first date after it, within a short distance and
+# before any other label; "frist" also matches compounds like "Angebotsfrist"
+_DATE_LABEL_RE = re.compile(
+    r"(frist|deadline|veröffentlicht|published)"
+    r"(?:(?!frist|deadline|veröffentlicht|published).){0,80}?"
+    r"(\d{1,2}\.\d{1,2}\.\d{4})",
+    re.IGNORECASE | re.DOTALL,
+)
+_TENDER_HREF_RE = re.compile(r"detail|ausschreibung|tender|vergabe|notice", re.IGNORECASE)
+_ID_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"[?&]id=(\d+)",
+        r"/detail/(\d+)",
+        r"/ausschreibung/(\d+)",
+        r"/tender/(\d+)",
+        r"/(\d{6,})",  # 6+ digit number in path
+    )
+]
+
+
+@lru_cache(maxsize=4096)
+def _extract_id(url: str) -> str:
+    """
+    Extract tender ID from URL.
+
+    Cached because the fallback strategies revisit the same links.
+
+    Args:
+        url: URL string
+
+    Returns:
+        Extracted ID or empty string
+    """
+    if not url:
+        return ""
+
+    # Try various ID patterns
+    for pattern in _ID_PATTERNS:
+        match = pattern.search(url)
+        if match:
+            return match.group(1)
+
+    return ""
 
 
 @register_scraper
@@ -34,6 +148,12 @@ class AuftragATScraper(BaseScraper):
     # Maximum pages to scrape
     MAX_PAGES = 5
 
+    # Concurrent HTTP requests when fetching further result pages
+    PAGE_FETCH_WORKERS = 3
+
+    # Item selector that matched last, tried first on the following pages
+    _item_selector: Optional[Tuple[str, XPath]] = None
+
     # Cookie consent selectors specific to this portal
     COOKIE_SELECTORS = [
         "#cookie-accept",
@@ -55,6 +175,7 @@ class AuftragATScraper(BaseScraper):
         """
         all_results = []
         seen_ids = set()
+        now = datetime.now()  # Search time shared by all results of this scrape
 
         try:
             # Navigate to search page
@@ -62,23 +183,17 @@ class AuftragATScraper(BaseScraper):
             self.driver.get(self.PORTAL_URL)
 
             # Wait for page load
-            time.sleep(4)
-
-            # Accept cookies
-            self.accept_cookies()
-            time.sleep(2)
-
-            # Wait for content to load (JavaScript-rendered)
             try:
                 WebDriverWait(self.driver, 20).until(
                     lambda d: d.execute_script("return document.readyState") == "complete"
                 )
-                # Additional wait for dynamic content
-                time.sleep(3)
             except TimeoutException:
                 self.logger.warning("Page load timeout, proceeding anyway")
 
-            # Try to wait for results container
+            # Accept cookies
+            self.accept_cookies()
+
+            # Wait for results container (JavaScript-rendered)
             result_selectors = [
                 ".search-results",
                 ".tender-list",
@@ -90,32 +205,30 @@ class AuftragATScraper(BaseScraper):
                 "[class*='ausschreibung']",
             ]
 
-            for selector in result_selectors:
-                try:
-                    WebDriverWait(self.driver, 5).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    self.logger.debug(f"Found results with selector: {selector}")
-                    break
-                except TimeoutException:
-                    continue
+            results_selector = self.wait_for_any_selector(result_selectors, timeout=10)
+            if results_selector:
+                self.logger.debug(f"Found results with selector: {results_selector}")
 
             # Scrape pages
+            prefetched = None  # Results per page, if fetched over HTTP
             for page in range(1, self.MAX_PAGES + 1):
                 self.logger.debug(f"Scraping page {page}")
 
-                # Get page HTML
-                html = self.driver.page_source
-                soup = BeautifulSoup(html, "lxml")
+                if prefetched is not None:
+                    results = prefetched.get(page, [])
+                else:
+                    # Get page HTML
+                    html = self.driver.page_source
+                    tree = parse_dom(html)
 
-                # Parse results
-                results = self._parse_results(soup)
+                    # Parse results
+                    results = self._parse_results(tree, now)
 
                 if not results:
                     if page == 1:
                         self.logger.warning("No results found on first page")
                         # Save debug HTML
-                        self._save_debug_html(soup)
+                        self._save_debug_html(html)
                     break
 
                 # Deduplicate
@@ -132,10 +245,14 @@ class AuftragATScraper(BaseScraper):
 
                 # Try next page
                 if page < self.MAX_PAGES:
-                    if not self._click_next_page():
+                    if page == 1:
+                        # Fetch the remaining pages at once if they have URLs
+                        prefetched = self._fetch_remaining_pages(tree, now)
+                        if prefetched is not None:
+                            continue
+                    if not self._click_next_page(results_selector):
                         self.logger.debug("No more pages available")
                         break
-                    time.sleep(3)
 
             self.logger.info(f"Found {len(all_results)} total tenders")
 
@@ -145,13 +262,80 @@ class AuftragATScraper(BaseScraper):
 
         return all_results
 
-    def _click_next_page(self) -> bool:
+    def _fetch_remaining_pages(
+        self, tree: HtmlElement, now: datetime
+    ) -> Optional[Dict[int, List[TenderResult]]]:
         """
-        Click the next page button.
+        Fetch pages 2..MAX_PAGES concurrently over plain HTTP.
+
+        Only possible when the first page's next link addresses pages by
+        a URL parameter; clicking through the pages in the browser remains
+        the fallback.
+
+        Args:
+            tree: lxml element tree of the first page
+            now: Search timestamp for the results
+
+        Returns:
+            Parsed results per page number, or None if the pages cannot be
+            fetched this way
+        """
+        # Fetched pages are only recognised by the item or row selectors,
+        # so the first page must have matched them too
+        if not self._parse_structured_results(tree, now):
+            return None
+
+        next_link = select_one(tree, _NEXT_LINK)
+        if next_link is None:
+            return None
+
+        next_url = normalize_url(next_link.get("href", ""), self.BASE_URL)
+        match = _PAGE_PARAM_RE.search(next_url)
+        if not match:
+            return None
+
+        # Number the next link uses for page 2 (page parameters may be
+        # 0- or 1-based), substituted for each further page
+        prefix, suffix = next_url[:match.start(2)], next_url[match.end(2):]
+        offset = int(match.group(2)) - 2
+        pages = range(2, self.MAX_PAGES + 1)
+        urls = [f"{prefix}{page + offset}{suffix}" for page in pages]
+        self.logger.debug(f"Fetching pages 2-{self.MAX_PAGES} via {next_url}")
+
+        with ThreadPoolExecutor(max_workers=self.PAGE_FETCH_WORKERS) as executor:
+            htmls = list(executor.map(self.fetch_html, urls))
+
+        # Only the structured strategies count: the catch-all link and
+        # content strategies also find navigation links in a bare site shell
+        results_by_page = {
+            page: self._parse_structured_results(parse_dom(html), now) if html else []
+            for page, html in zip(pages, htmls)
+        }
+        if not results_by_page[2]:
+            # Pages need JavaScript (or the request was refused)
+            self.logger.debug("No result items in fetched page 2, clicking through instead")
+            return None
+
+        return results_by_page
+
+    def _click_next_page(self, results_selector: Optional[str] = None) -> bool:
+        """
+        Click the next page button and wait for the next page's results.
+
+        Args:
+            results_selector: CSS selector of the results container; the
+                              click is complete once the current container
+                              has been replaced
 
         Returns:
             True if successful, False if no more pages
         """
+        # Results element the next page replaces (or navigates away from)
+        old_results = None
+        if results_selector:
+            found = self.driver.find_elements(By.CSS_SELECTOR, results_selector)
+            old_results = found[0] if found else None
+
         next_selectors = [
             "a[rel='next']",
             ".pagination-next:not(.disabled) a",
@@ -179,7 +363,7 @@ class AuftragATScraper(BaseScraper):
 
                     if any(x in text + href + classes for x in ["next", "weiter", "›", "»"]):
                         next_btn.click()
-                        time.sleep(2)
+                        self._wait_for_next_results(old_results, results_selector)
                         return True
             except NoSuchElementException:
                 continue
@@ -189,35 +373,99 @@ class AuftragATScraper(BaseScraper):
 
         return False
 
-    def _parse_results(self, soup: BeautifulSoup) -> List[TenderResult]:
+    def _wait_for_next_results(self, old_results, results_selector: Optional[str]) -> None:
+        """
+        Wait until a page change has replaced the results.
+
+        Args:
+            old_results: Results element from before the page change, or None
+            results_selector: CSS selector of the results container
+        """
+        if old_results is None:
+            # Nothing to watch; give the next page a moment to render
+            time.sleep(2)
+            return
+
+        try:
+            WebDriverWait(self.driver, 10).until(EC.staleness_of(old_results))
+            WebDriverWait(self.driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, results_selector))
+            )
+        except TimeoutException:
+            self.logger.debug("Results did not change after page change, proceeding anyway")
+
+    def _parse_results(
+        self, tree: HtmlElement, now: Optional[datetime] = None
+    ) -> List[TenderResult]:
         """
         Parse auftrag.at tender page HTML.
 
         Uses multiple parsing strategies to handle different page structures.
 
         Args:
-            soup: BeautifulSoup object of page HTML
+            tree: lxml element tree of page HTML
+            now: Search timestamp for the results (default: current time)
 
         Returns:
             List of TenderResult objects
         """
-        results = []
-        now = datetime.now()
+        now = now or datetime.now()
 
-        # Strategy 1: Look for structured result items
-        item_selectors = [
-            ".search-result-item",
-            ".tender-item",
-            ".result-item",
-            ".ausschreibung-item",
-            "[class*='SearchResult']",
-            "[class*='TenderItem']",
-            "article.tender",
-            ".card.tender",
+        results = self._parse_structured_results(tree, now)
+        if results:
+            return results
+
+        # Strategy 3: Look for links with tender-like attributes
+        tender_links = [
+            link for link in _LINKS_WITH_HREF(tree)
+            if _TENDER_HREF_RE.search(link.get("href"))
         ]
+        if tender_links:
+            self.logger.debug(f"Found {len(tender_links)} tender links")
+            for link in tender_links:
+                result = self._parse_tender_link(link, now)
+                if result and result.titel and len(result.titel) > 10:
+                    results.append(result)
+
+        # Strategy 4: Look for any div/article containing tender data
+        seen_titles = {r.titel for r in results}
+        for xpath in _CONTENT_SELECTORS:
+            items = xpath(tree)
+            for item in items:
+                # Check if this looks like a tender item
+                text = item.text_content()
+                if any(kw in text.lower() for kw in ["ausschreibung", "vergabe", "frist", "tender"]):
+                    result = self._parse_generic_item(item, now)
+                    if result and result.titel and len(result.titel) > 10:
+                        # Avoid duplicates
+                        if result.titel not in seen_titles:
+                            seen_titles.add(result.titel)
+                            results.append(result)
 
-        for selector in item_selectors:
-            items = soup.select(selector)
+        return results
+
+    def _parse_structured_results(self, tree: HtmlElement, now: datetime) -> List[TenderResult]:
+        """
+        Parse result items or table rows matched by the structured selectors.
+
+        Args:
+            tree: lxml element tree of page HTML
+            now: Search timestamp for the results
+
+        Returns:
+            List of TenderResult objects (empty if no selector matched)
+        """
+        results = []
+
+        # Strategy 1: Look for structured result items
+        item_selectors = _ITEM_SELECTORS
+        if self._item_selector is not None:
+            item_selectors = [self._item_selector] + [
+                pair for pair in _ITEM_SELECTORS if pair is not self._item_selector
+            ]
+        for pair in item_selectors:
+            selector, xpath = pair
+            items = xpath(tree)
             if items:
                 self.logger.debug(f"Found {len(items)} items with selector: {selector}")
                 for item in items:
@@ -225,17 +473,12 @@ class AuftragATScraper(BaseScraper):
                     if result and result.titel:
                         results.append(result)
                 if results:
+                    self._item_selector = pair
                     return results
 
         # Strategy 2: Look for table rows
-        table_selectors = [
-            "table.search-results tbody tr",
-            "table.tender-list tbody tr",
-            "table tbody tr",
-        ]
-
-        for selector in table_selectors:
-            rows = soup.select(selector)
+        for selector, xpath in _TABLE_SELECTORS:
+            rows = xpath(tree)
             if rows:
                 self.logger.debug(f"Found {len(rows)} rows with selector: {selector}")
                 for row in rows:
@@ -245,46 +488,14 @@ class AuftragATScraper(BaseScraper):
                 if results:
                     return results
 
-        # Strategy 3: Look for links with tender-like attributes
-        tender_links = soup.find_all("a", href=re.compile(
-            r"detail|ausschreibung|tender|vergabe|notice",
-            re.IGNORECASE
-        ))
-        if tender_links:
-            self.logger.debug(f"Found {len(tender_links)} tender links")
-            for link in tender_links:
-                result = self._parse_tender_link(link, now)
-                if result and result.titel and len(result.titel) > 10:
-                    results.append(result)
-
-        # Strategy 4: Look for any div/article containing tender data
-        content_selectors = [
-            "div[class*='tender']",
-            "div[class*='result']",
-            "div[class*='ausschreibung']",
-            "article",
-        ]
-
-        for selector in content_selectors:
-            items = soup.select(selector)
-            for item in items:
-                # Check if this looks like a tender item
-                text = item.get_text()
-                if any(kw in text.lower() for kw in ["ausschreibung", "vergabe", "frist", "tender"]):
-                    result = self._parse_generic_item(item, now)
-                    if result and result.titel and len(result.titel) > 10:
-                        # Avoid duplicates
-                        if not any(r.titel == result.titel for r in results):
-                            results.append(result)
-
         return results
 
-    def _parse_result_item(self, item, now: datetime) -> TenderResult:
+    def _parse_result_item(self, item: HtmlElement, now: datetime) -> TenderResult:
         """
         Parse a structured result item.
 
         Args:
-            item: BeautifulSoup element
+            item: lxml element
             now: Current timestamp
 
         Returns:
@@ -292,79 +503,60 @@ class AuftragATScraper(BaseScraper):
         """
         try:
             # Find title and link
-            title_selectors = [
-                "h2 a", "h3 a", "h4 a",
-                ".title a", ".titel a",
-                "a.title", "a.titel",
-                ".search-result-title a",
-                "a[class*='title']",
-            ]
-
             titel = ""
             link = ""
             vergabe_id = ""
 
-            for selector in title_selectors:
-                elem = item.select_one(selector)
-                if elem:
-                    titel = clean_text(elem.get_text())
+            for xpath in _TITLE_SELECTORS:
+                elem = select_one(item, xpath)
+                if elem is not None:
+                    titel = clean_text(elem.text_content())
                     href = elem.get("href", "")
                     if href:
                         link = normalize_url(href, self.BASE_URL)
-                        vergabe_id = self._extract_id(link)
+                        vergabe_id = _extract_id(link)
                     break
 
             if not titel:
                 # Try to find any prominent text
-                for tag in ["h2", "h3", "h4", ".title", ".titel"]:
-                    elem = item.select_one(tag)
-                    if elem:
-                        titel = clean_text(elem.get_text())
+                for xpath in _HEADING_SELECTORS:
+                    elem = select_one(item, xpath)
+                    if elem is not None:
+                        titel = clean_text(elem.text_content())
                         break
 
             if not link:
                 # Find first meaningful link
-                link_elem = item.find("a", href=True)
-                if link_elem:
+                link_elem = select_one(item, _LINK_WITH_HREF)
+                if link_elem is not None:
                     link = normalize_url(link_elem.get("href", ""), self.BASE_URL)
-                    vergabe_id = self._extract_id(link)
+                    vergabe_id = _extract_id(link)
 
             # Extract organization
-            org_selectors = [
-                ".organization", ".organisation", ".issuer",
-                ".ausschreibungsstelle", ".auftraggeber",
-                "[class*='organization']", "[class*='issuer']",
-            ]
             ausschreibungsstelle = ""
-            for selector in org_selectors:
-                elem = item.select_one(selector)
-                if elem:
-                    ausschreibungsstelle = clean_text(elem.get_text())
+            for xpath in _ORG_SELECTORS:
+                elem = select_one(item, xpath)
+                if elem is not None:
+                    ausschreibungsstelle = clean_text(elem.text_content())
                     break
 
             # Extract dates
             naechste_frist = ""
             veroeffentlicht = ""
 
-            date_pattern = r"\d{1,2}\.\d{1,2}\.\d{4}"
-            text = item.get_text()
-            dates = re.findall(date_pattern, text)
+            text = item.text_content()
+            dates = _DATE_RE.findall(text)
             if dates:
                 veroeffentlicht = dates[0]
                 if len(dates) > 1:
                     naechste_frist = dates[1]
 
-            # Look for specific date labels
-            for elem in item.find_all(["span", "div", "p"]):
-                text_lower = elem.get_text().lower()
-                if "frist" in text_lower or "deadline" in text_lower:
-                    date_match = re.search(date_pattern, elem.get_text())
-                    if date_match:
-                        naechste_frist = date_match.group()
-                elif "veröffentlicht" in text_lower or "published" in text_lower:
-                    date_match = re.search(date_pattern, elem.get_text())
-                    if date_match:
-                        veroeffentlicht = date_match.group()
+            # Look for specific date labels, each followed by its date
+            for match in _DATE_LABEL_RE.finditer(text):
+                if match.group(1).lower() in ("frist", "deadline"):
+                    naechste_frist = match.group(2)
+                else:
+                    veroeffentlicht = match.group(2)
 
             if not titel:
                 return None
@@ -387,19 +579,19 @@ class AuftragATScraper(BaseScraper):
             self.logger.warning(f"Failed to parse result item: {e}")
             return None
 
-    def _parse_table_row(self, row, now: datetime) -> TenderResult:
+    def _parse_table_row(self, row: HtmlElement, now: datetime) -> TenderResult:
         """
         Parse a table row with tender data.
 
         Args:
-            row: BeautifulSoup element for table row
+            row: lxml element for table row
             now: Current timestamp
 
         Returns:
             TenderResult object or None
         """
         try:
-            cells = row.find_all("td")
+            cells = _CELLS(row)
             if len(cells) < 2:
                 return None
 
@@ -412,23 +604,22 @@ class AuftragATScraper(BaseScraper):
 
             # Look for link in cells
             for cell in cells:
-                link_elem = cell.find("a")
-                if link_elem:
-                    text = clean_text(link_elem.get_text())
+                link_elem = select_one(cell, _LINK)
+                if link_elem is not None:
+                    text = clean_text(link_elem.text_content())
                     if len(text) > len(titel):
                         titel = text
                         href = link_elem.get("href", "")
                         if href:
                             link = normalize_url(href, self.BASE_URL)
-                            vergabe_id = self._extract_id(link)
+                            vergabe_id = _extract_id(link)
 
             # Extract dates and other info from cells
-            date_pattern = r"\d{1,2}\.\d{1,2}\.\d{4}"
             for idx, cell in enumerate(cells):
-                text = clean_text(cell.get_text())
+                text = clean_text(cell.text_content())
 
                 # Check for dates
-                date_match = re.search(date_pattern, text)
+                date_match = _DATE_RE.search(text)
                 if date_match:
                     if not veroeffentlicht:
                         veroeffentlicht = date_match.group()
@@ -462,12 +653,12 @@ class AuftragATScraper(BaseScraper):
             self.logger.warning(f"Failed to parse table row: {e}")
             return None
 
-    def _parse_tender_link(self, link, now: datetime) -> TenderResult:
+    def _parse_tender_link(self, link: HtmlElement, now: datetime) -> TenderResult:
         """
         Parse a tender link element.
 
         Args:
-            link: BeautifulSoup anchor element
+            link: lxml anchor element
             now: Current timestamp
 
         Returns:
@@ -475,13 +666,13 @@ class AuftragATScraper(BaseScraper):
         """
         try:
             href = link.get("href", "")
-            titel = clean_text(link.get_text())
+            titel = clean_text(link.text_content())
 
             if not titel or len(titel) < 5:
                 return None
 
             full_link = normalize_url(href, self.BASE_URL)
-            vergabe_id = self._extract_id(full_link)
+            vergabe_id = _extract_id(full_link)
 
             return TenderResult(
                 portal=self.PORTAL_NAME,
@@ -500,12 +691,12 @@ class AuftragATScraper(BaseScraper):
             self.logger.warning(f"Failed to parse tender link: {e}")
             return None
 
-    def _parse_generic_item(self, item, now: datetime) -> TenderResult:
+    def _parse_generic_item(self, item: HtmlElement, now: datetime) -> TenderResult:
         """
         Parse a generic content item that might contain tender data.
 
         Args:
-            item: BeautifulSoup element
+            item: lxml element
             now: Current timestamp
 
         Returns:
@@ -513,22 +704,21 @@ class AuftragATScraper(BaseScraper):
         """
         try:
             # Find first meaningful link
-            link_elem = item.find("a", href=True)
-            if not link_elem:
+            link_elem = select_one(item, _LINK_WITH_HREF)
+            if link_elem is None:
                 return None
 
-            titel = clean_text(link_elem.get_text())
+            titel = clean_text(link_elem.text_content())
             href = link_elem.get("href", "")
             link = normalize_url(href, self.BASE_URL)
-            vergabe_id = self._extract_id(link)
+            vergabe_id = _extract_id(link)
 
             if not titel or len(titel) < 10:
                 return None
 
             # Try to extract dates
-            text = item.get_text()
-            date_pattern = r"\d{1,2}\.\d{1,2}\.\d{4}"
-            dates = re.findall(date_pattern, text)
+            text = item.text_content()
+            dates = _DATE_RE.findall(text)
 
             veroeffentlicht = dates[0] if dates else ""
             naechste_frist = dates[1] if len(dates) > 1 else ""
@@ -550,41 +740,12 @@ class AuftragATScraper(BaseScraper):
             self.logger.warning(f"Failed to parse generic item: {e}")
             return None
 
-    def _extract_id(self, url: str) -> str:
-        """
-        Extract tender ID from URL.
-
-        Args:
-            url: URL string
-
-        Returns:
-            Extracted ID or empty string
-        """
-        if not url:
-            return ""
-
-        # Try various ID patterns
-        patterns = [
-            r"[?&]id=(\d+)",
-            r"/detail/(\d+)",
-            r"/ausschreibung/(\d+)",
-            r"/tender/(\d+)",
-            r"/(\d{6,})",  # 6+ digit number in path
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url, re.IGNORECASE)
-            if match:
-                return match.group(1)
-
-        return ""
-
-    def _save_debug_html(self, soup: BeautifulSoup) -> None:
+    def _save_debug_html(self, html: str) -> None:
         """Save HTML for debugging purposes."""
         try:
             debug_path = f"data/auftrag_at_debug_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
             with open(debug_path, "w", encoding="utf-8") as f:
-                f.write(str(soup))
+                f.write(html)
             self.logger.debug(f"Saved debug HTML to: {debug_path}")
         except Exception as e:
             self.logger.debug(f"Could not save debug HTML: {e}")
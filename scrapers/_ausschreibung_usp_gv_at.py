@@ -5,13 +5,15 @@ URL: https://ausschreibungen.usp.gv.at
 Austrian government tenders from the Unternehmensserviceportal.
 """
 
+import os
 import re
+import tempfile
 import time
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Optional, Tuple
 from urllib.parse import urlencode
 
-from bs4 import BeautifulSoup
+from lxml.html import HtmlElement
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -19,7 +21,26 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
 from scrapers.base import BaseScraper, TenderResult, ScraperError
 from scrapers.registry import register_scraper
-from scrapers.utils import clean_text
+from scrapers.utils import clean_text, compile_css, parse_dom, select_one
+
+
+# Result table selectors, compiled to XPath once
+_ROW_SELECTORS = [
+    (selector, compile_css(selector))
+    for selector in (
+        "table.table tbody tr",
+        "table tbody tr",
+        ".tender-list tr",
+        "#tenderTable tbody tr",
+        "table.dataTable tbody tr",
+    )
+]
+_CELLS = compile_css("td", relative=True)
+_LINK_WITH_HREF = compile_css("a[href]", relative=True)
+
+# Tender ID in detail links: object parameter, else id parameter
+_OBJECT_RE = re.compile(r"object=([^&]+)")
+_ID_PARAM_RE = re.compile(r"[?&]id=([^&]+)")
 
 
 @register_scraper
@@ -29,6 +50,8 @@ class AusschreibungUSPScraper(BaseScraper):
     PORTAL_NAME = "ausschreibung_usp_gv_at"
     PORTAL_URL = "https://ausschreibungen.usp.gv.at/at.gv.bmdw.eproc-p/public/tenderlist"
     REQUIRES_SELENIUM = True
+    # The search URL carries all filters; the browser is only a fallback
+    HTTP_FIRST = True
 
     # Default date range: last 7 days
     DEFAULT_DATE_RANGE_DAYS = 7
@@ -106,32 +129,15 @@ class AusschreibungUSPScraper(BaseScraper):
                 if keyword:
                     self.logger.info(f"Searching for keyword '{keyword}' ({idx + 1}/{len(search_terms)})")
 
-                # Build and navigate to search URL
+                # Build search URL and load the result page
                 search_url = self._build_search_url(from_date, to_date, keyword)
-                self.logger.info(f"Navigating to: {search_url}")
-                self.driver.get(search_url)
-
-                # Accept cookies only on first page
-                if idx == 0:
-                    time.sleep(2)
-                    self.accept_cookies()
-                time.sleep(2)
-
-                # Wait for table to load
-                try:
-                    WebDriverWait(self.driver, 15).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "table.table, .tender-list, #tenderTable"))
-                    )
-                except TimeoutException:
-                    self.logger.warning("Table not found with primary selectors, trying alternatives")
-                    time.sleep(3)
-
-                # Get page HTML
-                html = self.driver.page_source
-                soup = BeautifulSoup(html, "lxml")
+                html, tree = self._load_page(search_url)
 
                 # Parse results
-                results = self._parse_results(soup)
+                results = self._parse_results(tree, today)
+                if not results and not self._find_rows(tree):
+                    # No table at all (not just no hits): save HTML for debugging
+                    self._save_debug_html(html)
 
                 # Deduplicate and optionally tag with keyword
                 for result in results:
@@ -155,39 +161,69 @@ class AusschreibungUSPScraper(BaseScraper):
 
         return all_results
 
-    def _parse_results(self, soup: BeautifulSoup) -> List[TenderResult]:
+    def _load_page(self, url: str) -> Tuple[str, HtmlElement]:
+        """
+        Load a result page, over plain HTTP if it serves the table.
+
+        Falls back to the browser when the HTTP response has no tender
+        rows (e.g. rendered by JavaScript or blocked).
+
+        Args:
+            url: Search URL
+
+        Returns:
+            Page HTML and its lxml element tree
+        """
+        html = self.fetch_html(url)
+        if html is not None:
+            tree = parse_dom(html)
+            if self._find_rows(tree):
+                self.logger.info(f"Fetched: {url}")
+                return html, tree
+            self.logger.debug("No tender rows in HTTP response, using browser")
+
+        # Accept cookies only on the first browser page
+        accept_cookies = self.driver is None
+        self.ensure_driver()
+        self.logger.info(f"Navigating to: {url}")
+        self.driver.get(url)
+
+        # driver.get returns once the page has loaded; the table wait below
+        # covers the rest
+        if accept_cookies:
+            self.accept_cookies()
+
+        # Wait for table to load
+        try:
+            WebDriverWait(self.driver, 15).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "table.table, .tender-list, #tenderTable"))
+            )
+        except TimeoutException:
+            self.logger.warning("Table not found with primary selectors, trying alternatives")
+            time.sleep(3)
+
+        html = self.driver.page_source
+        return html, parse_dom(html)
+
+    def _parse_results(
+        self, tree: HtmlElement, now: Optional[datetime] = None
+    ) -> List[TenderResult]:
         """
         Parse USP Austria tender page HTML.
 
         Args:
-            soup: BeautifulSoup object of page HTML
+            tree: lxml element tree of page HTML
+            now: Search timestamp for the results (default: current time)
 
         Returns:
             List of TenderResult objects
         """
         results = []
-        now = datetime.now()
-
-        # Try multiple table selectors
-        table_selectors = [
-            "table.table tbody tr",
-            "table tbody tr",
-            ".tender-list tr",
-            "#tenderTable tbody tr",
-            "table.dataTable tbody tr",
-        ]
-
-        rows = []
-        for selector in table_selectors:
-            rows = soup.select(selector)
-            if rows:
-                self.logger.debug(f"Found {len(rows)} rows with selector: {selector}")
-                break
+        now = now or datetime.now()
 
+        rows = self._find_rows(tree)
         if not rows:
             self.logger.warning("No tender rows found")
-            # Save HTML for debugging
-            self._save_debug_html(soup)
             return results
 
         for row in rows:
@@ -201,18 +237,35 @@ class AusschreibungUSPScraper(BaseScraper):
 
         return results
 
-    def _parse_row(self, row, now: datetime) -> TenderResult:
+    def _find_rows(self, tree: HtmlElement) -> List[HtmlElement]:
+        """
+        Find the tender table rows, trying multiple table selectors.
+
+        Args:
+            tree: lxml element tree of page HTML
+
+        Returns:
+            Rows matched by the first selector that matches any (empty if none)
+        """
+        for selector, xpath in _ROW_SELECTORS:
+            rows = xpath(tree)
+            if rows:
+                self.logger.debug(f"Found {len(rows)} rows with selector: {selector}")
+                return rows
+        return []
+
+    def _parse_row(self, row: HtmlElement, now: datetime) -> TenderResult:
         """
         Parse a single table row.
 
         Args:
-            row: BeautifulSoup element for table row
+            row: lxml element for table row
             now: Current timestamp
 
         Returns:
             TenderResult object or None
         """
-        cells = row.find_all("td")
+        cells = _CELLS(row)
         if len(cells) < 3:
             return None
 
@@ -222,8 +275,8 @@ class AusschreibungUSPScraper(BaseScraper):
         vergabe_id = ""
 
         # Try to find link in any cell
-        link_elem = row.select_one("a[href]")
-        if link_elem:
+        link_elem = select_one(row, _LINK_WITH_HREF)
+        if link_elem is not None:
             href = link_elem.get("href", "")
             if href and not href.startswith("#"):
                 # Make absolute URL if relative
@@ -237,20 +290,20 @@ class AusschreibungUSPScraper(BaseScraper):
                     link = f"{base_url}{href}"
 
                 # Extract ID from object parameter (format: object=UUID-...-ID)
-                id_match = re.search(r"object=([^&]+)", link)
+                id_match = _OBJECT_RE.search(link)
                 if id_match:
                     vergabe_id = id_match.group(1)
                 else:
                     # Try other ID patterns
-                    id_match = re.search(r"[?&]id=([^&]+)", link)
+                    id_match = _ID_PARAM_RE.search(link)
                     if id_match:
                         vergabe_id = id_match.group(1)
 
-            titel = clean_text(link_elem.get_text())
+            titel = clean_text(link_elem.text_content())
 
         # If no title from link, try first cell
         if not titel and cells:
-            titel = clean_text(cells[0].get_text())
+            titel = clean_text(cells[0].text_content())
 
         # Extract other fields based on actual column layout:
         # Column 0: Bezeichnung (Title) - already extracted from link
@@ -263,11 +316,11 @@ class AusschreibungUSPScraper(BaseScraper):
         veroeffentlicht = ""
 
         if len(cells) >= 2:
-            ausschreibungsstelle = clean_text(cells[1].get_text())
+            ausschreibungsstelle = clean_text(cells[1].text_content())
         if len(cells) >= 3:
-            veroeffentlicht = clean_text(cells[2].get_text())
+            veroeffentlicht = clean_text(cells[2].text_content())
         if len(cells) >= 4:
-            naechste_frist = clean_text(cells[3].get_text())
+            naechste_frist = clean_text(cells[3].text_content())
 
         return TenderResult(
             portal=self.PORTAL_NAME,
@@ -283,12 +336,15 @@ class AusschreibungUSPScraper(BaseScraper):
             veroeffentlicht=veroeffentlicht,
         )
 
-    def _save_debug_html(self, soup: BeautifulSoup) -> None:
+    def _save_debug_html(self, html: str) -> None:
         """Save HTML for debugging purposes."""
         try:
-            debug_path = f"/tmp/usp_debug_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+            debug_path = os.path.join(
+                tempfile.gettempdir(),
+                f"usp_debug_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.html",
+            )
             with open(debug_path, "w", encoding="utf-8") as f:
-                f.write(str(soup))
+                f.write(html)
             self.logger.debug(f"Saved debug HTML to: {debug_path}")
         except Exception as e:
             self.logger.debug(f"Could not save debug HTML: {e}")
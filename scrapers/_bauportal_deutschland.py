@@ -6,15 +6,65 @@ Construction tenders from Germany.
 """
 
 import re
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
-from bs4 import BeautifulSoup
+from lxml.etree import XPath
+from lxml.html import HtmlElement
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 
 from scrapers.base import BaseScraper, TenderResult, ScraperError
 from scrapers.registry import register_scraper
-from scrapers.utils import clean_text
+from scrapers.utils import clean_text, compile_css, parse_dom, select_one
+
+
+# Result item and link selectors, compiled to XPath once
+_ITEM_SELECTOR = "td[style='width:90%; float:left;border:none;']"
+_ITEMS = compile_css(_ITEM_SELECTOR)
+_TENDER_ITEMS = compile_css(".ausschreibung, .tender, .item")
+_LINK = compile_css("a", relative=True)
+
+# Listing pages are numbered in the URL
+_PAGE_URL = "https://www.bauportal-deutschland.de/aktuelle_ausschreibungen_seite_{page}.html"
+
+# Links to tender pages: href contains "ausschreibungen", or "oeffentliche"
+# followed later by "ausschreibung"
+_TENDER_LINKS = XPath(
+    "descendant-or-self::a[contains(@href, 'ausschreibungen')"
+    " or contains(substring-after(@href, 'oeffentliche'), 'ausschreibung')]"
+)
+
+# Text nodes of an element in document order, and "PLZ 12345 - City"
+_TEXT_NODES = XPath(".//text()")
+_PLZ_RE = re.compile(r"PLZ\s+\d+\s*-\s*([^<,]+)")
+
+
+def _find_location(element: HtmlElement, with_plz: bool = False) -> str:
+    """
+    Find the location in a tender element's text.
+
+    Args:
+        element: Element to search
+        with_plz: Also accept a "PLZ 12345 - City" text
+
+    Returns:
+        Text following the first "<b>Ort:</b>" label (or PLZ text, if it
+        comes first), or "" if there is none
+    """
+    for text in _TEXT_NODES(element):
+        if text.is_tail:
+            label = text.getparent()
+            if label.tag == "b" and label.text_content().endswith("Ort:"):
+                return clean_text(text)
+        if with_plz:
+            plz_match = _PLZ_RE.search(text)
+            if plz_match:
+                return clean_text(plz_match.group(1))
+    return ""
 
 
 @register_scraper
@@ -24,10 +74,15 @@ class BauportalDeutschlandScraper(BaseScraper):
     PORTAL_NAME = "bauportal_deutschland"
     PORTAL_URL = "https://www.bauportal-deutschland.de/aktuelle_ausschreibungen_seite_1.html"
     REQUIRES_SELENIUM = True
+    # Listing pages are fetched over HTTP; the browser is only a fallback
+    HTTP_FIRST = True
 
     # Number of pages to scrape
     MAX_PAGES = 10
 
+    # Concurrent HTTP requests when fetching the listing pages
+    PAGE_FETCH_WORKERS = 3
+
     def scrape(self) -> List[TenderResult]:
         """
         Execute scraping logic for Bauportal Deutschland.
@@ -35,38 +90,11 @@ class BauportalDeutschlandScraper(BaseScraper):
         Returns:
             List of TenderResult objects
         """
-        all_results = []
-
         try:
-            # Scrape multiple pages
-            for page in range(1, self.MAX_PAGES + 1):
-                url = f"https://www.bauportal-deutschland.de/aktuelle_ausschreibungen_seite_{page}.html"
-                self.logger.debug(f"Scraping page {page}: {url}")
-
-                self.driver.get(url)
-
-                if page == 1:
-                    time.sleep(3)
-                    self.accept_cookies()
-                    time.sleep(2)
-                else:
-                    time.sleep(2)
-
-                # Scroll to load all content
-                self.scroll_to_bottom(timeout=10, pause=1.0)
-
-                # Get page HTML
-                html = self.driver.page_source
-                soup = BeautifulSoup(html, "lxml")
-
-                # Parse results
-                results = self._parse_results(soup)
-                if results:
-                    all_results.extend(results)
-                    self.logger.debug(f"Page {page}: found {len(results)} tenders")
-                else:
-                    self.logger.debug(f"Page {page}: no results, stopping")
-                    break
+            all_results = self._fetch_pages()
+            if all_results is None:
+                self.ensure_driver()
+                all_results = self._browse_pages()
 
         except Exception as e:
             self.logger.error(f"Bauportal Deutschland scraping failed: {e}")
@@ -84,12 +112,82 @@ class BauportalDeutschlandScraper(BaseScraper):
         self.logger.info(f"Found {len(unique_results)} unique tenders")
         return unique_results
 
-    def _parse_results(self, soup: BeautifulSoup) -> List[TenderResult]:
+    def _fetch_pages(self) -> Optional[List[TenderResult]]:
+        """
+        Fetch the listing pages concurrently over plain HTTP.
+
+        Returns:
+            Results of the pages up to the first one without results, or
+            None if page 1 has no results this way (rendered by JavaScript
+            or blocked)
+        """
+        urls = [_PAGE_URL.format(page=page) for page in range(1, self.MAX_PAGES + 1)]
+        self.logger.debug(f"Fetching pages 1-{self.MAX_PAGES} via HTTP")
+
+        with ThreadPoolExecutor(max_workers=self.PAGE_FETCH_WORKERS) as executor:
+            htmls = list(executor.map(self.fetch_html, urls))
+
+        all_results = []
+        for page, html in enumerate(htmls, 1):
+            results = self._parse_results(parse_dom(html)) if html else []
+            if not results:
+                if page == 1:
+                    self.logger.debug("No results in fetched page 1, using browser")
+                    return None
+                self.logger.debug(f"Page {page}: no results, stopping")
+                break
+            all_results.extend(results)
+            self.logger.debug(f"Page {page}: found {len(results)} tenders")
+
+        return all_results
+
+    def _browse_pages(self) -> List[TenderResult]:
+        """
+        Load the listing pages one by one in the browser.
+
+        Returns:
+            Results of the pages up to the first one without results
+        """
+        all_results = []
+
+        for page in range(1, self.MAX_PAGES + 1):
+            url = _PAGE_URL.format(page=page)
+            self.logger.debug(f"Scraping page {page}: {url}")
+
+            self.driver.get(url)
+
+            if page == 1:
+                self.accept_cookies()
+
+            # The listing is server-rendered: wait for the items rather than
+            # sleeping and scrolling
+            try:
+                WebDriverWait(self.driver, 8).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, _ITEM_SELECTOR))
+                )
+            except TimeoutException:
+                self.logger.debug(f"Page {page}: no result items after waiting")
+
+            # Get page HTML
+            tree = parse_dom(self.driver.page_source)
+
+            # Parse results
+            results = self._parse_results(tree)
+            if results:
+                all_results.extend(results)
+                self.logger.debug(f"Page {page}: found {len(results)} tenders")
+            else:
+                self.logger.debug(f"Page {page}: no results, stopping")
+                break
+
+        return all_results
+
+    def _parse_results(self, tree: HtmlElement) -> List[TenderResult]:
         """
         Parse Bauportal Deutschland page HTML.
 
         Args:
-            soup: BeautifulSoup object of page HTML
+            tree: lxml element tree of page HTML
 
         Returns:
             List of TenderResult objects
@@ -98,7 +196,7 @@ class BauportalDeutschlandScraper(BaseScraper):
         now = datetime.now()
 
         # Strategy 1: Look for the specific td style (from old notebook)
-        items = soup.select("td[style='width:90%; float:left;border:none;']")
+        items = _ITEMS(tree)
         if items:
             # Skip first item if it's header
             items = items[1:] if len(items) > 1 else items
@@ -113,7 +211,7 @@ class BauportalDeutschlandScraper(BaseScraper):
                 return results
 
         # Strategy 2: Look for links to ausschreibungen
-        tender_links = soup.find_all("a", href=re.compile(r"oeffentliche.*ausschreibung|ausschreibungen"))
+        tender_links = _TENDER_LINKS(tree)
         self.logger.debug(f"Found {len(tender_links)} tender links")
 
         for link in tender_links:
@@ -123,22 +221,22 @@ class BauportalDeutschlandScraper(BaseScraper):
 
         # Strategy 3: Look for any structured tender items
         if not results:
-            tender_items = soup.select(".ausschreibung, .tender, .item")
+            tender_items = _TENDER_ITEMS(tree)
             for item in tender_items:
-                link_elem = item.find("a")
-                if link_elem:
+                link_elem = select_one(item, _LINK)
+                if link_elem is not None:
                     result = self._parse_link(link_elem, now)
                     if result:
                         results.append(result)
 
         return results
 
-    def _parse_item(self, item, now: datetime) -> TenderResult:
+    def _parse_item(self, item: HtmlElement, now: datetime) -> TenderResult:
         """
         Parse a tender item element.
 
         Args:
-            item: BeautifulSoup element
+            item: lxml element
             now: Current timestamp
 
         Returns:
@@ -148,17 +246,14 @@ class BauportalDeutschlandScraper(BaseScraper):
             # Extract link and title
             link = ""
             titel = ""
-            link_elem = item.find("a")
-            if link_elem:
+            link_elem = select_one(item, _LINK)
+            if link_elem is not None:
                 href = link_elem.get("href", "")
                 link = href if href.startswith("http") else f"https://www.bauportal-deutschland.de/{href.lstrip('/')}"
-                titel = clean_text(link_elem.get_text())
+                titel = clean_text(link_elem.text_content())
 
             # Extract location from HTML
-            ausfuehrungsort = ""
-            ort_match = re.search(r"Ort:</b>\s*([^<]+)", str(item))
-            if ort_match:
-                ausfuehrungsort = clean_text(ort_match.group(1))
+            ausfuehrungsort = _find_location(item)
 
             if not titel or len(titel) < 5:
                 return None
@@ -180,12 +275,12 @@ class BauportalDeutschlandScraper(BaseScraper):
             self.logger.warning(f"Failed to parse item: {e}")
             return None
 
-    def _parse_link(self, link, now: datetime) -> TenderResult:
+    def _parse_link(self, link: HtmlElement, now: datetime) -> TenderResult:
         """
         Parse a tender link element.
 
         Args:
-            link: BeautifulSoup anchor element
+            link: lxml anchor element
             now: Current timestamp
 
         Returns:
@@ -193,7 +288,7 @@ class BauportalDeutschlandScraper(BaseScraper):
         """
         try:
             href = link.get("href", "")
-            titel = clean_text(link.get_text())
+            titel = clean_text(link.text_content())
 
             if not titel or len(titel) < 10:
                 return None
@@ -206,11 +301,9 @@ class BauportalDeutschlandScraper(BaseScraper):
 
             # Try to extract location from parent
             ausfuehrungsort = ""
-            parent = link.find_parent(["td", "div", "li"])
-            if parent:
-                ort_match = re.search(r"Ort:</b>\s*([^<]+)|PLZ\s+\d+\s*-\s*([^<,]+)", str(parent))
-                if ort_match:
-                    ausfuehrungsort = clean_text(ort_match.group(1) or ort_match.group(2))
+            parent = next(link.iterancestors("td", "div", "li"), None)
+            if parent is not None:
+                ausfuehrungsort = _find_location(parent, with_plz=True)
 
             return TenderResult(
                 portal=self.PORTAL_NAME,
@@ -15,17 +15,64 @@ import re
 import time
 from datetime import datetime
 from typing import List
-from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+from lxml.html import HtmlElement
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 
 from scrapers.base import BaseScraper, TenderResult, ScraperError
 from scrapers.registry import register_scraper
-from scrapers.utils import clean_text
+from scrapers.utils import clean_text, compile_css, normalize_url, parse_dom, select_one, union_xpath
+
+
+# Result selectors per parsing strategy, compiled to XPath once
+_TEASER_ITEMS = compile_css("article.teaser, div.teaser, .result-item, .search-result-item")
+_LIST_ITEMS = compile_css(".resultList li, .result-list li, ul.results > li")
+_TABLES = compile_css("table.results, table.search-results, .data-table")
+_TENDER_LINKS = compile_css("a[href*='Ausschreibung'], a[href*='IMPORTE/Ausschreibungen']")
+_TITLE = compile_css("h2, h3, h4, .headline, .title", relative=True)
+_LINK_WITH_HREF = compile_css("a[href]", relative=True)
+_LINK = compile_css("a", relative=True)
+_ROWS = compile_css("tr", relative=True)
+_CELLS = compile_css("td", relative=True)
+
+# Metadata fields in the concatenated teaser text
+_ANGEBOTSFRIST_RE = re.compile(r"Angebotsfrist\s*(\d{1,2}\.\d{1,2}\.\d{2,4})", re.IGNORECASE)
+_VEROEFFENTLICHT_RE = re.compile(r"Veröffentlicht\s*(\d{1,2}\.\d{1,2}\.\d{2,4})", re.IGNORECASE)
+_VERGABESTELLE_RE = re.compile(r"Vergabestelle\s+(.+)\s*$", re.IGNORECASE)
+_AUSSCHREIBUNG_PREFIX_RE = re.compile(r"Ausschreibung\s*", re.IGNORECASE)
+
+# Tender ID in detail links
+_ID_RE = re.compile(r"/(\d{5,})[./]|[?&]id=(\d+)|/([A-Z]?\d{6,})\.")
+
+# Results-per-page controls, each tier looked up with one XPath union
+# (every missing element would otherwise cost a full implicit wait)
+_PAGE_SIZE_XPATHS = [
+    union_xpath((
+        "//select[contains(@id, 'pageSize')]//option[@value='50']",
+        "//select[contains(@id, 'pageSize')]//option[@value='100']",
+        ".page-size-select option[value='100']",
+        ".page-size-select option[value='50']",
+    )),
+    union_xpath((
+        "//a[contains(text(), '100')]",
+        "//a[contains(text(), '50')]",
+    )),
+]
+
+# Pagination "next" links
+_NEXT_PAGE_XPATH = union_xpath((
+    "//a[contains(@class, 'next') or contains(@title, 'nächste') or contains(@title, 'Nächste')]",
+    "//a[contains(@class, 'forward')]",
+    "//li[contains(@class, 'next')]/a",
+    ".pagination .next a",
+    ".pagination a.next",
+    "a[rel='next']",
+    "//a[contains(@aria-label, 'nächste') or contains(@aria-label, 'Nächste')]",
+    "//span[contains(@class, 'icon-forward')]/parent::a",
+))
 
 
 @register_scraper
@@ -86,46 +133,41 @@ class BundDeScraper(BaseScraper):
         working_text = text
 
         # Extract Angebotsfrist (deadline) - look for "Angebotsfrist" followed by date
-        angebotsfrist_match = re.search(
-            r"Angebotsfrist\s*" + self.DATE_PATTERN_ANY,
-            working_text,
-            re.IGNORECASE
-        )
+        angebotsfrist_match = _ANGEBOTSFRIST_RE.search(working_text)
         if angebotsfrist_match:
             result["angebotsfrist"] = angebotsfrist_match.group(1)
             # Remove this part from the text
             working_text = working_text[:angebotsfrist_match.start()] + working_text[angebotsfrist_match.end():]
 
         # Extract Veröffentlicht (published date)
-        veroeffentlicht_match = re.search(
-            r"Veröffentlicht\s*" + self.DATE_PATTERN_ANY,
-            working_text,
-            re.IGNORECASE
-        )
+        veroeffentlicht_match = _VEROEFFENTLICHT_RE.search(working_text)
         if veroeffentlicht_match:
             result["veroeffentlicht"] = veroeffentlicht_match.group(1)
             working_text = working_text[:veroeffentlicht_match.start()] + working_text[veroeffentlicht_match.end():]
 
         # Extract Vergabestelle (awarding authority)
         # This comes after "Vergabestelle" and before "Veröffentlicht" or end of remaining text
-        vergabestelle_match = re.search(
-            r"Vergabestelle\s+(.+?)(?:\s*$)",
-            working_text,
-            re.IGNORECASE
-        )
+        vergabestelle_match = _VERGABESTELLE_RE.search(working_text)
         if vergabestelle_match:
             vergabestelle = vergabestelle_match.group(1).strip()
             # Clean up any trailing ellipsis, pipes, or special characters (with optional spaces between)
-            vergabestelle = re.sub(r'[\s…\.\|]+$', '', vergabestelle)
+            end = len(vergabestelle)
+            while end and (vergabestelle[end - 1] in "….|" or vergabestelle[end - 1].isspace()):
+                end -= 1
+            vergabestelle = vergabestelle[:end]
             result["vergabestelle"] = vergabestelle
             working_text = working_text[:vergabestelle_match.start()]
 
         # The remaining text is the title - clean it up
         titel = working_text.strip()
         # Remove "Ausschreibung" prefix if present
-        titel = re.sub(r'^Ausschreibung\s*', '', titel, flags=re.IGNORECASE)
+        prefix_match = _AUSSCHREIBUNG_PREFIX_RE.match(titel)
+        if prefix_match:
+            titel = titel[prefix_match.end():]
         # Clean up trailing ellipsis or special chars
-        titel = re.sub(r'\s*[…]+\s*$', '', titel)
+        titel = titel.rstrip()
+        if titel.endswith("…"):
+            titel = titel.rstrip("…")
         titel = titel.strip()
 
         result["titel"] = titel
@@ -169,11 +211,10 @@ class BundDeScraper(BaseScraper):
                 self.logger.debug(f"Scraping page {page + 1}")
 
                 # Get page HTML
-                html = self.driver.page_source
-                soup = BeautifulSoup(html, "lxml")
+                tree = parse_dom(self.driver.page_source)
 
                 # Parse current page results
-                page_results = self._parse_results(soup)
+                page_results = self._parse_results(tree)
                 self.logger.debug(f"Page {page + 1}: found {len(page_results)} results")
 
                 if not page_results:
@@ -209,30 +250,15 @@ class BundDeScraper(BaseScraper):
     def _try_expand_results(self):
         """Try to show more results per page."""
         try:
-            # Look for results per page selector
-            selectors = [
-                "//select[contains(@id, 'pageSize')]//option[@value='50']",
-                "//select[contains(@id, 'pageSize')]//option[@value='100']",
-                "//a[contains(text(), '100')]",
-                "//a[contains(text(), '50')]",
-                ".page-size-select option[value='100']",
-                ".page-size-select option[value='50']",
-            ]
-
-            for selector in selectors:
-                try:
-                    if selector.startswith("//"):
-                        elem = self.driver.find_element(By.XPATH, selector)
-                    else:
-                        elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-
+            # Page-size controls first; the loose text matches only if none
+            # exist, as they could hit ordinary links
+            for xpath in _PAGE_SIZE_XPATHS:
+                for elem in self.driver.find_elements(By.XPATH, xpath):
                     if elem.is_displayed():
                         elem.click()
                         self.logger.debug("Expanded results per page")
                         time.sleep(2)
                         return
-                except NoSuchElementException:
-                    continue
         except Exception as e:
             self.logger.debug(f"Could not expand results per page: {e}")
 
@@ -244,24 +270,8 @@ class BundDeScraper(BaseScraper):
             True if successfully clicked next page, False otherwise
         """
         try:
-            next_selectors = [
-                "//a[contains(@class, 'next') or contains(@title, 'nächste') or contains(@title, 'Nächste')]",
-                "//a[contains(@class, 'forward')]",
-                "//li[contains(@class, 'next')]/a",
-                ".pagination .next a",
-                ".pagination a.next",
-                "a[rel='next']",
-                "//a[contains(@aria-label, 'nächste') or contains(@aria-label, 'Nächste')]",
-                "//span[contains(@class, 'icon-forward')]/parent::a",
-            ]
-
-            for selector in next_selectors:
+            for element in self.driver.find_elements(By.XPATH, _NEXT_PAGE_XPATH):
                 try:
-                    if selector.startswith("//"):
-                        element = self.driver.find_element(By.XPATH, selector)
-                    else:
-                        element = self.driver.find_element(By.CSS_SELECTOR, selector)
-
                     if element.is_displayed() and element.is_enabled():
                         current_url = self.driver.current_url
                         element.click()
@@ -272,8 +282,6 @@ class BundDeScraper(BaseScraper):
                             return True
                         # Check if content changed
                         return True
-                except NoSuchElementException:
-                    continue
                 except Exception as e:
                     self.logger.debug(f"Next page click failed: {e}")
                     continue
@@ -283,12 +291,12 @@ class BundDeScraper(BaseScraper):
 
         return False
 
-    def _parse_results(self, soup: BeautifulSoup) -> List[TenderResult]:
+    def _parse_results(self, tree: HtmlElement) -> List[TenderResult]:
         """
         Parse service.bund.de search results page HTML.
 
         Args:
-            soup: BeautifulSoup object of page HTML
+            tree: lxml element tree of page HTML
 
         Returns:
             List of TenderResult objects
@@ -297,7 +305,7 @@ class BundDeScraper(BaseScraper):
         now = datetime.now()
 
         # Strategy 1: Look for article.teaser or div.teaser elements
-        items = soup.select("article.teaser, div.teaser, .result-item, .search-result-item")
+        items = _TEASER_ITEMS(tree)
         self.logger.debug(f"Found {len(items)} teaser items")
 
         if items:
@@ -309,7 +317,7 @@ class BundDeScraper(BaseScraper):
                 return results
 
         # Strategy 2: Look for result list items
-        items = soup.select(".resultList li, .result-list li, ul.results > li")
+        items = _LIST_ITEMS(tree)
         self.logger.debug(f"Found {len(items)} list items")
 
         if items:
@@ -321,9 +329,9 @@ class BundDeScraper(BaseScraper):
                 return results
 
         # Strategy 3: Look for table-based results
-        tables = soup.select("table.results, table.search-results, .data-table")
+        tables = _TABLES(tree)
         for table in tables:
-            rows = table.find_all("tr")
+            rows = _ROWS(table)
             self.logger.debug(f"Found table with {len(rows)} rows")
             for row in rows[1:]:  # Skip header
                 result = self._parse_table_row(row, now)
@@ -333,7 +341,7 @@ class BundDeScraper(BaseScraper):
                 return results
 
         # Strategy 4: Generic link extraction for tenders
-        links = soup.select("a[href*='Ausschreibung'], a[href*='IMPORTE/Ausschreibungen']")
+        links = _TENDER_LINKS(tree)
         self.logger.debug(f"Found {len(links)} tender links")
 
         for link in links:
@@ -343,12 +351,12 @@ class BundDeScraper(BaseScraper):
 
         return results
 
-    def _parse_teaser_item(self, item, now: datetime) -> TenderResult:
+    def _parse_teaser_item(self, item: HtmlElement, now: datetime) -> TenderResult:
         """
         Parse a teaser-style result item.
 
         Args:
-            item: BeautifulSoup element
+            item: lxml element
             now: Current timestamp
 
         Returns:
@@ -359,7 +367,7 @@ class BundDeScraper(BaseScraper):
             vergabe_id = ""
 
             # Get the full text content of the item for metadata extraction
-            full_text = clean_text(item.get_text())
+            full_text = clean_text(item.text_content())
 
             # Extract structured metadata from the concatenated text
             metadata = self._extract_metadata_from_text(full_text)
@@ -370,21 +378,21 @@ class BundDeScraper(BaseScraper):
             naechste_frist = metadata["angebotsfrist"]
 
             # Find link from heading or direct link
-            title_elem = item.select_one("h2, h3, h4, .headline, .title")
-            if title_elem:
-                link_in_title = title_elem.find("a")
-                if link_in_title and link_in_title.has_attr("href"):
-                    link = urljoin(self.BASE_URL, link_in_title["href"])
+            title_elem = select_one(item, _TITLE)
+            if title_elem is not None:
+                link_in_title = select_one(title_elem, _LINK)
+                if link_in_title is not None and link_in_title.get("href") is not None:
+                    link = normalize_url(link_in_title.get("href"), self.BASE_URL)
 
             # Find link if not found in title
             if not link:
-                link_elem = item.select_one("a[href]")
-                if link_elem:
-                    link = urljoin(self.BASE_URL, link_elem["href"])
+                link_elem = select_one(item, _LINK_WITH_HREF)
+                if link_elem is not None:
+                    link = normalize_url(link_elem.get("href"), self.BASE_URL)
 
             # Extract ID from link
             if link:
-                id_match = re.search(r"/(\d{5,})[./]|[?&]id=(\d+)|/([A-Z]?\d{6,})\.", link)
+                id_match = _ID_RE.search(link)
                 if id_match:
                     vergabe_id = id_match.group(1) or id_match.group(2) or id_match.group(3)
 
@@ -414,12 +422,12 @@ class BundDeScraper(BaseScraper):
             self.logger.warning(f"Failed to parse teaser item: {e}")
             return None
 
-    def _parse_list_item(self, item, now: datetime) -> TenderResult:
+    def _parse_list_item(self, item: HtmlElement, now: datetime) -> TenderResult:
         """
         Parse a list-style result item.
 
         Args:
-            item: BeautifulSoup element
+            item: lxml element
             now: Current timestamp
 
         Returns:
@@ -430,7 +438,7 @@ class BundDeScraper(BaseScraper):
             vergabe_id = ""
 
             # Get the full text content and extract metadata
-            full_text = clean_text(item.get_text())
+            full_text = clean_text(item.text_content())
             metadata = self._extract_metadata_from_text(full_text)
 
             titel = metadata["titel"]
@@ -439,13 +447,13 @@ class BundDeScraper(BaseScraper):
             naechste_frist = metadata["angebotsfrist"]
 
             # Find link
-            link_elem = item.find("a")
-            if link_elem:
-                link = urljoin(self.BASE_URL, link_elem.get("href", ""))
+            link_elem = select_one(item, _LINK)
+            if link_elem is not None:
+                link = normalize_url(link_elem.get("href"), self.BASE_URL)
 
             # Extract ID
             if link:
-                id_match = re.search(r"/(\d{5,})[./]|[?&]id=(\d+)|/([A-Z]?\d{6,})\.", link)
+                id_match = _ID_RE.search(link)
                 if id_match:
                     vergabe_id = id_match.group(1) or id_match.group(2) or id_match.group(3)
 
@@ -469,19 +477,19 @@ class BundDeScraper(BaseScraper):
             self.logger.warning(f"Failed to parse list item: {e}")
             return None
 
-    def _parse_table_row(self, row, now: datetime) -> TenderResult:
+    def _parse_table_row(self, row: HtmlElement, now: datetime) -> TenderResult:
         """
         Parse a table row result.
 
         Args:
-            row: BeautifulSoup row element
+            row: lxml row element
             now: Current timestamp
 
         Returns:
             TenderResult object or None
         """
         try:
-            cells = row.find_all("td")
+            cells = _CELLS(row)
             if len(cells) < 2:
                 return None
 
@@ -489,7 +497,7 @@ class BundDeScraper(BaseScraper):
             vergabe_id = ""
 
             # Get full text and extract metadata
-            full_text = clean_text(row.get_text())
+            full_text = clean_text(row.text_content())
             metadata = self._extract_metadata_from_text(full_text)
 
             titel = metadata["titel"]
@@ -499,9 +507,9 @@ class BundDeScraper(BaseScraper):
 
             # Look for link in cells
             for cell in cells:
-                link_elem = cell.find("a")
-                if link_elem:
-                    link = urljoin(self.BASE_URL, link_elem.get("href", ""))
+                link_elem = select_one(cell, _LINK)
+                if link_elem is not None:
+                    link = normalize_url(link_elem.get("href"), self.BASE_URL)
                     break
 
             if not titel or len(titel) < 5:
@@ -509,7 +517,7 @@ class BundDeScraper(BaseScraper):
 
             # Extract ID
             if link:
-                id_match = re.search(r"/(\d{5,})[./]|[?&]id=(\d+)|/([A-Z]?\d{6,})\.", link)
+                id_match = _ID_RE.search(link)
                 if id_match:
                     vergabe_id = id_match.group(1) or id_match.group(2) or id_match.group(3)
 
@@ -530,20 +538,20 @@ class BundDeScraper(BaseScraper):
             self.logger.warning(f"Failed to parse table row: {e}")
             return None
 
-    def _parse_link_item(self, link_elem, now: datetime) -> TenderResult:
+    def _parse_link_item(self, link_elem: HtmlElement, now: datetime) -> TenderResult:
         """
         Parse a tender from a link element.
 
         Args:
-            link_elem: BeautifulSoup link element
+            link_elem: lxml link element
             now: Current timestamp
 
         Returns:
             TenderResult object or None
         """
         try:
-            full_text = clean_text(link_elem.get_text())
-            link = urljoin(self.BASE_URL, link_elem.get("href", ""))
+            full_text = clean_text(link_elem.text_content())
+            link = normalize_url(link_elem.get("href"), self.BASE_URL)
 
             # Extract metadata from concatenated text
             metadata = self._extract_metadata_from_text(full_text)
@@ -562,7 +570,7 @@ class BundDeScraper(BaseScraper):
                 return None
 
             vergabe_id = ""
-            id_match = re.search(r"/(\d{5,})[./]|[?&]id=(\d+)|/([A-Z]?\d{6,})\.", link)
+            id_match = _ID_RE.search(link)
             if id_match:
                 vergabe_id = id_match.group(1) or id_match.group(2) or id_match.group(3)
 
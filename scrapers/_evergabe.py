@@ -17,6 +17,7 @@ from datetime import datetime
 from typing import List
 from urllib.parse import urljoin, urlencode
 
+import soupsieve as sv
 from bs4 import BeautifulSoup
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -27,6 +28,22 @@ from scrapers.base import BaseScraper, TenderResult, ScraperError
 from scrapers.registry import register_scraper
 from scrapers.utils import clean_text
 
+# CSS selectors compiled once; BeautifulSoup's select() looks each selector
+# up in soupsieve's cache again on every call
+_CARD_ITEMS = sv.compile(".job-item, .tender-item, .auftrag-item, .ausschreibung-item")
+_ARTICLE_ITEMS = sv.compile("article, .search-result, .result-item")
+_TENDER_LINKS = sv.compile("a[href*='/ausschreibung/'], a[href*='/auftrag/']")
+_CARD_TITLE = sv.compile("h2, h3, h4, .title, .headline, a.job-title")
+_CARD_LINK = sv.compile("a[href*='/ausschreibung/'], a[href*='/auftrag/'], a[href]")
+_LOCATION = sv.compile(".location, .ort, .plz, [data-location]")
+_CONTRACT_TYPE = sv.compile(".type, .art, .verfahrensart, .contract-type")
+_DEADLINE = sv.compile(".deadline, .frist, .end-date, .bewerbungsfrist")
+_PUBLISHED = sv.compile(".date, .published, .veroeffentlicht")
+_ORGANIZATION = sv.compile(".organization, .auftraggeber, .client, .company")
+_TRADE = sv.compile(".trade, .gewerk, .category, .branche")
+_ARTICLE_TITLE = sv.compile("h2, h3, h4, .title")
+_LINK_WITH_HREF = sv.compile("a[href]")
+
 
 @register_scraper
 class EvergabeScraper(BaseScraper):
@@ -190,7 +207,7 @@ class EvergabeScraper(BaseScraper):
         now = datetime.now()
 
         # Strategy 1: Look for job/tender item cards (most likely structure)
-        items = soup.select(".job-item, .tender-item, .auftrag-item, .ausschreibung-item")
+        items = _CARD_ITEMS.select(soup)
         self.logger.debug(f"Found {len(items)} card items")
 
         if items:
@@ -202,7 +219,7 @@ class EvergabeScraper(BaseScraper):
                 return results
 
         # Strategy 2: Look for article elements
-        articles = soup.select("article, .search-result, .result-item")
+        articles = _ARTICLE_ITEMS.select(soup)
         self.logger.debug(f"Found {len(articles)} article items")
 
         if articles:
@@ -214,7 +231,7 @@ class EvergabeScraper(BaseScraper):
                 return results
 
         # Strategy 3: Look for tender links directly
-        links = soup.select("a[href*='/ausschreibung/'], a[href*='/auftrag/']")
+        links = _TENDER_LINKS.select(soup)
         self.logger.debug(f"Found {len(links)} tender links")
 
         for link in links:
@@ -253,7 +270,7 @@ class EvergabeScraper(BaseScraper):
             naechste_frist = ""
 
             # Find title from heading or link
-            title_elem = item.select_one("h2, h3, h4, .title, .headline, a.job-title")
+            title_elem = _CARD_TITLE.select_one(item)
             if title_elem:
                 titel = clean_text(title_elem.get_text())
                 # Check for link
@@ -266,7 +283,7 @@ class EvergabeScraper(BaseScraper):
 
             # Find link if not in title
             if not link:
-                link_elem = item.select_one("a[href*='/ausschreibung/'], a[href*='/auftrag/'], a[href]")
+                link_elem = _CARD_LINK.select_one(item)
                 if link_elem:
                     link = urljoin(self.BASE_URL, link_elem.get("href", ""))
                     if not titel:
@@ -274,17 +291,17 @@ class EvergabeScraper(BaseScraper):
 
             # Find metadata elements
             # Location (PLZ/postal code)
-            location_elem = item.select_one(".location, .ort, .plz, [data-location]")
+            location_elem = _LOCATION.select_one(item)
             if location_elem:
                 ausfuehrungsort = clean_text(location_elem.get_text())
 
             # Contract type
-            type_elem = item.select_one(".type, .art, .verfahrensart, .contract-type")
+            type_elem = _CONTRACT_TYPE.select_one(item)
             if type_elem:
                 ausschreibungsart = clean_text(type_elem.get_text())
 
             # Deadline
-            deadline_elem = item.select_one(".deadline, .frist, .end-date, .bewerbungsfrist")
+            deadline_elem = _DEADLINE.select_one(item)
             if deadline_elem:
                 deadline_text = clean_text(deadline_elem.get_text())
                 # Extract date from text like "noch 5 Tage" or "15.01.2025"
@@ -295,7 +312,7 @@ class EvergabeScraper(BaseScraper):
                     naechste_frist = deadline_text
 
             # Publication date
-            pub_elem = item.select_one(".date, .published, .veroeffentlicht")
+            pub_elem = _PUBLISHED.select_one(item)
             if pub_elem:
                 pub_text = clean_text(pub_elem.get_text())
                 date_match = re.search(r"(\d{1,2}\.\d{1,2}\.\d{4})", pub_text)
@@ -303,12 +320,12 @@ class EvergabeScraper(BaseScraper):
                     veroeffentlicht = date_match.group(1)
 
             # Organization/Client (may be behind login wall on evergabe.de)
-            org_elem = item.select_one(".organization, .auftraggeber, .client, .company")
+            org_elem = _ORGANIZATION.select_one(item)
             if org_elem:
                 ausschreibungsstelle = clean_text(org_elem.get_text())
 
             # Trade/Gewerk
-            trade_elem = item.select_one(".trade, .gewerk, .category, .branche")
+            trade_elem = _TRADE.select_one(item)
             if trade_elem:
                 trade_text = clean_text(trade_elem.get_text())
                 if not ausschreibungsart:
@@ -378,12 +395,12 @@ class EvergabeScraper(BaseScraper):
             vergabe_id = ""
 
             # Find title
-            title_elem = item.select_one("h2, h3, h4, .title")
+            title_elem = _ARTICLE_TITLE.select_one(item)
             if title_elem:
                 titel = clean_text(title_elem.get_text())
 
             # Find link
-            link_elem = item.select_one("a[href]")
+            link_elem = _LINK_WITH_HREF.select_one(item)
             if link_elem:
                 link = urljoin(self.BASE_URL, link_elem.get("href", ""))
                 if not titel:
@@ -5,20 +5,23 @@ Provides abstract base class and common functionality for all portal scrapers.
 """
 
 import logging
+import operator
+import threading
 import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+import requests
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import (
-    NoSuchElementException,
     TimeoutException,
     WebDriverException,
 )
 
+from scrapers.utils import union_xpath
 from utils.browser import BrowserManager
 
 
@@ -26,6 +29,22 @@ from utils.browser import BrowserManager
 class TenderResult:
     """Data class representing a single tender result."""
 
+    # No per-instance __dict__: portals can return thousands of results.
+    # Spelled out rather than @dataclass(slots=True) to keep Python 3.9.
+    __slots__ = (
+        "portal",
+        "suchbegriff",
+        "suchzeitpunkt",
+        "vergabe_id",
+        "link",
+        "titel",
+        "ausschreibungsstelle",
+        "ausfuehrungsort",
+        "ausschreibungsart",
+        "naechste_frist",
+        "veroeffentlicht",
+    )
+
     portal: str
     suchbegriff: Optional[str]
     suchzeitpunkt: datetime
@@ -39,8 +58,49 @@ class TenderResult:
     veroeffentlicht: Optional[str]
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for database insertion."""
-        return asdict(self)
+        """
+        Convert to dictionary for database insertion.
+
+        All fields are flat values, so a shallow mapping is enough; this
+        avoids the recursive deep copy done by dataclasses.asdict().
+        """
+        return dict(zip(_TENDER_FIELDS, _get_tender_fields(self)))
+
+
+# Field names of TenderResult and a getter returning their values in order
+_TENDER_FIELDS = tuple(f.name for f in fields(TenderResult))
+_get_tender_fields = operator.attrgetter(*_TENDER_FIELDS)
+
+
+# Polls document.querySelector for each selector (arguments[0]) every 100 ms
+# until one matches or the timeout (arguments[1], ms) passes; returns the
+# matching selector or null through the async callback
+_WAIT_FOR_ANY_SELECTOR_JS = """
+const selectors = arguments[0], timeout = arguments[1];
+const done = arguments[arguments.length - 1];
+const start = Date.now();
+(function poll() {
+    for (const selector of selectors) {
+        if (document.querySelector(selector)) return done(selector);
+    }
+    if (Date.now() - start > timeout) return done(null);
+    setTimeout(poll, 100);
+})();
+"""
+
+
+# HTTP session shared by all scrapers (connection pooling for fetch_html)
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+
+def _get_http_session() -> requests.Session:
+    """Get the shared HTTP session, creating it on first use."""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            _http_session = requests.Session()
+        return _http_session
 
 
 class ScraperError(Exception):
@@ -76,6 +136,9 @@ class BaseScraper(ABC):
     PORTAL_NAME: str = "base"
     PORTAL_URL: str = ""
     REQUIRES_SELENIUM: bool = True
+    # Try plain HTTP (fetch_html) before the browser; the WebDriver is then
+    # only started when the scraper calls ensure_driver()
+    HTTP_FIRST: bool = False
 
     # Cookie consent selectors (can be extended by subclasses)
     COOKIE_SELECTORS: List[str] = [
@@ -108,6 +171,7 @@ class BaseScraper(ABC):
         self.timeout = scraping_config.get("timeout_per_scraper", 300)
         self.headless = scraping_config.get("headless", True)
         self.user_agent = scraping_config.get("user_agent")
+        self.block_resources = scraping_config.get("block_resources", True)
 
     def setup_driver(self) -> None:
         """Initialize Selenium WebDriver."""
@@ -117,10 +181,43 @@ class BaseScraper(ABC):
         self.browser_manager = BrowserManager(
             headless=self.headless,
             user_agent=self.user_agent,
+            block_resources=self.block_resources,
         )
         self.driver = self.browser_manager.create_driver()
         self.logger.info("Browser initialized")
 
+    def ensure_driver(self) -> None:
+        """Initialize the WebDriver if it has not been started yet."""
+        if self.driver is None:
+            self.setup_driver()
+
+    def fetch_html(self, url: str, timeout: int = 30) -> Optional[str]:
+        """
+        Fetch a page over plain HTTP, without JavaScript rendering.
+
+        Args:
+            url: Page URL
+            timeout: Request timeout in seconds
+
+        Returns:
+            Page HTML, or None if the request failed
+        """
+        headers = {"Accept-Language": "de-DE,de;q=0.9,en;q=0.8"}
+        if self.user_agent:
+            headers["User-Agent"] = self.user_agent
+
+        try:
+            response = _get_http_session().get(url, headers=headers, timeout=timeout)
+            response.raise_for_status()
+            if "charset" not in response.headers.get("Content-Type", "").lower():
+                # requests would decode text/html as ISO-8859-1; detect the
+                # charset from the body instead so umlauts survive
+                response.encoding = response.apparent_encoding
+            return response.text
+        except requests.RequestException as e:
+            self.logger.debug(f"HTTP fetch failed for {url}: {e}")
+            return None
+
     def teardown_driver(self) -> None:
         """Clean up WebDriver resources."""
         if self.browser_manager:
@@ -139,20 +236,16 @@ class BaseScraper(ABC):
         if not self.driver:
             return False
 
-        for selector in self.COOKIE_SELECTORS:
+        # One lookup for all selectors: each missing element would otherwise
+        # cost a full implicit wait
+        xpath = union_xpath(tuple(self.COOKIE_SELECTORS))
+        for element in self.driver.find_elements(By.XPATH, xpath):
             try:
-                if selector.startswith("//"):
-                    element = self.driver.find_element(By.XPATH, selector)
-                else:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
-
                 if element.is_displayed() and element.is_enabled():
                     element.click()
-                    self.logger.debug(f"Accepted cookies: {selector}")
+                    self.logger.debug(f"Accepted cookies: <{element.tag_name}>")
                     time.sleep(1)
                     return True
-            except NoSuchElementException:
-                continue
             except Exception as e:
                 self.logger.debug(f"Cookie click failed: {e}")
                 continue
@@ -160,6 +253,36 @@ class BaseScraper(ABC):
         self.logger.debug("No cookie dialog found")
         return False
 
+    def wait_for_any_selector(
+        self,
+        selectors: List[str],
+        timeout: float = 10.0,
+    ) -> Optional[str]:
+        """
+        Wait until any of several CSS selectors matches an element.
+
+        All selectors are polled inside the browser by a single async
+        script, instead of one WebDriverWait (and its own timeout) per
+        selector.
+
+        Args:
+            selectors: CSS selectors, in order of preference
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            First selector (in list order) that matched, or None on timeout
+        """
+        if not self.driver:
+            return None
+
+        try:
+            return self.driver.execute_async_script(
+                _WAIT_FOR_ANY_SELECTOR_JS, selectors, int(timeout * 1000)
+            )
+        except WebDriverException as e:
+            self.logger.debug(f"Selector probe failed: {e}")
+            return None
+
     def scroll_to_bottom(self, timeout: int = 30, pause: float = 2.0) -> None:
         """
         Scroll page to load all dynamic content.
@@ -263,7 +386,8 @@ class BaseScraper(ABC):
         results = []
 
         try:
-            self.setup_driver()
+            if not self.HTTP_FIRST:
+                self.setup_driver()
             results = self.scrape()
             elapsed = time.time() - start_time
             self.logger.info(
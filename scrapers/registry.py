@@ -16,6 +16,9 @@ logger = logging.getLogger(__name__)
 # Global registry of scraper classes
 _SCRAPER_REGISTRY: Dict[str, Type[BaseScraper]] = {}
 
+# Set once discover_scrapers() has imported every scraper module
+_ALL_DISCOVERED = False
+
 
 def register_scraper(cls: Type[BaseScraper]) -> Type[BaseScraper]:
     """
@@ -43,17 +46,52 @@ def register_scraper(cls: Type[BaseScraper]) -> Type[BaseScraper]:
     return cls
 
 
+def _import_scraper_module(portal_name: str) -> None:
+    """
+    Import the module of a single scraper by naming convention.
+
+    Scraper modules are named after their portal (scrapers/_<portal>.py),
+    so only the requested scraper and its dependencies get imported.
+
+    Args:
+        portal_name: Name of the portal
+    """
+    module = f"scrapers._{portal_name}"
+    try:
+        importlib.import_module(module)
+        logger.debug(f"Imported scraper module: {module}")
+    except ModuleNotFoundError as e:
+        # Missing module for this portal is expected; missing deps are not
+        if e.name != module:
+            logger.warning(f"Failed to import {module}: {e}")
+    except ImportError as e:
+        logger.warning(f"Failed to import {module}: {e}")
+    except Exception as e:
+        logger.error(f"Error importing {module}: {e}")
+
+
 def get_scraper(portal_name: str) -> Optional[Type[BaseScraper]]:
     """
     Get a scraper class by portal name.
 
+    Unregistered portals are imported on demand from scrapers/_<portal>.py,
+    falling back to a full discover_scrapers() scan for modules that do
+    not follow the naming convention.
+
     Args:
         portal_name: Name of the portal
 
     Returns:
         Scraper class or None if not found
     """
-    return _SCRAPER_REGISTRY.get(portal_name)
+    scraper_cls = _SCRAPER_REGISTRY.get(portal_name)
+    if scraper_cls is None:
+        _import_scraper_module(portal_name)
+        scraper_cls = _SCRAPER_REGISTRY.get(portal_name)
+    if scraper_cls is None and not _ALL_DISCOVERED:
+        discover_scrapers()
+        scraper_cls = _SCRAPER_REGISTRY.get(portal_name)
+    return scraper_cls
 
 
 def get_all_scrapers() -> Dict[str, Type[BaseScraper]]:
@@ -86,7 +124,10 @@ def discover_scrapers(scrapers_dir: Optional[str] = None) -> None:
     Args:
         scrapers_dir: Path to scrapers directory (default: auto-detect)
     """
-    if scrapers_dir is None:
+    global _ALL_DISCOVERED
+
+    scan_all = scrapers_dir is None
+    if scan_all:
         scrapers_dir = Path(__file__).parent
 
     scrapers_path = Path(scrapers_dir)
@@ -108,6 +149,9 @@ def discover_scrapers(scrapers_dir: Optional[str] = None) -> None:
         except Exception as e:
             logger.error(f"Error importing {module_name}: {e}")
 
+    if scan_all:
+        _ALL_DISCOVERED = True
+
 
 def create_scraper(
     portal_name: str,
@@ -7,9 +7,20 @@ Provides common functions used across multiple scrapers.
 import re
 import time
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 from urllib.parse import urljoin, urlparse
 
+import lxml.html
+from cssselect import GenericTranslator
+from lxml import etree
+
+# Translates CSS selectors to XPath once, at import time of the scrapers
+_CSS_TRANSLATOR = GenericTranslator()
+
+# Runs of whitespace, collapsed by clean_text() for every extracted field
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 def clean_text(text: Optional[str]) -> str:
     """
@@ -25,7 +36,7 @@ def clean_text(text: Optional[str]) -> str:
         return ""
 
     # Remove extra whitespace
-    text = re.sub(r"\s+", " ", text)
+    text = _WHITESPACE_RE.sub(" ", text)
 
     # Strip leading/trailing whitespace
     text = text.strip()
@@ -279,3 +290,87 @@ def remove_html_tags(text: str) -> str:
     clean = re.sub(r"\s+", " ", clean)
 
     return clean.strip()
+
+
+def parse_dom(html: str) -> lxml.html.HtmlElement:
+    """
+    Parse page HTML into an lxml element tree.
+
+    Never raises on odd input: an empty or whitespace-only page gives an
+    empty <html> element, so callers see a page without results.
+
+    Args:
+        html: Page HTML
+
+    Returns:
+        Root element of the document
+    """
+    try:
+        return lxml.html.fromstring(html)
+    except ValueError:
+        # lxml only accepts an XML encoding declaration in bytes input
+        try:
+            return lxml.html.document_fromstring(
+                html.encode("utf-8"), parser=lxml.html.HTMLParser(encoding="utf-8")
+            )
+        except etree.ParserError:
+            pass
+    except etree.ParserError:
+        # "Document is empty"
+        pass
+    return lxml.html.Element("html")
+
+
+def compile_css(selector: str, relative: bool = False) -> etree.XPath:
+    """
+    Compile a CSS selector into a reusable XPath evaluator.
+
+    Args:
+        selector: CSS selector (may contain comma-separated alternatives)
+        relative: Match only descendants of the element it is called on,
+                  like BeautifulSoup's Tag.select(), instead of the element
+                  itself as well
+
+    Returns:
+        XPath object; call it with an element to get the matching
+        elements in document order
+    """
+    prefix = "descendant::" if relative else "descendant-or-self::"
+    return etree.XPath(_CSS_TRANSLATOR.css_to_xpath(selector, prefix=prefix))
+
+
+@lru_cache(maxsize=None)
+def union_xpath(selectors: Tuple[str, ...]) -> str:
+    """
+    Combine selectors into one XPath union expression.
+
+    Lets Selenium find the elements of a whole selector list with a single
+    find_elements() call (and at most one implicit wait) instead of one
+    find_element() per selector.
+
+    Args:
+        selectors: XPath expressions (starting with "//") and CSS selectors
+
+    Returns:
+        XPath expression matching the elements of all selectors, in
+        document order
+    """
+    return " | ".join(
+        selector if selector.startswith("//") else _CSS_TRANSLATOR.css_to_xpath(selector)
+        for selector in selectors
+    )
+
+
+def select_one(element: lxml.html.HtmlElement, xpath: etree.XPath):
+    """
+    Get the first element matching a compiled selector.
+
+    Args:
+        element: Element to search from
+        xpath: Compiled selector from compile_css()
+
+    Returns:
+        First matching element or None
+    """
+    found = xpath(element)
+    return found[0] if found else None
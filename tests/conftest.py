@@ -0,0 +1,18 @@
+"""
+Shared fixtures for the Tender Scraper tests.
+"""
+
+from pathlib import Path
+
+import pytest
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def load_fixture():
+    """Return a loader for sample HTML files in tests/fixtures."""
+    def load(name: str) -> str:
+        return (FIXTURES_DIR / name).read_text(encoding="utf-8")
+
+    return load
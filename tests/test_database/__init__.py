@@ -0,0 +1,3 @@
+"""
+Tender Scraper - Database Tests
+"""
@@ -0,0 +1,150 @@
+"""
+Tests for database schema setup and migrations.
+"""
+
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from database.db import Database
+
+# tenders table as created before the dedup_hash migration
+LEGACY_TENDERS_TABLE = """
+CREATE TABLE tenders (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    portal TEXT NOT NULL,
+    suchbegriff TEXT,
+    suchzeitpunkt DATETIME NOT NULL,
+    vergabe_id TEXT,
+    link TEXT,
+    titel TEXT NOT NULL,
+    ausschreibungsstelle TEXT,
+    ausfuehrungsort TEXT,
+    ausschreibungsart TEXT,
+    naechste_frist TEXT,
+    veroeffentlicht TEXT,
+    email_sent INTEGER DEFAULT 0,
+    email_sent_at TEXT,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(portal, vergabe_id, link, titel)
+);
+"""
+
+
+def make_tender(**overrides):
+    """Build a tender dictionary as the scrapers produce it."""
+    tender = {
+        "portal": "bund",
+        "suchbegriff": "Sanierung",
+        "suchzeitpunkt": datetime(2026, 1, 5, 8, 30),
+        "vergabe_id": "V-1",
+        "link": "https://example.org/tender/1",
+        "titel": "Sanierung Schulgebäude",
+        "ausschreibungsstelle": "Stadt Musterstadt",
+    }
+    tender.update(overrides)
+    return tender
+
+
+@pytest.fixture
+def legacy_db_path(tmp_path):
+    """Database file with the legacy tenders table and two stored tenders."""
+    path = tmp_path / "tenders.db"
+    conn = sqlite3.connect(path)
+    conn.execute(LEGACY_TENDERS_TABLE)
+    conn.executemany(
+        "INSERT INTO tenders (portal, suchzeitpunkt, vergabe_id, link, titel, email_sent) "
+        "VALUES (?, '2026-01-01 08:00:00', ?, ?, ?, 1)",
+        [
+            ("bund", "V-1", "https://example.org/tender/1", "Sanierung Schulgebäude"),
+            ("bund", None, "https://example.org/tender/2", "Neubau Feuerwache"),
+        ],
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+def test_initialize_rebuilds_legacy_tenders_table(legacy_db_path):
+    """The inline 4-column UNIQUE is replaced by the dedup_hash index."""
+    db = Database(str(legacy_db_path))
+    db.initialize()
+
+    indexes = {
+        row["name"]
+        for row in db.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'tenders'"
+        )
+    }
+    assert "sqlite_autoindex_tenders_1" not in indexes
+    assert {"idx_tenders_dedup", "idx_tenders_email_sent"} <= indexes
+
+    rows = db.execute("SELECT id, email_sent, dedup_hash FROM tenders ORDER BY id").fetchall()
+    assert [(row["id"], row["email_sent"]) for row in rows] == [(1, 1), (2, 1)]
+    assert all(row["dedup_hash"] is not None for row in rows)
+    db.shutdown()
+
+
+def test_migrated_database_ignores_reinserted_tenders(legacy_db_path):
+    """Tenders stored before the migration are still recognised as duplicates."""
+    db = Database(str(legacy_db_path))
+    db.initialize()
+
+    new_count = db.insert_tenders([
+        make_tender(),
+        make_tender(vergabe_id=None, link="https://example.org/tender/2", titel="Neubau Feuerwache"),
+        make_tender(vergabe_id="V-3", link="https://example.org/tender/3", titel="Umbau Rathaus"),
+    ])
+
+    assert new_count == 1
+    assert db.execute("SELECT COUNT(*) FROM tenders").fetchone()[0] == 3
+    db.shutdown()
+
+
+def test_initialize_keeps_legacy_duplicates(legacy_db_path):
+    """Rows the old UNIQUE let through (NULL fields) do not break the migration."""
+    conn = sqlite3.connect(legacy_db_path)
+    conn.execute(
+        "INSERT INTO tenders (portal, suchzeitpunkt, vergabe_id, link, titel) "
+        "VALUES ('bund', '2026-01-02 08:00:00', NULL, 'https://example.org/tender/2', "
+        "'Neubau Feuerwache')"
+    )
+    conn.commit()
+    conn.close()
+
+    db = Database(str(legacy_db_path))
+    db.initialize()
+
+    hashes = [row[0] for row in db.execute("SELECT dedup_hash FROM tenders ORDER BY id")]
+    assert len(hashes) == 3
+    assert hashes[0] is not None and hashes[1] is not None
+    assert hashes[2] is None
+    db.shutdown()
+
+
+def test_fresh_database_deduplicates(tmp_path):
+    """SCHEMA alone creates the unique dedup_hash index."""
+    db = Database(str(tmp_path / "tenders.db"))
+    db.initialize()
+
+    assert db.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_tenders_dedup'"
+    ).fetchone()
+    assert db.insert_tenders([make_tender(), make_tender()]) == 1
+    assert db.insert_tenders([make_tender()]) == 0
+    db.shutdown()
+
+
+def test_initialize_is_idempotent_after_rebuild(legacy_db_path):
+    """A second initialize() leaves the rebuilt table and its rows alone."""
+    db = Database(str(legacy_db_path))
+    db.initialize()
+    db.shutdown()
+
+    db = Database(str(legacy_db_path))
+    db.initialize()
+    assert db.insert_tenders([make_tender()]) == 0
+    assert db.execute("SELECT COUNT(*) FROM tenders").fetchone()[0] == 2
+    db.shutdown()
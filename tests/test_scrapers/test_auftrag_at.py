@@ -0,0 +1,68 @@
+"""
+Tests for the auftrag.at result page parsing.
+"""
+
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from scrapers._auftrag_at import AuftragATScraper
+from scrapers.utils import parse_dom
+
+NOW = datetime(2026, 2, 1, 8, 0)
+
+
+@pytest.fixture
+def scraper():
+    """Create scraper with mocked dependencies."""
+    return AuftragATScraper({}, Mock())
+
+
+def test_parse_results(scraper, load_fixture):
+    """Structured result items yield title, link, ID, organization and dates."""
+    tree = parse_dom(load_fixture("auftrag_at_sample.html"))
+
+    results = scraper._parse_results(tree, NOW)
+
+    assert [r.titel for r in results] == [
+        "Rückbau eines Kernkraftwerks Phase 2",
+        "Ohne Link Titel",
+    ]
+    first, second = results
+    assert first.portal == "auftrag_at"
+    assert first.suchzeitpunkt == NOW
+    assert first.link == "https://suche.auftrag.at/detail/123456?x=1"
+    assert first.vergabe_id == "123456"
+    assert first.ausschreibungsstelle == "Stadt Wien"
+    assert first.veroeffentlicht == "01.02.2026"
+    # Dates inside <script> are ignored
+    assert first.naechste_frist == "15.03.2026"
+    assert second.link == "https://x.at/ausschreibung/777"
+    assert second.vergabe_id == "777"
+    assert second.ausschreibungsstelle == "Land NÖ"
+    assert (second.veroeffentlicht, second.naechste_frist) == ("3.4.2026", "5.5.2026")
+
+
+def test_parse_results_table_rows(scraper):
+    """Result tables are parsed row by row when no result items exist."""
+    tree = parse_dom(
+        "<html><body><table class='search-results'><tbody>"
+        "<tr><td>01.02.2026</td><td><a href='/tender/1000'>Sanierung Landesstraße</a></td>"
+        "<td>Land Tirol</td><td>20.03.2026</td></tr>"
+        "<tr><td>only</td></tr>"
+        "</tbody></table></body></html>"
+    )
+
+    results = scraper._parse_results(tree, NOW)
+
+    assert len(results) == 1
+    assert results[0].titel == "Sanierung Landesstraße"
+    assert results[0].link == "https://suche.auftrag.at/tender/1000"
+    assert results[0].vergabe_id == "1000"
+    assert results[0].naechste_frist == "20.03.2026"
+
+
+def test_parse_results_empty_page(scraper):
+    """A page without tenders yields no results."""
+    assert scraper._parse_results(parse_dom("<html><body></body></html>"), NOW) == []
@@ -0,0 +1,51 @@
+"""
+Tests for the USP Austria result table parsing.
+"""
+
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from scrapers._ausschreibung_usp_gv_at import AusschreibungUSPScraper
+from scrapers.utils import parse_dom
+
+NOW = datetime(2026, 2, 1, 8, 0)
+
+
+@pytest.fixture
+def scraper():
+    """Create scraper with mocked dependencies."""
+    return AusschreibungUSPScraper({}, Mock())
+
+
+def test_parse_results(scraper, load_fixture):
+    """Table rows yield title, link, ID, organization and dates."""
+    tree = parse_dom(load_fixture("usp_sample.html"))
+
+    results = scraper._parse_results(tree, NOW)
+
+    assert [r.titel for r in results] == ["Rückbau Anlage", "Zweiter", "Kein Link Titel"]
+    first, second, third = results
+    assert first.portal == "ausschreibung_usp_gv_at"
+    assert first.suchzeitpunkt == NOW
+    assert first.link == (
+        "https://ausschreibungen.usp.gv.at/at.gv.bmdw.eproc-p/public/"
+        "tender-detail?object=ABC-DEF-123&x=1"
+    )
+    assert first.vergabe_id == "ABC-DEF-123"
+    assert (first.ausschreibungsstelle, first.veroeffentlicht, first.naechste_frist) == (
+        "BMK", "01.02.2026", "10.03.2026"
+    )
+    assert second.link == "https://ausschreibungen.usp.gv.at/at.gv/tender?id=77"
+    assert second.vergabe_id == "77"
+    assert second.naechste_frist == ""
+    assert (third.link, third.vergabe_id, third.ausschreibungsstelle) == ("", "", "Org2")
+
+
+def test_parse_results_without_table(scraper):
+    """A page without a result table yields no results."""
+    tree = parse_dom("<html><body><p>Keine Treffer</p></body></html>")
+
+    assert scraper._find_rows(tree) == []
+    assert scraper._parse_results(tree, NOW) == []
@@ -0,0 +1,112 @@
+"""
+Tests for the Bauportal Deutschland result page parsing.
+"""
+
+import re
+from unittest.mock import Mock
+
+import pytest
+
+from scrapers._bauportal_deutschland import (
+    BauportalDeutschlandScraper,
+    _TENDER_LINKS,
+    _find_location,
+)
+from scrapers.utils import compile_css, parse_dom, select_one
+
+
+@pytest.fixture
+def scraper():
+    """Create scraper with mocked dependencies."""
+    return BauportalDeutschlandScraper({}, Mock())
+
+
+def test_parse_results(scraper, load_fixture):
+    """Listing cells yield title, absolute link and location."""
+    tree = parse_dom(load_fixture("bauportal_deutschland_sample.html"))
+
+    results = scraper._parse_results(tree)
+
+    # The header cell and the too-short title are skipped
+    assert [(r.titel, r.link, r.ausfuehrungsort) for r in results] == [
+        (
+            "Neubau einer Sporthalle & Außenanlagen",
+            "https://www.bauportal-deutschland.de/oeffentliche_ausschreibung_123.html",
+            "10115 Berlin",
+        ),
+        (
+            "Sanierung Brücke B12",
+            "https://www.bauportal-deutschland.de/x/ausschreibungen_77.html",
+            "München",
+        ),
+    ]
+    assert all(r.portal == "bauportal_deutschland" for r in results)
+
+
+def test_parse_results_from_links(scraper):
+    """Without listing cells, tender links are parsed and navigation skipped."""
+    tree = parse_dom(
+        "<html><body>"
+        "<div><a href='/oeffentliche-bau-ausschreibung-1.html'>Abbruch eines Wohngebäudes</a>"
+        " <b>Ort:</b> Leipzig</div>"
+        "<li><a href='/ausschreibungen/2'>Dachsanierung Rathaus Musterstadt</a>"
+        " PLZ 12345 - Musterstadt, Kreis</li>"
+        "<td><a href='ausschreibungen_seite_2.html'>Seite 2 weiter blättern</a></td>"
+        "<a href='/kontakt'>Kontakt und Impressum der Seite</a>"
+        "</body></html>"
+    )
+
+    results = scraper._parse_results(tree)
+
+    assert [(r.titel, r.ausfuehrungsort) for r in results] == [
+        ("Abbruch eines Wohngebäudes", "Leipzig"),
+        ("Dachsanierung Rathaus Musterstadt", "Musterstadt"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "html, with_plz, expected",
+    [
+        ("<a>T</a><br><b>Ort:</b> 10115 Berlin<br><b>Frist:</b> 01.02.2026", False, "10115 Berlin"),
+        ("<b>Ort:</b>München", False, "München"),
+        ("<b>Bau Ort:</b>   Essen <i>NRW</i>", False, "Essen"),
+        # The label must end right at the colon, as "Ort:</b>" required
+        ("<b>Ort: </b> Hamm", False, ""),
+        ("<span>Keine Angabe</span>", False, ""),
+        ("PLZ 12345 - Musterstadt, Kreis", False, ""),
+        ("PLZ 12345 - Musterstadt, Kreis", True, "Musterstadt"),
+        # Whichever comes first in the document wins
+        ("PLZ 99999 - Erststadt <b>Ort:</b> Zweitort", True, "Erststadt"),
+        ("PLZ 99999 - Erststadt <b>Ort:</b> Zweitort", False, "Zweitort"),
+        ("<b>Ort:</b> Zuerst <b>Ort:</b> Später", False, "Zuerst"),
+    ],
+)
+def test_find_location(html, with_plz, expected):
+    """The "Ort:" label and PLZ text are read like the former regexes did."""
+    item = select_one(parse_dom(f"<html><body><div>{html}</div></body></html>"), compile_css("div"))
+
+    assert _find_location(item, with_plz=with_plz) == expected
+
+
+def test_tender_links_match_former_href_regex():
+    """The XPath selects exactly the links the former href regex matched."""
+    hrefs = [
+        "/oeffentliche_ausschreibung_123.html",
+        "/oeffentliche-bau-ausschreibung-1.html",
+        "http://example.com/oeffentliche/x/ausschreibung",
+        "/ausschreibungen/2",
+        "ausschreibungen_seite_2.html",
+        "/ausschreibung-oeffentliche",
+        "/oeffentliche",
+        "/Ausschreibungen/3",
+        "/kontakt",
+        "",
+    ]
+    tree = parse_dom(
+        "<html><body>"
+        + "".join(f"<a href='{href}'>x</a>" for href in hrefs)
+        + "<a>ohne href</a></body></html>"
+    )
+    former = re.compile(r"oeffentliche.*ausschreibung|ausschreibungen")
+
+    assert [a.get("href") for a in _TENDER_LINKS(tree)] == [h for h in hrefs if former.search(h)]
@@ -0,0 +1,72 @@
+"""
+Tests for the bund.de result page parsing.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from scrapers._bund_de import BundDeScraper
+from scrapers.utils import parse_dom
+
+
+@pytest.fixture
+def scraper():
+    """Create scraper with mocked dependencies."""
+    return BundDeScraper({}, Mock())
+
+
+def test_parse_results(scraper, load_fixture):
+    """Teasers yield title, absolute link, ID, Vergabestelle and dates."""
+    tree = parse_dom(load_fixture("bund_de_sample.html"))
+
+    results = scraper._parse_results(tree)
+
+    # The "Suche verfeinern" navigation teaser is skipped
+    assert [r.titel for r in results] == ["Neubau Verwaltungsgebäude", "Reinigung Dienstgebäude"]
+    first, second = results
+    assert first.portal == "bund_de"
+    assert first.link == (
+        "https://www.service.bund.de/IMPORTE/Ausschreibungen/eVergabe/2026/01/"
+        "1234567.html?nn=4641514"
+    )
+    assert first.vergabe_id == "1234567"
+    assert first.ausschreibungsstelle == "Bundesamt für Bauwesen und Raumordnung"
+    assert (first.veroeffentlicht, first.naechste_frist) == ("20.01.26", "19.02.2026")
+    assert second.vergabe_id == "Z7654321"
+    assert second.ausschreibungsstelle == "Generalzolldirektion"
+    assert (second.veroeffentlicht, second.naechste_frist) == ("02.02.2026", "")
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        (
+            "Ausschreibung Neubau Verwaltungsgebäude … Vergabestelle Bundesamt für "
+            "Bauwesen und Raumordnung | … Veröffentlicht 20.01.26 Angebotsfrist 19.02.2026",
+            ("Neubau Verwaltungsgebäude", "Bundesamt für Bauwesen und Raumordnung",
+             "20.01.26", "19.02.2026"),
+        ),
+        (
+            "AusschreibungReinigung Dienstgebäude Vergabestelle Zoll "
+            "Veröffentlicht 02.02.26 Angebotsfrist 03.03.26",
+            ("Reinigung Dienstgebäude", "Zoll", "02.02.26", "03.03.26"),
+        ),
+        (
+            "Wartung Aufzüge Angebotsfrist 1.2.2026 Vergabestelle Stadt Köln ...",
+            ("Wartung Aufzüge", "Stadt Köln", "", "1.2.2026"),
+        ),
+        ("Lieferung von Büromaterial", ("Lieferung von Büromaterial", "", "", "")),
+        ("", ("", "", "", "")),
+    ],
+)
+def test_extract_metadata_from_text(scraper, text, expected):
+    """Concatenated teaser text is split into its labelled fields."""
+    metadata = scraper._extract_metadata_from_text(text)
+
+    assert (
+        metadata["titel"],
+        metadata["vergabestelle"],
+        metadata["veroeffentlicht"],
+        metadata["angebotsfrist"],
+    ) == expected
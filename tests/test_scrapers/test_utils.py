@@ -0,0 +1,64 @@
+"""
+Tests for the shared scraper parsing helpers.
+"""
+
+import pytest
+
+from scrapers.utils import compile_css, parse_dom, select_one
+
+
+@pytest.fixture
+def tree():
+    """Nested divs: an outer result list holding two result items."""
+    return parse_dom(
+        "<html><body>"
+        "<div class='results'>"
+        "<div class='item'><a href='/a'>Erster</a></div>"
+        "<div class='item'><a href='/b'>Zweiter</a></div>"
+        "</div>"
+        "</body></html>"
+    )
+
+
+def test_compile_css_matches_element_itself(tree):
+    """By default the element a selector is called on can match too."""
+    outer = select_one(tree, compile_css("div.results"))
+
+    assert compile_css("div")(outer)[0] is outer
+    assert len(compile_css("div")(outer)) == 3
+
+
+def test_compile_css_relative_matches_descendants_only(tree):
+    """relative=True behaves like BeautifulSoup's Tag.select()."""
+    outer = select_one(tree, compile_css("div.results"))
+    items = compile_css("div", relative=True)(outer)
+
+    assert outer not in items
+    assert [item.get("class") for item in items] == ["item", "item"]
+
+
+def test_compile_css_comma_separated_in_document_order(tree):
+    """Alternatives are returned in document order, not selector order."""
+    matches = compile_css("a[href='/b'], div.results")(tree)
+
+    assert [m.tag for m in matches] == ["div", "a"]
+
+
+@pytest.mark.parametrize("html", ["", "   \n\t"])
+def test_parse_dom_empty_page(html):
+    """A blank page parses to an empty document instead of raising."""
+    root = parse_dom(html)
+
+    assert root.tag == "html"
+    assert compile_css("tr")(root) == []
+
+
+def test_parse_dom_xml_declaration():
+    """Pages served with an XML encoding declaration still parse."""
+    root = parse_dom(
+        "<?xml version='1.0' encoding='iso-8859-1'?>"
+        "<html><body><table><tr><td>Straßenbau</td></tr></table></body></html>"
+    )
+
+    assert root.tag == "html"
+    assert [td.text_content() for td in compile_css("td")(root)] == ["Straßenbau"]
@@ -7,6 +7,14 @@ keyword matching, and browser management.
 
 from utils.logging_config import setup_logging
 from utils.keywords import KeywordMatcher
-from utils.browser import BrowserManager
 
 __all__ = ["setup_logging", "KeywordMatcher", "BrowserManager"]
+
+
+def __getattr__(name: str):
+    """Import BrowserManager (and Selenium with it) on first access only."""
+    if name == "BrowserManager":
+        from utils.browser import BrowserManager
+
+        return BrowserManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,7 +7,7 @@ Provides Selenium WebDriver management with automatic cleanup.
 import logging
 import time
 from contextlib import contextmanager
-from typing import Generator, Optional
+from typing import Generator, List, Optional
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
@@ -33,6 +33,13 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Static resources not needed to read page HTML; stylesheets stay loaded
+# because visibility checks and clicks depend on layout
+BLOCKED_URL_PATTERNS = [
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.mp3", "*.ogg",
+]
+
 
 class BrowserManager:
     """Manages Selenium WebDriver instances with automatic cleanup."""
@@ -58,6 +65,7 @@ class BrowserManager:
         user_agent: Optional[str] = None,
         use_undetected: bool = False,
         implicit_wait: int = 10,
+        block_resources: bool = True,
     ):
         """
         Initialize browser manager.
@@ -67,6 +75,7 @@ class BrowserManager:
             user_agent: Custom user agent string
             use_undetected: Use undetected-chromedriver
             implicit_wait: Default implicit wait time in seconds
+            block_resources: Skip loading images, fonts and media
         """
         self.headless = headless
         self.user_agent = user_agent or (
@@ -76,6 +85,7 @@ class BrowserManager:
         )
         self.use_undetected = use_undetected
         self.implicit_wait = implicit_wait
+        self.block_resources = block_resources
         self.driver: Optional[webdriver.Chrome] = None
 
     def _create_chrome_options(self) -> ChromeOptions:
@@ -94,9 +104,10 @@ class BrowserManager:
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option("useAutomationExtension", False)
 
-        # Disable images for faster loading (optional)
-        # prefs = {"profile.managed_default_content_settings.images": 2}
-        # options.add_experimental_option("prefs", prefs)
+        # Disable images for faster loading
+        if self.block_resources:
+            prefs = {"profile.managed_default_content_settings.images": 2}
+            options.add_experimental_option("prefs", prefs)
 
         return options
 
@@ -128,6 +139,8 @@ class BrowserManager:
                     self.driver = webdriver.Chrome(options=options)
 
             self.driver.implicitly_wait(self.implicit_wait)
+            if self.block_resources:
+                self._block_urls(BLOCKED_URL_PATTERNS)
             logger.debug("WebDriver created successfully")
             return self.driver
 
@@ -135,6 +148,19 @@ class BrowserManager:
             logger.error(f"Failed to create WebDriver: {e}")
             raise
 
+    def _block_urls(self, patterns: List[str]) -> None:
+        """
+        Block requests matching URL patterns via the DevTools protocol.
+
+        Args:
+            patterns: URL patterns with * wildcards
+        """
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        except WebDriverException as e:
+            logger.debug(f"Could not block resource URLs: {e}")
+
     def close_driver(self) -> None:
         """Close the current WebDriver instance."""
         if self.driver:
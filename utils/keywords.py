@@ -45,7 +45,7 @@ machine learning
 import logging
 import re
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Iterable, List, Optional, Set
 
 logger = logging.getLogger(__name__)
 
@@ -89,6 +89,11 @@ class KeywordMatcher:
         self.keyword_patterns: List[re.Pattern] = []
         self.exclusion_patterns: List[re.Pattern] = []
 
+        # All keyword/exclusion patterns joined into one alternation each,
+        # so a field is scanned once instead of once per pattern
+        self._keyword_regex: Optional[re.Pattern] = None
+        self._exclusion_regex: Optional[re.Pattern] = None
+
         self._load_keywords()
         self._compile_patterns()
 
@@ -251,6 +256,35 @@ class KeywordMatcher:
             except re.error as e:
                 logger.warning(f"Invalid exclusion pattern '{exc}': {e}")
 
+        self._keyword_regex = self._combine_patterns(self.keyword_patterns, flags)
+        self._exclusion_regex = self._combine_patterns(self.exclusion_patterns, flags)
+
+    @staticmethod
+    def _combine_patterns(
+        patterns: List[re.Pattern], flags: int
+    ) -> Optional[re.Pattern]:
+        """
+        Join patterns into a single alternation regex.
+
+        Case variants that are identical under IGNORECASE are dropped, and
+        longer patterns come first so the longest keyword wins at a position.
+
+        Args:
+            patterns: Compiled keyword patterns
+            flags: Regex flags the patterns were compiled with
+
+        Returns:
+            Combined pattern, or None if there are no patterns
+        """
+        sources = {p.pattern for p in patterns}
+        if flags & re.IGNORECASE:
+            sources = {s.lower(): s for s in sorted(sources)}.values()
+        if not sources:
+            return None
+
+        ordered = sorted(sources, key=lambda s: (-len(s), s))
+        return re.compile("|".join(f"(?:{s})" for s in ordered), flags)
+
     def matches(self, text: str) -> bool:
         """
         Check if text matches any keyword.
@@ -265,16 +299,11 @@ class KeywordMatcher:
             return False
 
         # Check exclusions first
-        for pattern in self.exclusion_patterns:
-            if pattern.search(text):
-                return False
+        if self._exclusion_regex is not None and self._exclusion_regex.search(text):
+            return False
 
         # Check keywords
-        for pattern in self.keyword_patterns:
-            if pattern.search(text):
-                return True
-
-        return False
+        return self._keyword_regex is not None and bool(self._keyword_regex.search(text))
 
     def get_matching_keyword(self, text: str) -> Optional[str]:
         """
@@ -290,22 +319,22 @@ class KeywordMatcher:
             return None
 
         # Check exclusions first
-        for pattern in self.exclusion_patterns:
-            if pattern.search(text):
-                return None
-
-        # Find first matching keyword
-        for pattern in self.keyword_patterns:
-            match = pattern.search(text)
-            if match:
-                return match.group()
+        if self._exclusion_regex is not None and self._exclusion_regex.search(text):
+            return None
 
-        return None
+        # Find the leftmost matching keyword
+        if self._keyword_regex is None:
+            return None
+        match = self._keyword_regex.search(text)
+        return match.group() if match else None
 
     def matches_any_field(self, fields: List[Optional[str]]) -> bool:
         """
         Check if any of the given fields match a keyword.
 
+        Callers that also need the keyword should call get_first_match()
+        alone instead of both, since it returns None when nothing matches.
+
         Args:
             fields: List of text fields to check
 
@@ -317,15 +346,19 @@ class KeywordMatcher:
                 return True
         return False
 
-    def get_first_match(self, fields: List[Optional[str]]) -> Optional[str]:
+    def get_first_match(self, fields: Iterable[Optional[str]]) -> Optional[str]:
         """
         Get the first matching keyword from any field.
 
+        Fields hit by an exclusion are skipped, so the result is not None
+        exactly when matches_any_field() would return True.
+
         Args:
-            fields: List of text fields to check
+            fields: Text fields to check (any iterable; consumed lazily
+                    and only up to the first matching field)
 
         Returns:
-            First matching keyword or None
+            First matching keyword, or None if no field matches
         """
         for field in fields:
             if field:
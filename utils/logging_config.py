@@ -2,11 +2,12 @@
 Logging configuration for Tender Scraper System.
 
 Provides rotating file handler with console output for debugging.
+File output is buffered in memory and written in batches.
 """
 
 import logging
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
@@ -17,6 +18,7 @@ def setup_logging(
     max_bytes: int = 10 * 1024 * 1024,  # 10 MB
     backup_count: int = 5,
     console_output: bool = True,
+    buffer_capacity: int = 1000,
 ) -> logging.Logger:
     """
     Configure logging for the application.
@@ -27,6 +29,9 @@ def setup_logging(
         max_bytes: Maximum size of log file before rotation
         backup_count: Number of backup files to keep
         console_output: Whether to also output to console
+        buffer_capacity: Number of records to buffer before writing to the
+                         log file (ERROR and above are written at once;
+                         0 disables buffering)
 
     Returns:
         Configured root logger
@@ -48,7 +53,9 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
 
-    # Remove existing handlers
+    # Remove existing handlers (writing out anything they still buffer)
+    for handler in root_logger.handlers:
+        handler.flush()
     root_logger.handlers = []
 
     # Add rotating file handler
@@ -60,7 +67,19 @@ def setup_logging(
     )
     file_handler.setLevel(numeric_level)
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
+
+    if buffer_capacity > 0:
+        # Write records in batches instead of one write per record
+        memory_handler = MemoryHandler(
+            capacity=buffer_capacity,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True,
+        )
+        memory_handler.setLevel(numeric_level)
+        root_logger.addHandler(memory_handler)
+    else:
+        root_logger.addHandler(file_handler)
 
     # Add console handler if requested
     if console_output:
@@ -72,6 +91,12 @@ def setup_logging(
     return root_logger
 
 
+def flush_logging() -> None:
+    """Write out log records buffered by the root logger's handlers."""
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger with the given name.